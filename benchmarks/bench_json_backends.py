@@ -0,0 +1,81 @@
+"""
+Compare parse time and peak RSS of the JSON backends on synthetic manifests.
+Every load runs in a fresh interpreter so that peak RSS is not shared.
+
+    python -m benchmarks.bench_json_backends 1000 10000 50000
+"""
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from benchmarks.synthetic import make_manifest
+from dbt_checkpoint.json_backends import JSON_BACKENDS
+
+# ru_maxrss is inherited from the parent process on Linux, VmHWM is not.
+MEASURE = """
+import re, sys, time
+from pathlib import Path
+from dbt_checkpoint.json_backends import JSON_BACKENDS
+def peak_rss_kb():
+    status = Path("/proc/self/status").read_text()
+    return int(re.search(r"VmHWM:\\s+(\\d+)", status).group(1))
+loader = JSON_BACKENDS[sys.argv[1]]()
+path = Path(sys.argv[2])
+before = peak_rss_kb()
+start = time.perf_counter()
+content = loader(path)
+elapsed = time.perf_counter() - start
+print(elapsed, peak_rss_kb() - before)
+"""
+
+
+def measure(backend: str, path: Path) -> Optional[Tuple[float, float]]:
+    """
+    Seconds and peak RSS growth in MB (Linux only), None if `backend`
+    is missing.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE, backend, str(path)],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        if "ModuleNotFoundError" in result.stderr:
+            return None
+        raise RuntimeError(result.stderr)
+    elapsed, rss_kb = result.stdout.split()
+    return float(elapsed), int(rss_kb) / 1024
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    sizes = [int(size) for size in (argv or ["1000", "10000", "50000"])]
+    print(
+        f"{'nodes':>8} {'file MB':>8} {'backend':>9} {'parse':>8} {'peak RSS MB':>12}"
+    )
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "manifest.json"
+            path.write_text(json.dumps(make_manifest(size)), encoding="utf-8")
+            file_mb = path.stat().st_size / (1 << 20)
+            for backend in JSON_BACKENDS:
+                measured = measure(backend, path)
+                if measured is None:
+                    print(
+                        f"{size:>8} {file_mb:>8.0f} {backend:>9} {'not installed':>21}"
+                    )
+                    continue
+                elapsed, rss_mb = measured
+                print(
+                    f"{size:>8} {file_mb:>8.0f} {backend:>9}"
+                    f" {elapsed:>7.2f}s {rss_mb:>12.0f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main(sys.argv[1:]))
@@ -0,0 +1,48 @@
+"""
+Compare a cold `get_json` parse of manifest.json with a warm load from the
+binary manifest cache.
+
+    python -m benchmarks.bench_manifest_cache 1000 10000 50000
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from benchmarks.synthetic import write_manifest
+from dbt_checkpoint.manifest_cache import get_cached_json
+from dbt_checkpoint.utils import get_json
+
+
+def best_of(func: Callable[[], object], repeat: int = 3) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    sizes = [int(size) for size in (argv or ["1000", "10000", "50000"])]
+    print(f"{'nodes':>8} {'MB':>8} {'get_json':>10} {'warm cache':>11} {'speedup':>8}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest_path = str(write_manifest(Path(tmp), size))
+            megabytes = Path(manifest_path).stat().st_size / 1e6
+            cold = best_of(lambda: get_json(manifest_path))
+            get_cached_json(manifest_path, get_json)  # populate
+            warm = best_of(lambda: get_cached_json(manifest_path, get_json))
+            print(
+                f"{size:>8} {megabytes:>8.1f} {cold:>9.3f}s {warm:>10.3f}s "
+                f"{cold / warm:>7.1f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main(sys.argv[1:]))
@@ -0,0 +1,62 @@
+"""
+Compare peak memory and time of loading the whole manifest with loading
+only the parts `check-model-tags` reads.
+
+    python -m benchmarks.bench_manifest_loader 5000 20000 50000
+"""
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from benchmarks.synthetic import make_manifest
+from dbt_checkpoint.check_model_tags import MANIFEST_SELECTION
+from dbt_checkpoint.manifest_loader import load_json_selection
+from dbt_checkpoint.utils import get_json
+
+
+def measure(load: Callable[[], Any]) -> Tuple[float, float]:
+    """Seconds and peak MB of `load`, time measured without tracing."""
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        load()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak / (1 << 20)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    sizes = [int(size) for size in (argv or ["5000", "20000", "50000"])]
+    print(
+        f"{'models':>8} {'file MB':>8} {'full':>8} {'full MB':>8}"
+        f" {'selected':>9} {'selected MB':>12}"
+    )
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "manifest.json"
+            path.write_text(json.dumps(make_manifest(size)), encoding="utf-8")
+            file_mb = path.stat().st_size / (1 << 20)
+            full, full_mb = measure(lambda: get_json(str(path)))
+            selected, selected_mb = measure(
+                lambda: load_json_selection(str(path), MANIFEST_SELECTION)
+            )
+            print(
+                f"{size:>8} {file_mb:>8.0f} {full:>7.2f}s {full_mb:>8.0f}"
+                f" {selected:>8.2f}s {selected_mb:>12.0f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main(sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""
+Compare parsing property files once per schema getter with yaml.safe_load,
+as hooks used to, with the shared property file index.
+
+    python -m benchmarks.bench_property_files 200 1000 2000
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import yaml
+
+from benchmarks.synthetic import write_property_files
+from dbt_checkpoint.property_files import PropertyFileIndex
+
+# Sections read by get_model_schemas, get_macro_schemas, get_source_schemas
+# and get_exposures.
+GETTER_SECTIONS = ("models", "macros", "sources", "exposures")
+
+
+def parse_per_getter(paths: List[Path]) -> None:
+    for section in GETTER_SECTIONS:
+        for path in paths:
+            with open(path) as file:
+                (yaml.safe_load(file) or {}).get(section, [])
+
+
+def parse_with_index(index: PropertyFileIndex, paths: List[Path]) -> None:
+    for section in GETTER_SECTIONS:
+        for path in paths:
+            getattr(index.get(path), section)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    sizes = [int(size) for size in (argv or ["200", "1000", "2000"])]
+    print(f"{'files':>8} {'per getter':>11} {'index':>8} {'warm index':>11}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = write_property_files(Path(tmp), size)
+            start = time.perf_counter()
+            parse_per_getter(paths)
+            per_getter = time.perf_counter() - start
+            index = PropertyFileIndex()
+            start = time.perf_counter()
+            parse_with_index(index, paths)
+            cold = time.perf_counter() - start
+            # e.g. the next hook run by `dbt-checkpoint run`
+            start = time.perf_counter()
+            parse_with_index(index, paths)
+            warm = time.perf_counter() - start
+            print(f"{size:>8} {per_getter:>10.2f}s {cold:>7.2f}s {warm:>10.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main(sys.argv[1:]))
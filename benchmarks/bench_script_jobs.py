@@ -0,0 +1,57 @@
+"""
+Time check-script-has-no-table-name on generated models with a growing
+number of processes. The result cache is disabled, every file is checked.
+
+    python -m benchmarks.bench_script_jobs 2000 1 2 4
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from benchmarks.synthetic import make_sql
+from benchmarks.synthetic import write_manifest
+from dbt_checkpoint.check_script_has_no_table_name import main as check_main
+
+# CTEs of every generated model, about 10kB of SQL.
+N_CTES = 20
+
+
+def write_project(directory: Path, n_files: int) -> List[str]:
+    models = directory / "models"
+    models.mkdir()
+    paths = []
+    for index in range(n_files):
+        path = models / f"model_{index}.sql"
+        path.write_text(make_sql(N_CTES), encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    n_files, *jobs = [int(arg) for arg in (argv or ["2000", "1", "2", "4"])]
+    print(f"{os.cpu_count()} CPUs, {n_files} files")
+    print(f"{'jobs':>6} {'time':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        paths = write_project(directory, n_files)
+        manifest = write_manifest(directory, 100)
+        config = directory / ".dbt-checkpoint.yaml"
+        config.write_text("version: 1\ndisable-cache: true\ndisable-tracking: true\n")
+        for n_jobs in jobs:
+            argv = [*paths, "--manifest", str(manifest), "--config", str(config)]
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                check_main([*argv, "--jobs", str(n_jobs)])
+            print(f"{n_jobs:>6} {time.perf_counter() - start:>7.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main(sys.argv[1:]))
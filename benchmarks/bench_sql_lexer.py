@@ -0,0 +1,55 @@
+"""
+Compare the regex passes check-script-has-no-table-name used to clean and
+split SQL with the single-pass lexer, on generated models.
+
+    python -m benchmarks.bench_sql_lexer 100 400 1000
+"""
+import re
+import sys
+import time
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from benchmarks.synthetic import make_sql
+from dbt_checkpoint.check_script_has_no_table_name import find_table_names
+from dbt_checkpoint.sql_lexer import tokenize
+
+# Comment pattern before the lexer, it backtracks on every character.
+LEGACY_REGEX_COMMENTS = r"(?<=(\/\*|\{#))((.|[\r\n])+?)(?=(\*+\/|#\}))|[ \t]*--.*"
+
+
+def legacy_split(sql: str) -> List[str]:
+    sql = re.sub(LEGACY_REGEX_COMMENTS, "", sql)
+    sql = re.sub(r"'(?:[^']|'')*'", "''", sql)
+    sql = re.sub(r"([\(\)])", r" \1 ", sql)
+    sql = re.sub(r"([\{\}])", r" \1 ", sql)
+    sql = sql.replace("{{", "{{ ").replace("}}", " }}")
+    return [word.lower() for word in re.split(r"[\s]+", sql)]
+
+
+def best_of(func: Callable[[], object], repeat: int = 3) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    sizes = [int(size) for size in (argv or ["100", "400", "1000"])]
+    print(f"{'lines':>8} {'regex passes':>13} {'lexer':>8} {'lexer+check':>12}")
+    for size in sizes:
+        sql = make_sql(size)
+        lines = sql.count("\n")
+        legacy = best_of(lambda: legacy_split(sql))
+        lexer = best_of(lambda: tokenize(sql))
+        check = best_of(lambda: find_table_names(tokenize(sql)))
+        print(f"{lines:>8} {legacy:>12.3f}s {lexer:>7.3f}s {check:>11.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main(sys.argv[1:]))
@@ -0,0 +1,74 @@
+"""
+Compare rewriting a property file once per replaced column, as
+unify-column-description used to, with one rewrite per file.
+
+    python -m benchmarks.bench_unify_column_description 100 500 1000
+"""
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import yaml
+
+from benchmarks.synthetic import write_property_files
+from dbt_checkpoint.check_column_desc_are_same import get_grouped
+from dbt_checkpoint.unify_column_description import replace_column_desc
+
+# One file in OUTDATED_EVERY has outdated column descriptions.
+OUTDATED_EVERY = 4
+
+
+def write_project(directory: Path, n_files: int) -> List[str]:
+    paths = write_property_files(directory, n_files)
+    for path in paths[::OUTDATED_EVERY]:
+        content = path.read_text(encoding="utf-8")
+        path.write_text(content.replace("description: Column", "description: Col"))
+    return [str(path) for path in paths]
+
+
+def replace_per_column(paths: Sequence[str], ignore: None) -> None:
+    for name, grps in get_grouped(paths, ignore):
+        groups = list(grps)
+        top_desc = Counter(group.description for group in groups).most_common(1)[0][0]
+        for group in groups:
+            if group.description != top_desc:
+                file = yaml.safe_load(group.file.open())
+                for model in file.get("models", []):
+                    for column in model.get("columns", []):
+                        if name == column.get("name"):
+                            column["description"] = top_desc
+                with open(group.file, "w") as f:
+                    yaml.dump(
+                        file,
+                        f,
+                        default_flow_style=False,
+                        sort_keys=False,
+                        allow_unicode=True,
+                    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    sizes = [int(size) for size in (argv or ["100", "500", "1000"])]
+    print(f"{'files':>8} {'per column':>11} {'per file':>9}")
+    for size in sizes:
+        timings = []
+        for replace in (replace_per_column, replace_column_desc):
+            with tempfile.TemporaryDirectory() as tmp:
+                paths = write_project(Path(tmp), size)
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    replace(paths, None)
+                timings.append(time.perf_counter() - start)
+        print(f"{size:>8} {timings[0]:>10.2f}s {timings[1]:>8.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main(sys.argv[1:]))
@@ -0,0 +1,286 @@
+"""
+Run the core function of the hooks on synthetic projects and report their
+wall time and peak memory. Results can be saved as a JSON baseline, later
+runs fail when a case got slower or bigger than the baseline allows.
+
+    python -m benchmarks.suite --sizes 1000 10000 50000 100000
+    python -m benchmarks.suite --save-baseline
+    python -m benchmarks.suite --check --threshold 0.25
+
+Timings depend on the machine, save the baseline where the suite runs,
+e.g. on the CI runner. The 50k and 100k tiers are run on demand: at 100k
+nodes a run takes over half an hour and the traced manifest parse alone
+needs several GB of memory.
+"""
+import argparse
+import contextlib
+import io
+import json
+import operator
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from benchmarks.synthetic import Project
+from benchmarks.synthetic import write_project
+from dbt_checkpoint import catalog_index
+from dbt_checkpoint import check_column_desc_are_same
+from dbt_checkpoint import check_model_has_all_columns
+from dbt_checkpoint import check_model_has_tests
+from dbt_checkpoint import check_model_has_tests_by_name
+from dbt_checkpoint import check_model_lineage_depth
+from dbt_checkpoint import check_model_parents_and_childs
+from dbt_checkpoint import check_model_transitive_parents_and_childs
+from dbt_checkpoint import check_script_has_no_table_name
+from dbt_checkpoint import check_script_ref_and_source
+from dbt_checkpoint import check_source_has_tests
+from dbt_checkpoint import manifest_index
+from dbt_checkpoint import property_files
+from dbt_checkpoint.file_index import reset_file_indexes
+from dbt_checkpoint.utils import get_json
+from dbt_checkpoint.utils import get_missing_file_paths
+
+# Sizes run by default and by --check, see above for the larger tiers.
+DEFAULT_SIZES = (1000, 10000)
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+# A case regresses when it is this much slower or bigger than its baseline...
+DEFAULT_THRESHOLD = 0.25
+# ...and by more than these, timer noise dominates the fastest cases.
+MIN_SECONDS_DELTA = 0.01
+MIN_PEAK_MB_DELTA = 1.0
+
+
+@dataclass
+class Artifacts:
+    project: Project
+    manifest: Dict[str, Any]
+    catalog: Dict[str, Any]
+
+
+@dataclass
+class Measure:
+    seconds: float
+    peak_mb: float
+
+
+def model_tests(artifacts: Artifacts) -> Any:
+    return check_model_has_tests.check_test_cnt(
+        artifacts.project.sql_paths, artifacts.manifest, 2, ""
+    )
+
+
+def model_tests_by_name(artifacts: Artifacts) -> Any:
+    return check_model_has_tests_by_name.check_test_cnt(
+        artifacts.project.sql_paths, artifacts.manifest, {"unique": 1}, ""
+    )
+
+
+def source_tests(artifacts: Artifacts) -> Any:
+    return check_source_has_tests.check_test_cnt(
+        artifacts.project.yml_paths, artifacts.manifest, 1
+    )
+
+
+def column_desc_are_same(artifacts: Artifacts) -> Any:
+    return check_column_desc_are_same.check_column_desc(
+        artifacts.project.yml_paths, None
+    )
+
+
+def model_has_all_columns(artifacts: Artifacts) -> Any:
+    return check_model_has_all_columns.check_model_columns(
+        artifacts.project.sql_paths, artifacts.manifest, artifacts.catalog, ""
+    )
+
+
+def model_parents_and_childs(artifacts: Artifacts) -> Any:
+    return check_model_parents_and_childs.check_child_parent_cnt(
+        artifacts.project.sql_paths,
+        artifacts.manifest,
+        [
+            {"operator": operator.lt, "type": "min", "dep": "childs", "cnt": 1},
+            {"operator": operator.gt, "type": "max", "dep": "parents", "cnt": 3},
+        ],
+    )
+
+
+def model_transitive_parents_and_childs(artifacts: Artifacts) -> Any:
+    return check_model_transitive_parents_and_childs.check_transitive_cnt(
+        artifacts.project.sql_paths, artifacts.manifest, 100, 100
+    )
+
+
+def model_lineage_depth(artifacts: Artifacts) -> Any:
+    return check_model_lineage_depth.check_lineage_depth(
+        artifacts.project.sql_paths, artifacts.manifest, 10
+    )
+
+
+def script_table_names(artifacts: Artifacts) -> Any:
+    for path in artifacts.project.sql_paths:
+        check_script_has_no_table_name.has_table_name(Path(path).read_text(), path)
+
+
+def script_ref_and_source(artifacts: Artifacts) -> Any:
+    return check_script_ref_and_source.check_refs_sources(
+        artifacts.project.sql_paths, artifacts.manifest
+    )
+
+
+def missing_file_paths(artifacts: Artifacts) -> Any:
+    return get_missing_file_paths(artifacts.project.sql_paths, artifacts.manifest)
+
+
+def load_manifest(artifacts: Artifacts) -> Any:
+    return get_json(str(artifacts.project.manifest_path))
+
+
+CASES: Dict[str, Callable[[Artifacts], Any]] = {
+    "check_model_has_tests": model_tests,
+    "check_model_has_tests_by_name": model_tests_by_name,
+    "check_source_has_tests": source_tests,
+    "check_column_desc_are_same": column_desc_are_same,
+    "check_model_has_all_columns": model_has_all_columns,
+    "check_model_parents_and_childs": model_parents_and_childs,
+    "check_model_transitive_parents_and_childs": model_transitive_parents_and_childs,
+    "check_model_lineage_depth": model_lineage_depth,
+    "has_table_name": script_table_names,
+    "check_script_ref_and_source": script_ref_and_source,
+    "get_missing_file_paths": missing_file_paths,
+    "get_json_manifest": load_manifest,
+}
+
+
+def reset_caches() -> None:
+    """Forget indexes and parsed files, every case runs as a fresh hook."""
+    manifest_index._INDEX_CACHE.clear()
+    catalog_index._INDEX_CACHE.clear()
+    property_files._PROPERTY_FILE_INDEX.files.clear()
+    reset_file_indexes()
+
+
+def measure(case: Callable[[Artifacts], Any], artifacts: Artifacts) -> Measure:
+    """Best wall time of 3 runs, peak memory of a separate traced run."""
+    seconds = float("inf")
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(3):
+            reset_caches()
+            start = time.perf_counter()
+            case(artifacts)
+            seconds = min(seconds, time.perf_counter() - start)
+        reset_caches()
+        tracemalloc.start()
+        try:
+            case(artifacts)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return Measure(seconds=seconds, peak_mb=peak / 1e6)
+
+
+def run_suite(
+    sizes: Sequence[int], cases: Sequence[str]
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """case -> size -> {"seconds", "peak_mb"}"""
+    results: Dict[str, Dict[str, Dict[str, float]]] = {case: {} for case in cases}
+    cwd = os.getcwd()
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            project = write_project(Path(tmp), size)
+            # Hooks get paths relative to the root of the repository.
+            os.chdir(tmp)
+            try:
+                artifacts = Artifacts(
+                    project=project,
+                    manifest=get_json(str(project.manifest_path)),
+                    catalog=get_json(str(project.catalog_path)),
+                )
+                for case in cases:
+                    result = measure(CASES[case], artifacts)
+                    results[case][str(size)] = {
+                        "seconds": round(result.seconds, 4),
+                        "peak_mb": round(result.peak_mb, 2),
+                    }
+                    print(
+                        f"{case:<42} {size:>8} {result.seconds:>9.3f}s "
+                        f"{result.peak_mb:>9.1f}MB"
+                    )
+            finally:
+                os.chdir(cwd)
+    return results
+
+
+def get_regressions(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    threshold: float,
+) -> List[str]:
+    """Cases of `results` slower or bigger than `baseline` allows."""
+    min_deltas = {"seconds": MIN_SECONDS_DELTA, "peak_mb": MIN_PEAK_MB_DELTA}
+    regressions = []
+    for case, sizes in results.items():
+        for size, result in sizes.items():
+            expected = baseline.get(case, {}).get(size)
+            if expected is None:
+                continue
+            for metric, min_delta in min_deltas.items():
+                value, reference = result[metric], expected[metric]
+                if (
+                    value > reference * (1 + threshold)
+                    and value - reference > min_delta
+                ):
+                    regressions.append(
+                        f"{case} ({size} nodes): {metric} {value} > {reference} "
+                        f"+{threshold:.0%}"
+                    )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=None)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Write the results to the baseline, merged with other sizes.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with 1 when a case regressed over the baseline.",
+    )
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    print(f"{'case':<42} {'nodes':>8} {'time':>10} {'peak':>11}")
+    results = run_suite(args.sizes, args.cases or list(CASES))
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    if args.save_baseline:
+        for case, sizes in results.items():
+            baseline.setdefault(case, {}).update(sizes)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline}")
+    if args.check:
+        regressions = get_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            return 1
+        print("No regression over the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main(sys.argv[1:]))
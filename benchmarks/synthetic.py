@@ -0,0 +1,369 @@
+"""Synthetic dbt artifacts used by the benchmarks."""
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+# Share of the models most other models select from (dimensions, calendar...).
+HUB_SHARE = 0.02
+# Models usually select from the previous layers, not from any model.
+LAYER_WINDOW = 500
+# Generic tests of the models, the first one is on every model.
+MODEL_TESTS = ("not_null", "unique", "accepted_values", "relationships")
+
+
+def get_parents(rnd: random.Random, model_ids: List[str]) -> List[str]:
+    """1 to 4 parents, a third of them hubs, the others from recent layers."""
+    n_hubs = max(1, int(len(model_ids) * HUB_SHARE))
+    parents = set()
+    for _ in range(rnd.randint(1, min(4, len(model_ids)))):
+        if rnd.random() < 0.3:
+            parents.add(model_ids[rnd.randrange(n_hubs)])
+        else:
+            start = max(0, len(model_ids) - LAYER_WINDOW)
+            parents.add(model_ids[rnd.randrange(start, len(model_ids))])
+    return sorted(parents)
+
+
+def make_test(
+    test_id: str, test_name: Optional[str], column: str, parents: List[str]
+) -> Dict[str, Any]:
+    """A generic test, or a singular (data) test without `test_name`."""
+    test: Dict[str, Any] = {
+        "unique_id": test_id,
+        "resource_type": "test",
+        "name": test_id.split(".")[2],
+        "tags": ["data_quality"] if test_name == "relationships" else [],
+        "config": {"materialized": "test", "enabled": True},
+        "depends_on": {"nodes": parents, "macros": []},
+    }
+    if test_name:
+        test["test_metadata"] = {"name": test_name, "kwargs": {"column_name": column}}
+    return test
+
+
+def make_manifest(n_nodes: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    `n_nodes` models with their tests and `n_nodes / 10` sources. Lineage
+    has a few hub models with a large fan-out, the other models select
+    from 1 to 4 models of the previous layers.
+    """
+    rnd = random.Random(seed)
+    nodes: Dict[str, Any] = {}
+    sources: Dict[str, Any] = {}
+    child_map: Dict[str, Any] = {}
+    parent_map: Dict[str, Any] = {}
+
+    def add_test(test: Dict[str, Any]) -> None:
+        test_id = test["unique_id"]
+        nodes[test_id] = test
+        parent_map[test_id] = test["depends_on"]["nodes"]
+        child_map[test_id] = []
+        for parent in parent_map[test_id]:
+            child_map[parent].append(test_id)
+
+    n_sources = max(1, n_nodes // 10)
+    for i in range(n_sources):
+        source_id = f"source.proj.src_{i % 20}.table_{i}"
+        sources[source_id] = {
+            "unique_id": source_id,
+            "resource_type": "source",
+            "source_name": f"src_{i % 20}",
+            "name": f"table_{i}",
+            "database": "raw",
+            "schema": f"src_{i % 20}",
+            "identifier": f"table_{i}",
+            "path": f"models/staging/src_{i % 20}.yml",
+            "original_file_path": f"models/staging/src_{i % 20}.yml",
+            "description": "",
+            "columns": {},
+        }
+        child_map[source_id] = []
+    source_ids = list(sources)
+    for i, source_id in enumerate(source_ids[::2]):
+        add_test(
+            make_test(
+                f"test.proj.source_not_null_table_{2 * i}_id.{i:010x}",
+                "not_null",
+                "id",
+                [source_id],
+            )
+        )
+    model_ids: List[str] = []
+    for i in range(n_nodes):
+        model_id = f"model.proj.model_{i}"
+        folder = f"models/area_{i % 50}"
+        if i < n_sources:
+            parents = [source_ids[i]]
+        else:
+            parents = get_parents(rnd, model_ids)
+        nodes[model_id] = {
+            "unique_id": model_id,
+            "resource_type": "model",
+            "name": f"model_{i}",
+            "package_name": "proj",
+            "path": f"area_{i % 50}/model_{i}.sql",
+            "original_file_path": f"{folder}/model_{i}.sql",
+            "patch_path": f"proj://{folder}/schema.yml",
+            "database": "analytics",
+            "schema": f"area_{i % 50}",
+            "alias": f"model_{i}",
+            "description": f"Model number {i}",
+            "tags": ["nightly"] if i % 3 else [],
+            "meta": {"owner": "data"},
+            "config": {"materialized": "table", "enabled": True, "tags": []},
+            "columns": {
+                f"col_{j}": {"name": f"col_{j}", "description": f"Column {j}"}
+                for j in range(8)
+            },
+            "raw_code": "select *\nfrom {{ ref('parent') }}\n" * 20,
+            "compiled_code": "select *\nfrom analytics.area.parent\n" * 20,
+            "depends_on": {"nodes": parents, "macros": []},
+        }
+        model_ids.append(model_id)
+        parent_map[model_id] = parents
+        child_map[model_id] = []
+        for parent in parents:
+            child_map[parent].append(model_id)
+        # 1 to 4 generic tests, relationships tests depend on two models
+        for test_name in MODEL_TESTS[: 1 + i % len(MODEL_TESTS)]:
+            test_parents = [model_id]
+            if test_name == "relationships" and parents[0] in nodes:
+                test_parents.append(parents[0])
+            add_test(
+                make_test(
+                    f"test.proj.{test_name}_model_{i}_col_0.{i:010x}",
+                    test_name,
+                    "col_0",
+                    test_parents,
+                )
+            )
+        if i % 10 == 0:
+            add_test(
+                make_test(f"test.proj.assert_model_{i}_is_fresh", None, "", [model_id])
+            )
+    return {
+        "metadata": {"dbt_version": "1.7.0", "user_id": "benchmark"},
+        "nodes": nodes,
+        "sources": sources,
+        "macros": {},
+        "docs": {},
+        "exposures": {},
+        "metrics": {},
+        "disabled": {},
+        "child_map": child_map,
+        "parent_map": parent_map,
+    }
+
+
+def make_catalog(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """Catalog of the models and sources of `manifest`, 8 columns each."""
+
+    def get_columns(n_columns: int) -> Dict[str, Any]:
+        return {
+            f"COL_{j}": {"type": "TEXT" if j % 2 else "INTEGER", "index": j + 1}
+            for j in range(n_columns)
+        }
+
+    nodes = {
+        key: {"metadata": {"type": "BASE TABLE"}, "columns": get_columns(8)}
+        for key in manifest["nodes"]
+        if key.startswith("model.")
+    }
+    sources = {
+        key: {"metadata": {"type": "BASE TABLE"}, "columns": get_columns(4)}
+        for key in manifest["sources"]
+    }
+    return {
+        "metadata": {"dbt_version": "1.7.0"},
+        "nodes": nodes,
+        "sources": sources,
+        "errors": None,
+    }
+
+
+def write_manifest(directory: Path, n_nodes: int) -> Path:
+    target = directory / "target"
+    target.mkdir(parents=True, exist_ok=True)
+    manifest_path = target / "manifest.json"
+    manifest_path.write_text(json.dumps(make_manifest(n_nodes)), encoding="utf-8")
+    return manifest_path
+
+
+def make_property_file(index: int, n_models: int = 5) -> str:
+    """A `schema.yml` with models, a source and an exposure."""
+    lines = ["version: 2", "", "models:"]
+    for i in range(n_models):
+        lines += [
+            f"  - name: model_{index}_{i}",
+            f"    description: Model {i} of file {index}",
+            "    meta:",
+            "      owner: data",
+            "    columns:",
+        ]
+        for j in range(8):
+            lines += [
+                f"      - name: col_{j}",
+                f"        description: Column {j}",
+                "        tests:",
+                "          - not_null",
+            ]
+    lines += [
+        "",
+        "sources:",
+        f"  - name: src_{index}",
+        "    tables:",
+        f"      - name: table_{index}",
+        "        loaded_at_field: loaded_at",
+        "",
+        "exposures:",
+        f"  - name: dashboard_{index}",
+        "    type: dashboard",
+        "    owner:",
+        "      email: data@example.com",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def write_property_files(directory: Path, n_files: int) -> List[Path]:
+    paths = []
+    for index in range(n_files):
+        folder = directory / "models" / f"area_{index % 50}"
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"schema_{index}.yml"
+        path.write_text(make_property_file(index), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def make_sql(n_ctes: int) -> str:
+    """A dbt model with `n_ctes` CTEs, comments, strings and Jinja."""
+    parts = [
+        "{{ config(materialized='table') }}",
+        "{# model generated for the benchmarks #}",
+        "with",
+    ]
+    for i in range(n_ctes):
+        cte = f"""cte_{i} as (
+    /* cte {i}: joins the source
+       with the previous cte */
+    select
+        o.id,
+        o.amount * 100 as cents,  -- stored in cents
+        case when o.status = 'from shipped' then 1 else 0 end as is_shipped,
+        extract(year from o.created_at) as created_year
+    from {{{{ source('raw', 'orders_{i}') }}}} as o
+    left join {"cte_%d" % (i - 1) if i else "{{ ref('customers') }}"} as c
+        on o.customer_id = c.id
+    where o.updated_at is distinct from o.created_at
+),"""
+        parts.append(cte)
+    parts.append(f"final as (select * from cte_{n_ctes - 1})")
+    parts.append("select * from final")
+    return "\n".join(parts) + "\n"
+
+
+@dataclass
+class Project:
+    """Files of a project written by `write_project`, paths relative to it."""
+
+    directory: Path
+    manifest_path: Path
+    catalog_path: Path
+    sql_paths: List[str]
+    yml_paths: List[str]
+
+
+def make_model_properties(models: List[Dict[str, Any]], area: int) -> str:
+    """`schema.yml` of the models of an area, some disagree on descriptions."""
+    lines = ["version: 2", "", "models:"]
+    for model in models:
+        lines += [
+            f"  - name: {model['name']}",
+            f"    description: {model['description']}",
+            "    columns:",
+        ]
+        for j, column in enumerate(model["columns"]):
+            description = f"Col {j}" if area % 10 == 0 else f"Column {j}"
+            lines += [f"      - name: {column}", f"        description: {description}"]
+            if j == 0:
+                lines += ["        tests:", "          - not_null"]
+    return "\n".join(lines) + "\n"
+
+
+def make_source_properties(source_name: str, tables: List[Dict[str, Any]]) -> str:
+    lines = ["version: 2", "", "sources:", f"  - name: {source_name}", "    tables:"]
+    for table in tables:
+        lines += [
+            f"      - name: {table['name']}",
+            "        columns:",
+            "          - name: col_0",
+            "            description: Identifier",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def make_model_sql(model: Dict[str, Any], manifest: Dict[str, Any]) -> str:
+    """Select from the parents of `model`, one in ten also reads a raw table."""
+    parents = []
+    for parent in model["depends_on"]["nodes"]:
+        if parent.startswith("source."):
+            source = manifest["sources"][parent]
+            parents.append(
+                f"{{{{ source('{source['source_name']}', '{source['name']}') }}}}"
+            )
+        else:
+            parents.append(f"{{{{ ref('{parent.split('.')[-1]}') }}}}")
+    lines = ["select p0.*", f"from {parents[0]} as p0"]
+    for i, parent in enumerate(parents[1:], start=1):
+        lines.append(f"left join {parent} as p{i} on p0.col_0 = p{i}.col_0")
+    if int(model["name"].split("_")[-1]) % 10 == 0:
+        lines.append("left join raw.legacy.lookup as l on p0.col_1 = l.id")
+    return "\n".join(lines) + "\n"
+
+
+def write_project(directory: Path, n_nodes: int) -> Project:
+    """A dbt project of `n_nodes` models: artifacts, SQL and property files."""
+    manifest = make_manifest(n_nodes)
+    target = directory / "target"
+    target.mkdir(parents=True, exist_ok=True)
+    manifest_path = target / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+    catalog_path = target / "catalog.json"
+    catalog_path.write_text(json.dumps(make_catalog(manifest)), encoding="utf-8")
+
+    sql_paths = []
+    models_by_area: Dict[str, List[Dict[str, Any]]] = {}
+    for node in manifest["nodes"].values():
+        if node["resource_type"] != "model":
+            continue
+        path = directory / node["original_file_path"]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(make_model_sql(node, manifest), encoding="utf-8")
+        sql_paths.append(node["original_file_path"])
+        models_by_area.setdefault(str(path.parent), []).append(node)
+    yml_paths = []
+    for folder, models in models_by_area.items():
+        path = Path(folder) / "schema.yml"
+        area = int(Path(folder).name.split("_")[-1])
+        path.write_text(make_model_properties(models, area), encoding="utf-8")
+        yml_paths.append(path.relative_to(directory).as_posix())
+    tables_by_source: Dict[str, List[Dict[str, Any]]] = {}
+    for source in manifest["sources"].values():
+        tables_by_source.setdefault(source["source_name"], []).append(source)
+    for source_name, tables in tables_by_source.items():
+        path = directory / "models" / "staging" / f"{source_name}.yml"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(make_source_properties(source_name, tables), encoding="utf-8")
+        yml_paths.append(path.relative_to(directory).as_posix())
+    return Project(
+        directory=directory,
+        manifest_path=manifest_path,
+        catalog_path=catalog_path,
+        sql_paths=sql_paths,
+        yml_paths=yml_paths,
+    )
@@ -0,0 +1,153 @@
+import sys
+from collections import OrderedDict
+from functools import cached_property
+from typing import AbstractSet
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import Optional
+from typing import Tuple
+
+from dbt_checkpoint.manifest_cache import artifacts_are_shared
+
+# Number of catalogs whose index is kept around, hooks usually work with one.
+INDEX_CACHE_SIZE = 4
+
+
+class CatalogColumns:
+    """
+    Columns of a catalog node or source, in catalog order. Every attribute
+    is computed on first use and kept for later lookups.
+    """
+
+    def __init__(self, columns: Dict[str, Any], intern: bool = False):
+        self._columns = columns
+        # Lowercased names repeat across tables, interning keeps a single
+        # copy of them while the index is kept around.
+        self._intern = intern
+
+    @cached_property
+    def lower_names(self) -> Tuple[str, ...]:
+        """Lowercased keys of the columns."""
+        lower_names = map(str.lower, self._columns)
+        return tuple(map(sys.intern, lower_names) if self._intern else lower_names)
+
+    @cached_property
+    def positions(self) -> Dict[str, int]:
+        """lowercased name -> position in the tuples of this class"""
+        return dict(zip(self.lower_names, range(len(self._columns))))
+
+    @property
+    def name_set(self) -> AbstractSet[str]:
+        if self._intern:
+            return self.positions.keys()
+        # Looked up once, a set is cheaper to build than the positions.
+        return {name.lower() for name in self._columns}
+
+    @cached_property
+    def names(self) -> Tuple[str, ...]:
+        """`name` of the columns, as in the database."""
+        return tuple(column.get("name", key) for key, column in self._columns.items())
+
+    @cached_property
+    def types(self) -> Tuple[str, ...]:
+        return tuple(column.get("type") or "" for column in self._columns.values())
+
+    @cached_property
+    def ordinals(self) -> Tuple[int, ...]:
+        """`index` of the columns, their position in the table."""
+        return tuple(
+            column.get("index", position)
+            for position, column in enumerate(self._columns.values())
+        )
+
+    @cached_property
+    def _values(self) -> Tuple[Dict[str, Any], ...]:
+        return tuple(self._columns.values())
+
+    def get_type(self, lower_name: str) -> Optional[str]:
+        position = self.positions.get(lower_name)
+        if position is None:
+            return None
+        return self._values[position].get("type") or ""
+
+
+class CatalogIndex:
+    """
+    Lookups into a dbt catalog shared by the column hooks. Columns are
+    indexed the first time a node is looked up, a pre-commit run usually
+    touches a handful of the tables in the catalog. Without `reuse`, e.g.
+    for a single hook, columns are read straight from the catalog on every
+    lookup.
+    """
+
+    SECTIONS = ("nodes", "sources")
+
+    def __init__(self, catalog: Dict[str, Any], reuse: bool = True):
+        self.reuse = reuse
+        self._sections = tuple(catalog.get(key) for key in self.SECTIONS)
+        self._sizes = self._get_sizes()
+        self.nodes: Dict[str, Any] = catalog.get("nodes") or {}
+        self.sources: Dict[str, Any] = catalog.get("sources") or {}
+        # frozenset({source name, table name}) -> source id
+        self.source_ids: Dict[FrozenSet[str], str] = {}
+        for source_id in self.sources:
+            split_id = source_id.split(".")
+            self.source_ids[frozenset(split_id[-2:])] = source_id
+        # node/source id -> columns
+        self._columns: Dict[str, CatalogColumns] = {}
+
+    def _get_sizes(self) -> Tuple[int, ...]:
+        return tuple(len(section or ()) for section in self._sections)
+
+    def is_current(self, catalog: Dict[str, Any]) -> bool:
+        """Whether `catalog` was not modified since the index was built."""
+        return (
+            all(
+                catalog.get(key) is section
+                for key, section in zip(self.SECTIONS, self._sections)
+            )
+            and self._get_sizes() == self._sizes
+        )
+
+    def get_source_id(self, source_name: str, table_name: str) -> Optional[str]:
+        return self.source_ids.get(frozenset([source_name, table_name]))
+
+    def get_columns(self, unique_id: str) -> Optional[CatalogColumns]:
+        """Columns of a node or source, None when it is not in the catalog."""
+        columns = self._columns.get(unique_id)
+        if columns is None:
+            entry = self.nodes.get(unique_id) or self.sources.get(unique_id)
+            if not entry:
+                return None
+            columns = CatalogColumns(entry.get("columns") or {}, intern=self.reuse)
+            if self.reuse:
+                self._columns[unique_id] = columns
+        return columns
+
+
+_INDEX_CACHE: "OrderedDict[int, Tuple[Dict[str, Any], CatalogIndex]]" = OrderedDict()
+
+
+def get_catalog_index(catalog: Dict[str, Any]) -> CatalogIndex:
+    """
+    Return the index of `catalog`, building it on first use. The catalog
+    is kept referenced by the cache so its `id` cannot be reused.
+
+    The index is only kept when hooks share the artifacts (see
+    `dbt_checkpoint.runner` and `dbt_checkpoint.daemon`): a single hook
+    looks up every node once, indexing its columns would cost more than
+    it saves.
+    """
+    if not artifacts_are_shared():
+        return CatalogIndex(catalog, reuse=False)
+    entry = _INDEX_CACHE.get(id(catalog))
+    if entry is not None and entry[0] is catalog and entry[1].is_current(catalog):
+        _INDEX_CACHE.move_to_end(id(catalog))
+        return entry[1]
+    index = CatalogIndex(catalog)
+    _INDEX_CACHE[id(catalog)] = (catalog, index)
+    _INDEX_CACHE.move_to_end(id(catalog))
+    while len(_INDEX_CACHE) > INDEX_CACHE_SIZE:
+        _INDEX_CACHE.popitem(last=False)
+    return index
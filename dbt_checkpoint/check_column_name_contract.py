@@ -4,6 +4,7 @@ import re
 import time
 from typing import Any, Dict, Optional, Sequence
 
+from dbt_checkpoint.catalog_index import get_catalog_index
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
@@ -37,18 +38,17 @@ def check_column_name_contract(
     filenames = set(sqls.keys())
     models = get_models(manifest, filenames, include_disabled=include_disabled)
     
-    catalog_nodes = catalog.get("nodes", {})
+    catalog_index = get_catalog_index(catalog)
+    pattern_re = re.compile(pattern, re.IGNORECASE)
+    lower_dtypes = {dtype.lower() for dtype in dtypes}
 
     for model in models:
-        catalog_node = catalog_nodes.get(model.model_id, {})
-        if catalog_node:
-            for col in catalog_node.get('columns', {}).values():
-                col_name = col.get("name")
-                col_type = col.get("type")
-            
+        catalog_columns = catalog_index.get_columns(model.model_id)
+        if catalog_columns is not None:
+            for col_name, col_type in zip(catalog_columns.names, catalog_columns.types):
                 # Check all files on dtypes follow naming pattern
-                if any(col_type.lower() == dtype.lower() for dtype in dtypes):
-                    if re.match(pattern, col_name, re.IGNORECASE) is None:
+                if col_type.lower() in lower_dtypes:
+                    if pattern_re.match(col_name) is None:
                         status_code = 1
                         print(
                             f"model {red(model.model_id)}, in file {yellow(model.filename + '.sql')} \n"
@@ -57,7 +57,7 @@ def check_column_name_contract(
                         )
 
                 # Check all files with naming pattern are one of dtypes
-                elif re.match(pattern, col_name, re.IGNORECASE):
+                elif pattern_re.match(col_name):
                     status_code = 1
                     print(
                         f"model {red(model.model_id)}, in file {yellow(model.filename + '.sql')} \n"
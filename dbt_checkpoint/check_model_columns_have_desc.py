@@ -2,8 +2,10 @@ import argparse
 import itertools
 import os
 import time
-from typing import Any, Dict, Optional, Sequence, Set, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
+from dbt_checkpoint.result_cache import HookResultCache, get_result_cache
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
@@ -21,15 +23,55 @@ from dbt_checkpoint.utils import (
 )
 
 
+def get_missing_columns(items: Sequence[Union[Model, ModelSchema]]) -> Set[str]:
+    """Columns without description of the nodes and schemas of one model."""
+    missing: Optional[Set[str]] = None
+    for item in items:
+        if isinstance(item, ModelSchema):
+            missing_cols = {
+                key.get("name")
+                for key in item.schema.get("columns", [])
+                if not key.get("description")
+            }
+        else:
+            missing_cols = {
+                key
+                for key, value in item.node.get("columns", {}).items()
+                if (isinstance(value, dict) and not value.get("description"))
+            }
+        if missing:
+            if not missing_cols:
+                missing = set()  # pragma: no mutate
+            else:
+                missing = missing.union(missing_cols)
+        elif missing_cols:
+            missing = missing_cols
+    return missing or set()
+
+
+def print_missing_columns(sql: Path, columns: Set[str]) -> int:
+    if not columns:
+        return 0
+    result = "\n- ".join(list(columns))  # pragma: no mutate
+    print(
+        f"{red(sql)}: "
+        f"following columns are missing description:\n- {yellow(result)}",
+    )
+    return 1
+
+
 def check_column_desc(
     paths: Sequence[str],
     manifest: Dict[str, Any],
     exclude_pattern: str = "",
     include_disabled: bool = False,
+    result_cache: Optional[HookResultCache] = None,
 ) -> Tuple[int, Dict[str, Any]]:
-    paths = get_missing_file_paths(
-        paths, manifest, exclude_pattern=exclude_pattern
-    )
+    """
+    Models with columns missing a description. Models replayed from
+    `result_cache` are not evaluated and are left out of the returned dict.
+    """
+    paths = get_missing_file_paths(paths, manifest, exclude_pattern=exclude_pattern)
 
     status_code = 0
     ymls = get_filenames(paths, [".yml", ".yaml"])
@@ -40,44 +82,37 @@ def check_column_desc(
     models = get_models(manifest, filenames, include_disabled=include_disabled)
     # if user added schema but did not rerun the model
     schemas = get_model_schemas(list(ymls.values()), filenames)
-    missing: Dict[str, Set[str]] = {}
-
+    items: Dict[str, List[Union[Model, ModelSchema]]] = {}
     for item in itertools.chain(models, schemas):
-        missing_cols = set()  # pragma: no mutate
         if isinstance(item, ModelSchema):
-            model_name = item.model_name
-            missing_cols = {
-                key.get("name")
-                for key in item.schema.get("columns", [])
-                if not key.get("description")
-            }
-        # Model
+            items.setdefault(item.model_name, []).append(item)
         elif isinstance(item, Model):
-            model_name = item.filename
-            missing_cols = {
-                key
-                for key, value in item.node.get("columns", {}).items()
-                if (isinstance(value, dict) and not value.get("description"))
-            }
-        else:
-            continue
-        seen = missing.get(model_name)
-        if seen:
-            if not missing_cols:
-                missing[model_name] = set()  # pragma: no mutate
-            else:
-                missing[model_name] = seen.union(missing_cols)
-        elif missing_cols:
-            missing[model_name] = missing_cols
+            items.setdefault(item.filename, []).append(item)
+    missing: Dict[str, Set[str]] = {}
 
-    for model, columns in missing.items():
-        if columns:
+    # Unchanged models replay the output of a previous run
+    result_cache = result_cache or HookResultCache(None)
+    for model_name, model_items in items.items():
+        sql = sqls[model_name]
+        key = result_cache.get_file_key(
+            sql,
+            [
+                item.schema
+                if isinstance(item, ModelSchema)
+                else {"columns": item.node.get("columns")}
+                for item in model_items
+            ],
+        )
+
+        def evaluate() -> int:
+            columns = get_missing_columns(model_items)
+            if columns:
+                missing[model_name] = columns
+            return print_missing_columns(sql, columns)
+
+        if result_cache.run(key, evaluate):
             status_code = 1
-            result = "\n- ".join(list(columns))  # pragma: no mutate
-            print(
-                f"{red(sqls.get(model))}: "
-                f"following columns are missing description:\n- {yellow(result)}",
-            )
+    result_cache.save()
     return status_code, missing
 
 
@@ -99,6 +134,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         manifest=manifest,
         exclude_pattern=args.exclude,
         include_disabled=args.include_disabled,
+        result_cache=get_result_cache("check-model-columns-have-desc", args),
     )
     end_time = time.time()
     script_args = vars(args)
@@ -3,6 +3,7 @@ import os
 import time
 from typing import Any, Dict, Optional, Sequence, Set, Tuple
 
+from dbt_checkpoint.catalog_index import CatalogColumns, get_catalog_index
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
@@ -19,12 +20,12 @@ from dbt_checkpoint.utils import (
 
 
 def compare_columns(
-    catalog_columns: Dict[str, Any], model_columns: Dict[str, Any]
+    catalog_columns: CatalogColumns, model_columns: Dict[str, Any]
 ) -> Tuple[Set[str], Set[str]]:
-    catalog_cols = {col.lower() for col in catalog_columns.keys()}
+    catalog_cols = catalog_columns.name_set
     model_cols = {col.lower() for col in model_columns.keys()}
     model_only = model_cols.difference(catalog_cols)
-    catalog_only = catalog_cols.difference(model_cols)
+    catalog_only = set(catalog_cols - model_cols)
     return model_only, catalog_only
 
 
@@ -46,13 +47,13 @@ def check_model_columns(
     # get manifest nodes that pre-commit found as changed
     models = get_models(manifest, filenames, include_disabled=include_disabled)
 
-    catalog_nodes = catalog.get("nodes", {})
+    catalog_index = get_catalog_index(catalog)
 
     for model in models:
-        catalog_node = catalog_nodes.get(model.model_id, {})
-        if catalog_node:
+        catalog_columns = catalog_index.get_columns(model.model_id)
+        if catalog_columns is not None:
             model_only, catalog_only = compare_columns(
-                catalog_columns=catalog_node.get("columns", {}),
+                catalog_columns=catalog_columns,
                 model_columns=model.node.get("columns", {}),
             )
             schema_path = model.node.get("patch_path", "schema")  # pragma: no mutate
@@ -3,6 +3,7 @@ import os
 import time
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from dbt_checkpoint.catalog_index import CatalogColumns, get_catalog_index
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
@@ -19,21 +20,20 @@ from dbt_checkpoint.utils import (
 
 
 def check_required_columns(
-    catalog_columns: Dict[str, Any], required_columns: List[Dict[str, str]]
+    catalog_columns: CatalogColumns, required_columns: List[Dict[str, str]]
 ) -> Tuple[List[str], List[str]]:
     missing_columns = []
     wrong_type_columns = []
     
-    catalog_cols_lower = {col.lower(): col_info for col, col_info in catalog_columns.items()}
-    
     for req_col in required_columns:
         col_name = req_col["name"].lower()
         col_type = req_col["type"].upper()
         
-        if col_name not in catalog_cols_lower:
+        catalog_type = catalog_columns.get_type(col_name)
+        if catalog_type is None:
             missing_columns.append(f"{req_col['name']} ({req_col['type']})")
         else:
-            actual_type = catalog_cols_lower[col_name].get("type", "").upper()
+            actual_type = catalog_type.upper()
             if actual_type != col_type:
                 wrong_type_columns.append(
                     f"{req_col['name']} (expected: {req_col['type']}, actual: {actual_type})"
@@ -60,13 +60,13 @@ def check_model_columns_with_types(
 
     models = get_models(manifest, filenames, include_disabled=include_disabled)
 
-    catalog_nodes = catalog.get("nodes", {})
+    catalog_index = get_catalog_index(catalog)
 
     for model in models:
-        catalog_node = catalog_nodes.get(model.model_id, {})
-        if catalog_node:
+        catalog_columns = catalog_index.get_columns(model.model_id)
+        if catalog_columns is not None:
             missing_columns, wrong_type_columns = check_required_columns(
-                catalog_columns=catalog_node.get("columns", {}),
+                catalog_columns=catalog_columns,
                 required_columns=required_columns,
             )
             
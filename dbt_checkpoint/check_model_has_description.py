@@ -1,8 +1,10 @@
 import argparse
 import os
 import time
-from typing import Any, Dict, Optional, Sequence
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
 
+from dbt_checkpoint.result_cache import HookResultCache, get_result_cache
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
@@ -17,11 +19,24 @@ from dbt_checkpoint.utils import (
 )
 
 
+def print_missing_description(
+    sql: Path, nodes: List[Dict[str, Any]], schemas: List[Dict[str, Any]]
+) -> int:
+    if any(item.get("description") for item in [*nodes, *schemas]):
+        return 0
+    print(
+        f"{red(sql)}: "
+        f"does not have defined description or properties file is missing.",
+    )
+    return 1
+
+
 def has_description(
     paths: Sequence[str],
     manifest: Dict[str, Any],
     exclude_pattern: str,
     include_disabled: bool = False,
+    result_cache: Optional[HookResultCache] = None,
 ) -> Dict[str, Any]:
     paths = get_missing_file_paths(  # type: ignore
         paths, manifest, exclude_pattern=exclude_pattern
@@ -37,19 +52,26 @@ def has_description(
 
     # if user added schema but did not rerun the model
     schemas = get_model_schemas(list(ymls.values()), filenames)
-    # convert to sets
-    in_models = {model.filename for model in models if model.node.get("description")}
-    in_schemas = {
-        schema.model_name for schema in schemas if schema.schema.get("description")
-    }
-    missing = filenames.difference(in_models, in_schemas)
-
-    for model in missing:
-        status_code = 1
-        print(
-            f"{red(sqls.get(model))}: "
-            f"does not have defined description or properties file is missing.",
+    model_nodes: Dict[str, List[Dict[str, Any]]] = {name: [] for name in filenames}
+    for model in models:
+        model_nodes.setdefault(model.filename, []).append(
+            {"description": model.node.get("description")}
+        )
+    model_schemas: Dict[str, List[Dict[str, Any]]] = {name: [] for name in filenames}
+    for schema in schemas:
+        model_schemas[schema.model_name].append(schema.schema)
+
+    # Unchanged models replay the output of a previous run
+    result_cache = result_cache or HookResultCache(None)
+    for name in sorted(filenames):
+        sql, nodes, entries = sqls[name], model_nodes[name], model_schemas[name]
+        key = result_cache.get_file_key(sql, nodes, entries)
+        status_code_model = result_cache.run(
+            key, lambda: print_missing_description(sql, nodes, entries)
         )
+        if status_code_model:
+            status_code = 1
+    result_cache.save()
     return {"status_code": status_code}
 
 
@@ -71,6 +93,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         manifest=manifest,
         exclude_pattern=args.exclude,
         include_disabled=args.include_disabled,
+        result_cache=get_result_cache("check-model-has-description", args),
     )
     end_time = time.time()
     script_args = vars(args)
@@ -6,13 +6,12 @@ from typing import Any, Dict, Optional, Sequence
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
-    Test,
     add_default_args,
     get_dbt_manifest,
     get_missing_file_paths,
     get_model_sqls,
     get_models,
-    get_parent_childs,
+    get_test_coverage,
 )
 
 
@@ -35,16 +34,7 @@ def check_test_cnt(
     models = get_models(manifest, filenames, include_disabled=include_disabled)
 
     for model in models:
-        childs = list(
-            get_parent_childs(
-                manifest=manifest,
-                obj=model,
-                manifest_node="child_map",
-                node_types=["test"],
-            )
-        )
-        tests = [test for test in childs if isinstance(test, Test)]
-        model_test_cnt = len(tests)
+        model_test_cnt = get_test_coverage(manifest, model).total
         if model_test_cnt < test_cnt:
             status_code = 1
             print(
@@ -1,20 +1,18 @@
 import argparse
 import os
 import time
-from itertools import groupby
 from typing import Any, Dict, Optional, Sequence
 
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
     ParseDict,
-    Test,
     add_default_args,
     get_dbt_manifest,
     get_missing_file_paths,
     get_model_sqls,
     get_models,
-    get_parent_childs,
+    get_test_coverage,
 )
 
 
@@ -37,23 +35,10 @@ def check_test_cnt(
     models = get_models(manifest, filenames, include_disabled=include_disabled)
 
     for model in models:
-        childs = list(
-            get_parent_childs(
-                manifest=manifest,
-                obj=model,
-                manifest_node="child_map",
-                node_types=["test"],
-            )
-        )
-        tests = [test for test in childs if isinstance(test, Test)]
-        grouped = groupby(
-            sorted(tests, key=lambda x: x.test_type), lambda x: x.test_type
-        )
-        test_dict = {key: list(value) for key, value in grouped}
+        test_dict = get_test_coverage(manifest, model).by_type
         for required_test, required_cnt in required_tests.items():
-            test = test_dict.get(required_test, [])
-            test_cnt = len(test)
-            if not test or required_cnt > test_cnt:
+            test_cnt = test_dict.get(required_test, 0)
+            if not test_cnt or required_cnt > test_cnt:
                 status_code = 1
                 print(
                     f"{model.model_name}: "
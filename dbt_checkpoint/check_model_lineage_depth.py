@@ -0,0 +1,92 @@
+import argparse
+import os
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from dbt_checkpoint.tracking import dbtCheckpointTracking
+from dbt_checkpoint.utils import (
+    JsonOpenError,
+    add_default_args,
+    add_static_deps_args,
+    get_dbt_manifest,
+    get_lineage_graph,
+    get_model_sqls,
+    get_models,
+)
+
+
+def check_lineage_depth(
+    paths: Sequence[str],
+    manifest: Dict[str, Any],
+    max_depth: int,
+    include_disabled: bool = False,
+) -> int:
+    status_code = 0
+    sqls = get_model_sqls(paths, manifest, include_disabled)
+    filenames = set(sqls.keys())
+
+    # get manifest nodes that pre-commit found as changed
+    models = get_models(manifest, filenames, include_disabled=include_disabled)
+    graph = get_lineage_graph(manifest)
+
+    for model in models:
+        depth = graph.get_depth(model.model_id) or 0
+        if depth > max_depth:
+            status_code = 1
+            print(
+                f"{model.model_name}: "
+                f"has a lineage depth of {depth}, but max {max_depth} "
+                f"is allowed.",
+            )
+
+    return status_code
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    add_default_args(parser)
+    add_static_deps_args(parser)
+
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        required=True,
+        help="Maximal number of hops from the furthest source or root model.",
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        manifest = get_dbt_manifest(args)
+    except JsonOpenError as e:
+        print(f"Unable to load manifest file ({e})")
+        return 1
+
+    start_time = time.time()
+    status_code = check_lineage_depth(
+        paths=args.filenames,
+        manifest=manifest,
+        max_depth=args.max_depth,
+        include_disabled=args.include_disabled,
+    )
+    end_time = time.time()
+    script_args = vars(args)
+
+    tracker = dbtCheckpointTracking(script_args=script_args)
+    tracker.track_hook_event(
+        event_name="Hook Executed",
+        manifest=manifest,
+        event_properties={
+            "hook_name": os.path.basename(__file__),
+            "description": "Check model lineage depth",
+            "status": status_code,
+            "execution_time": end_time - start_time,
+            "is_pytest": script_args.get("is_test"),
+        },
+    )
+
+    return status_code
+
+
+if __name__ == "__main__":
+    exit(main())
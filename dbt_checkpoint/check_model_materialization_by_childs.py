@@ -6,6 +6,7 @@ from typing import Any, Dict, List
 from dbt_checkpoint.utils import (
     JsonOpenError,
     add_default_args,
+    add_static_deps_args,
     get_dbt_manifest,
     get_model_sqls,
     get_models,
@@ -79,6 +80,7 @@ def main(argv: List[str] = None) -> int:
     """
     parser = argparse.ArgumentParser()
     add_default_args(parser)
+    add_static_deps_args(parser)
 
     parser.add_argument(
         "--threshold-childs",
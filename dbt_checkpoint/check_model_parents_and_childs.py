@@ -8,6 +8,7 @@ from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
     add_default_args,
+    add_static_deps_args,
     get_dbt_manifest,
     get_model_sqls,
     get_models,
@@ -66,6 +67,7 @@ def check_child_parent_cnt(
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_default_args(parser)
+    add_static_deps_args(parser)
 
     parser.add_argument(
         "--min-parent-cnt",
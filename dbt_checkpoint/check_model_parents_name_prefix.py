@@ -7,6 +7,7 @@ from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
     add_default_args,
+    add_static_deps_args,
     get_dbt_manifest,
     get_filenames,
     get_models,
@@ -55,6 +56,7 @@ def check_parents_model_name_prefix(
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_default_args(parser)
+    add_static_deps_args(parser)
 
     white_black = parser.add_mutually_exclusive_group()
 
@@ -5,6 +5,8 @@ from typing import Any, Dict, Optional, Sequence
 
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
+    MODEL_MANIFEST_SELECTION,
+    MODEL_NODE_FIELDS,
     JsonOpenError,
     add_default_args,
     get_dbt_manifest,
@@ -13,6 +15,12 @@ from dbt_checkpoint.utils import (
     get_models,
 )
 
+# Only the tags are read besides what the model helpers need.
+MANIFEST_SELECTION = {
+    **MODEL_MANIFEST_SELECTION,
+    "nodes": (*MODEL_NODE_FIELDS, "tags"),
+}
+
 
 def validate_tags(
     paths: Sequence[str],
@@ -101,7 +109,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     args = parser.parse_args(argv)
 
     try:
-        manifest = get_dbt_manifest(args)
+        manifest = get_dbt_manifest(args, selection=MANIFEST_SELECTION)
     except JsonOpenError as e:
         print(f"Unable to load manifest file ({e})")
         return 1
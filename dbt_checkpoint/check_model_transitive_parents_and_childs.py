@@ -0,0 +1,109 @@
+import argparse
+import os
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from dbt_checkpoint.tracking import dbtCheckpointTracking
+from dbt_checkpoint.utils import (
+    JsonOpenError,
+    add_default_args,
+    add_static_deps_args,
+    get_dbt_manifest,
+    get_lineage_graph,
+    get_model_sqls,
+    get_models,
+)
+
+
+def check_transitive_cnt(
+    paths: Sequence[str],
+    manifest: Dict[str, Any],
+    max_parent_cnt: Optional[int] = None,
+    max_child_cnt: Optional[int] = None,
+    include_disabled: bool = False,
+) -> int:
+    status_code = 0
+    sqls = get_model_sqls(paths, manifest, include_disabled)
+    filenames = set(sqls.keys())
+
+    # get manifest nodes that pre-commit found as changed
+    models = list(get_models(manifest, filenames, include_disabled=include_disabled))
+    graph = get_lineage_graph(manifest)
+
+    model_ids = [model.model_id for model in models]
+    real_cnt = {}
+    if max_parent_cnt is not None:
+        parents = graph.count_closures(model_ids, ["model", "source"])
+        real_cnt["parents"] = (parents, max_parent_cnt)
+    if max_child_cnt is not None:
+        childs = graph.count_closures(model_ids, ["model"], descendants=True)
+        real_cnt["childs"] = (childs, max_child_cnt)
+
+    for model in models:
+        for dep, (counts, max_cnt) in real_cnt.items():
+            real_value = counts.get(model.model_id, 0)
+            if real_value > max_cnt:
+                status_code = 1
+                print(
+                    f"{model.model_name}: "
+                    f"has {real_value} transitive {dep}, but max {max_cnt} "
+                    f"is/are allowed.",
+                )
+
+    return status_code
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    add_default_args(parser)
+    add_static_deps_args(parser)
+
+    parser.add_argument(
+        "--max-parent-cnt",
+        type=int,
+        help="Maximal number of direct and indirect parent sources and models.",
+    )
+
+    parser.add_argument(
+        "--max-child-cnt",
+        type=int,
+        help="Maximal number of direct and indirect child models.",
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        manifest = get_dbt_manifest(args)
+    except JsonOpenError as e:
+        print(f"Unable to load manifest file ({e})")
+        return 1
+
+    start_time = time.time()
+    status_code = check_transitive_cnt(
+        paths=args.filenames,
+        manifest=manifest,
+        max_parent_cnt=args.max_parent_cnt,
+        max_child_cnt=args.max_child_cnt,
+        include_disabled=args.include_disabled,
+    )
+    end_time = time.time()
+    script_args = vars(args)
+
+    tracker = dbtCheckpointTracking(script_args=script_args)
+    tracker.track_hook_event(
+        event_name="Hook Executed",
+        manifest=manifest,
+        event_properties={
+            "hook_name": os.path.basename(__file__),
+            "description": "Check model transitive parents and childs",
+            "status": status_code,
+            "execution_time": end_time - start_time,
+            "is_pytest": script_args.get("is_test"),
+        },
+    )
+
+    return status_code
+
+
+if __name__ == "__main__":
+    exit(main())
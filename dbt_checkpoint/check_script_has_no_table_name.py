@@ -5,16 +5,20 @@ import time
 from pathlib import Path
 from typing import Generator, Optional, Sequence, Set, Tuple, List
 
+from dbt_checkpoint.parallel import map_in_processes
+from dbt_checkpoint.result_cache import get_result_cache
+from dbt_checkpoint.sql_lexer import tokenize
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
     add_default_args,
+    add_jobs_args,
     get_dbt_manifest,
     red,
     yellow,
 )
 
-REGEX_COMMENTS = r"(?<=(\/\*|\{#))((.|[\r\n])+?)(?=(\*+\/|#\}))|[ \t]*--.*"
+REGEX_COMMENTS = r"(?<=(\/\*|\{#))([\s\S]+?)(?=(\*+\/|#\}))|[ \t]*--.*"
 REGEX_SPLIT = r"[\s]+"
 IGNORE_WORDS = ["", "(", "{{", "{", "null", "''"]  # pragma: no mutate
 REGEX_PARENTHESIS = r"([\(\)])"  # pragma: no mutate
@@ -82,19 +86,14 @@ def replace_string_literals(sql: str) -> str:
     return re.sub(REGEX_STRING_LITERALS, "''", sql)
 
 
-def has_table_name(
-    sql: str,
-    filename: str,
-    dotless: Optional[bool] = False,
-) -> Tuple[int, Set[str]]:
-    status_code = 0
-    sql_clean = replace_comments(sql)
-    # Replace string literals with empty strings to avoid detecting 'foo from bar'
-    sql_clean = replace_string_literals(sql_clean)
-    sql_clean = add_space_to_parenthesis(sql_clean)
-    sql_clean = add_space_to_braces(sql_clean)
-    sql_clean = add_space_to_source_ref(sql_clean)
-    sql_split = re.split(REGEX_SPLIT, sql_clean)
+def find_table_names(
+    tokens: Sequence[str], dotless: Optional[bool] = False
+) -> Set[str]:
+    """
+    Names following `from`/`join` in the tokens of `sql_lexer.tokenize` that
+    are neither CTEs nor functions.
+    """
+    size = len(tokens)
     tables = set()
     cte = set()
 
@@ -102,35 +101,27 @@ def has_table_name(
     inside_function = False
     is_distinct_context = False
 
-    for i, (prev, cur, nxt) in enumerate(prev_cur_next_iter(sql_split)):
+    for i, cur in enumerate(tokens):
+        prev = tokens[i - 1] if i else None
+        nxt = tokens[i + 1] if i + 1 < size else None
         # Track "IS DISTINCT FROM" and "IS NOT DISTINCT FROM" expressions
-        if (
-            prev
-            and prev.lower() == "is"
-            and cur
-            and cur.lower() == "distinct"
-            and nxt
-            and nxt.lower() == "from"
-        ):
+        if prev == "is" and cur == "distinct" and nxt == "from":
             is_distinct_context = True
         elif (
-            prev
-            and prev.lower() == "not"
-            and cur
-            and cur.lower() == "distinct"
-            and nxt
-            and nxt.lower() == "from"
+            prev == "not"
+            and cur == "distinct"
+            and nxt == "from"
             and i >= 2
-            and sql_split[i - 2].lower() == "is"
+            and tokens[i - 2] == "is"
         ):
             is_distinct_context = True
-        elif is_distinct_context and prev and prev.lower() == "from":
+        elif is_distinct_context and prev == "from":
             # We've processed the token after FROM in an IS DISTINCT FROM expression
             is_distinct_context = False
             continue
 
         # Check if we're entering a function call
-        if cur and nxt and nxt == "(" and cur.lower() in COMMON_SQL_FUNCTIONS:
+        if nxt == "(" and cur in COMMON_SQL_FUNCTIONS:
             inside_function = True
 
         # Exit function context when we see the closing parenthesis
@@ -138,18 +129,13 @@ def has_table_name(
             inside_function = False
 
         # Handle table references, with additional context checks
-        if (
-            prev
-            and prev.lower() in ["from", "join"]
-            and cur
-            and cur.lower() not in IGNORE_WORDS
-        ):
+        if (prev == "from" or prev == "join") and cur not in IGNORE_WORDS:
             # Skip if inside a function that commonly uses FROM
             if inside_function:
                 continue
 
             # Skip if this matches common non-table FROM patterns
-            if cur.lower() in ALLOWED_FROM_CONTEXTS:
+            if cur in ALLOWED_FROM_CONTEXTS:
                 continue
 
             # Skip if in an "IS DISTINCT FROM" expression
@@ -157,33 +143,49 @@ def has_table_name(
                 continue
 
             # Look ahead to check for "DISTINCT FROM" pattern
-            if (
-                cur.lower() == "distinct"
-                and i + 1 < len(sql_split)
-                and sql_split[i + 1].lower() == "from"
-            ):
+            if cur == "distinct" and nxt == "from":
                 continue
 
-            table = cur.lower().strip().replace(",", "")
+            table = cur.replace(",", "")
             if dotless and "." not in table:
                 pass
             else:
                 tables.add(table)
 
-        if (
-            cur.lower() == "as" and nxt and nxt[0] == "(" and prev not in IGNORE_WORDS
-        ):  # pragma: no mutate
-            cte.add(prev.lower() if prev else prev)
+        if cur == "as" and nxt == "(" and prev not in IGNORE_WORDS:
+            cte.add(prev)
+
+    return tables.difference(cte)
 
-    table_names = tables.difference(cte)
+
+def has_table_name(
+    sql: str,
+    filename: str,
+    dotless: Optional[bool] = False,
+) -> Tuple[int, Set[str]]:
+    status_code = 0
+    # Comments are dropped and string literals replaced with empty strings
+    # to avoid detecting 'foo from bar'
+    table_names = find_table_names(tokenize(sql), dotless)
     if table_names:
         status_code = 1
     return status_code, table_names
 
 
+def print_tables(filename: str, status_code: int, tables: Set[str]) -> int:
+    if status_code:
+        result = "\n- ".join(list(tables))  # pragma: no mutate
+        print(
+            f"{red(filename)}: " f"does not use source() or ref() macros for tables:\n",
+            f"- {yellow(result)}",
+        )
+    return status_code
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_default_args(parser)
+    add_jobs_args(parser)
 
     parser.add_argument(
         "--ignore-dotless-table",
@@ -203,19 +205,31 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     script_args = vars(args)
 
     start_time = time.time()
+    # Unchanged files replay the output of a previous run
+    result_cache = get_result_cache("check-script-has-no-table-name", args)
+    keys = []
+    to_check = []
     for filename in args.filenames:
         sql = Path(filename).read_text()
-        status_code_file, tables = has_table_name(
-            sql, filename, args.ignore_dotless_table
+        key = result_cache.get_key(filename, sql.encode("utf-8", "surrogateescape"))
+        keys.append(key)
+        if key not in result_cache.entries:
+            to_check.append((sql, filename, args.ignore_dotless_table))
+    # Files without a cached result are checked by a pool of processes,
+    # their results are printed here in the order of `args.filenames`.
+    results = dict(
+        zip(
+            (filename for _, filename, _ in to_check),
+            map_in_processes(has_table_name, to_check, args.jobs),
+        )
+    )
+    for filename, key in zip(args.filenames, keys):
+        status_code_file = result_cache.run(
+            key, lambda: print_tables(filename, *results[filename])
         )
         if status_code_file:
-            result = "\n- ".join(list(tables))  # pragma: no mutate
-            print(
-                f"{red(filename)}: "
-                f"does not use source() or ref() macros for tables:\n",
-                f"- {yellow(result)}",
-            )
             status_code = status_code_file
+    result_cache.save()
 
     end_time = time.time()
 
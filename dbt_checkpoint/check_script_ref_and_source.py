@@ -5,10 +5,12 @@ import time
 from typing import Any, Dict, Optional, Sequence
 
 from dbt_checkpoint.check_script_has_no_table_name import replace_comments
+from dbt_checkpoint.manifest_index import get_manifest_index
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
     add_default_args,
+    add_static_deps_args,
     get_dbt_manifest,
     get_filenames,
     get_manifest_node_from_file_path,
@@ -18,19 +20,11 @@ from dbt_checkpoint.utils import (
 
 def obj_exists_in_manifest(
     obj_name: str,
-    manifest_sources: Dict[str, Any],
-    manifest_nodes: Dict[str, Any],
+    manifest: Dict[str, Any],
     is_source: bool = False,
 ) -> bool:
-    if is_source:
-        lookup_obj = manifest_sources
-    else:
-        lookup_obj = manifest_nodes
-    for _, value in lookup_obj.items():
-        lookup_name = value.get("unique_id")
-        if obj_name == lookup_name:
-            return True
-    return False
+    section = "sources" if is_source else "nodes"
+    return obj_name in get_manifest_index(manifest).get_unique_ids(section)
 
 
 def check_refs_sources(
@@ -38,8 +32,6 @@ def check_refs_sources(
 ) -> Dict[str, Any]:
     status_code = 0
     sqls = get_filenames(paths, [".sql"])
-    manifest_sources = manifest.get("sources", {})
-    manifest_nodes = manifest.get("nodes", {})
     models = set()
     sources = {}
     for _, file in sqls.items():
@@ -51,8 +43,7 @@ def check_refs_sources(
             node_type = node_split[0]
             dependency_exists = obj_exists_in_manifest(
                 node,
-                manifest_sources,
-                manifest_nodes,
+                manifest,
                 is_source=node_type == "source",
             )
             if not dependency_exists:
@@ -76,6 +67,7 @@ def check_refs_sources(
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_default_args(parser)
+    add_static_deps_args(parser)
 
     args = parser.parse_args(argv)
 
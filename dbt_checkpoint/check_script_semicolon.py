@@ -3,8 +3,15 @@ import os
 import time
 from typing import IO, Optional, Sequence
 
+from dbt_checkpoint.parallel import map_in_processes
 from dbt_checkpoint.tracking import dbtCheckpointTracking
-from dbt_checkpoint.utils import JsonOpenError, add_default_args, get_dbt_manifest, red
+from dbt_checkpoint.utils import (
+    JsonOpenError,
+    add_default_args,
+    add_jobs_args,
+    get_dbt_manifest,
+    red,
+)
 
 
 def check_semicolon(file_obj: IO[bytes], replace: bool = False) -> int:
@@ -35,9 +42,16 @@ def check_semicolon(file_obj: IO[bytes], replace: bool = False) -> int:
     return status_code
 
 
+def check_file_semicolon(filename: str, replace: bool = False) -> int:
+    # Read as binary so we can read byte-by-byte
+    with open(filename, "rb+") as file_obj:
+        return check_semicolon(file_obj, replace)
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_default_args(parser)
+    add_jobs_args(parser)
 
     args = parser.parse_args(argv)
 
@@ -49,16 +63,16 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         return 1
 
     start_time = time.time()
-    for filename in args.filenames:
-        # Read as binary so we can read byte-by-byte
-        with open(filename, "rb+") as file_obj:
-            status_code_file = check_semicolon(file_obj)
-            if status_code_file:
-                print(
-                    f"{red(filename)}: contains a semicolon at the end. "
-                    f"dbt does not support that."
-                )
-                status_code = status_code_file
+    status_codes = map_in_processes(
+        check_file_semicolon, [(filename,) for filename in args.filenames], args.jobs
+    )
+    for filename, status_code_file in zip(args.filenames, status_codes):
+        if status_code_file:
+            print(
+                f"{red(filename)}: contains a semicolon at the end. "
+                f"dbt does not support that."
+            )
+            status_code = status_code_file
 
     end_time = time.time()
     script_args = vars(args)
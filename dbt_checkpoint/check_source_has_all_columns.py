@@ -4,6 +4,7 @@ import time
 from pathlib import Path
 from typing import Any, Dict, FrozenSet, Optional, Sequence, Set, Tuple
 
+from dbt_checkpoint.catalog_index import CatalogColumns, get_catalog_index
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
@@ -17,23 +18,21 @@ from dbt_checkpoint.utils import (
 
 
 def compare_source_columns(
-    catalog_columns: Dict[str, Any], schema_columns: Sequence[Dict[str, Any]]
+    catalog_columns: CatalogColumns, schema_columns: Sequence[Dict[str, Any]]
 ) -> Tuple[Set[str], Set[str]]:
-    catalog_cols = {col.lower() for col in catalog_columns.keys()}
+    catalog_cols = catalog_columns.name_set
     schema_cols = {str(col.get("name")).lower() for col in schema_columns if col.get("name")}
     schema_only = schema_cols.difference(catalog_cols)
-    catalog_only = catalog_cols.difference(schema_cols)
+    catalog_only = set(catalog_cols - schema_cols)
     return schema_only, catalog_only
 
 
 def get_catalog_nodes(catalog: Dict[str, Any]) -> Dict[FrozenSet[str], Any]:
-    catalog_nodes = {}
-    for node_id, node in catalog.get("sources", {}).items():
-        key_split = node_id.split(".")
-        source_name = key_split[-2]
-        table_name = key_split[-1]
-        catalog_nodes[frozenset([source_name, table_name])] = node
-    return catalog_nodes
+    catalog_index = get_catalog_index(catalog)
+    return {
+        key: catalog_index.sources[source_id]
+        for key, source_id in catalog_index.source_ids.items()
+    }
 
 
 def check_source_columns(
@@ -45,14 +44,14 @@ def check_source_columns(
     # if user added schema but did not rerun
     schemas = get_source_schemas(ymls, include_disabled=include_disabled)
 
-    catalog_nodes = get_catalog_nodes(catalog)
+    catalog_index = get_catalog_index(catalog)
 
     for schema in schemas:
-        schema_id = frozenset([schema.source_name, schema.table_name])
-        catalog_node = catalog_nodes.get(schema_id, {})
-        if catalog_node:
+        source_id = catalog_index.get_source_id(schema.source_name, schema.table_name)
+        catalog_columns = catalog_index.get_columns(source_id) if source_id else None
+        if catalog_columns is not None:
             schema_only, catalog_only = compare_source_columns(
-                catalog_columns=catalog_node.get("columns", {}),
+                catalog_columns=catalog_columns,
                 schema_columns=schema.table_schema.get("columns", []),
             )
             if schema_only:
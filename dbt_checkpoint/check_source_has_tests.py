@@ -9,8 +9,8 @@ from dbt_checkpoint.utils import (
     JsonOpenError,
     add_default_args,
     get_dbt_manifest,
-    get_parent_childs,
     get_source_schemas,
+    get_test_coverage,
     red,
     yellow,
 )
@@ -29,15 +29,7 @@ def check_test_cnt(
     schemas = get_source_schemas(ymls, include_disabled=include_disabled)
 
     for schema in schemas:
-        tests = list(
-            get_parent_childs(
-                manifest=manifest,
-                obj=schema,
-                manifest_node="child_map",
-                node_types=["test"],
-            )
-        )
-        source_test_cnt = len(tests)
+        source_test_cnt = get_test_coverage(manifest, schema).total
         if source_test_cnt < test_cnt:
             status_code = 1
             print(
@@ -1,18 +1,16 @@
 import argparse
 import os
 import time
-from itertools import groupby
 from pathlib import Path
 from typing import Any, Dict, Optional, Sequence
 
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
-    Test,
     add_default_args,
     get_dbt_manifest,
-    get_parent_childs,
     get_source_schemas,
+    get_test_coverage,
 )
 
 
@@ -30,20 +28,7 @@ def check_test_cnt(
     schemas = get_source_schemas(ymls, include_disabled=include_disabled)
 
     for schema in schemas:
-        childs = list(
-            get_parent_childs(
-                manifest=manifest,
-                obj=schema,
-                manifest_node="child_map",
-                node_types=["test"],
-            )
-        )
-
-        tests = [test for test in childs if isinstance(test, Test)]
-        grouped = groupby(
-            sorted(tests, key=lambda x: x.test_name), lambda x: x.test_name
-        )
-        test_dict = {key: list(value) for key, value in grouped}
+        test_dict = get_test_coverage(manifest, schema).by_name
         required_test_count = 0
         for test in test_group:
             if test_dict.get(test):
@@ -1,7 +1,6 @@
 import argparse
 import os
 import time
-from itertools import groupby
 from pathlib import Path
 from typing import Any, Dict, Optional, Sequence
 
@@ -9,11 +8,10 @@ from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
     ParseDict,
-    Test,
     add_default_args,
     get_dbt_manifest,
-    get_parent_childs,
     get_source_schemas,
+    get_test_coverage,
 )
 
 
@@ -30,21 +28,10 @@ def check_test_cnt(
     schemas = get_source_schemas(ymls, include_disabled=include_disabled)
 
     for schema in schemas:
-        childs = get_parent_childs(
-            manifest=manifest,
-            obj=schema,
-            manifest_node="child_map",
-            node_types=["test"],
-        )
-        tests = [test for test in childs if isinstance(test, Test)]
-        grouped = groupby(
-            sorted(tests, key=lambda x: x.test_name), lambda x: x.test_name
-        )
-        test_dict = {key: list(value) for key, value in grouped}
+        test_dict = get_test_coverage(manifest, schema).by_name
         for required_test, required_cnt in required_tests.items():
-            test = test_dict.get(required_test, [])
-            test_cnt = len(test)
-            if not test or required_cnt > test_cnt:
+            test_cnt = test_dict.get(required_test, 0)
+            if not test_cnt or required_cnt > test_cnt:
                 status_code = 1
                 print(
                     f"{schema.source_name}.{schema.table_name}: "
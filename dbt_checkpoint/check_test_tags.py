@@ -1,20 +1,18 @@
 import argparse
 import os
 import time
-from itertools import groupby
 from typing import Any, Dict, Optional, Sequence
 
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import (
     JsonOpenError,
     ParseDict,
-    Test,
     add_default_args,
     get_dbt_manifest,
     get_missing_file_paths,
     get_model_sqls,
     get_models,
-    get_parent_childs,
+    get_test_coverage,
 )
 
 
@@ -37,23 +35,13 @@ def validate_tags(
     models = get_models(manifest, filenames, include_disabled=include_disabled)
 
     for model in models:
-        childs = list(
-            get_parent_childs(
-                manifest=manifest,
-                obj=model,
-                manifest_node="child_map",
-                node_types=["test"],
-            )
-        )
-
-        for test in (test for test in childs if isinstance(test, Test)):
-            test_tags = set(test.node.get("tags", []))
-            
+        coverage = get_test_coverage(manifest, model)
+        for test_id, test_tags in zip(coverage.test_ids, coverage.test_tags):
             if not test_tags.issubset(valid_tags) or not test_tags:
                 status_code = 1
                 list_diff = list(test_tags.difference(valid_tags))
                 print(
-                    f"{test.test_id} has wrong tags: {list_diff}"
+                    f"{test_id} has wrong tags: {list_diff}"
                 )
                 
     return status_code
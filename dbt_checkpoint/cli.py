@@ -0,0 +1,62 @@
+import argparse
+from typing import Optional
+from typing import Sequence
+
+from dbt_checkpoint import daemon
+from dbt_checkpoint import runner
+from dbt_checkpoint.utils import get_checkpoint_config
+
+
+def run(args: argparse.Namespace) -> int:
+    config = get_checkpoint_config(args.config)
+    hooks = runner.get_hooks_config(config, args.hooks)
+    if not hooks:
+        print(
+            "No hooks to run. Pass `--hook` or list them under the `hooks` "
+            "key of .dbt-checkpoint.yaml."
+        )
+        return 1
+
+    results = None
+    if not args.no_daemon:
+        results = daemon.request_hooks(
+            daemon.get_socket_path(config), hooks, args.filenames, args.config
+        )
+        for result in results or []:
+            runner.print_result(result)
+    if results is None:
+        results = runner.run_hooks(hooks, args.filenames, args.config)
+    return int(any(result.status_code for result in results))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="dbt-checkpoint")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run",
+        help="""Run several hooks in a single process, or in the daemon
+        started by `dbt-checkpoint serve` when it is running.""",
+    )
+    runner.add_run_args(run_parser)
+    run_parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Always run the hooks in this process.",
+    )
+    run_parser.set_defaults(func=run)
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="""Start a daemon keeping dbt artifacts in memory and running
+        the hooks requested by `dbt-checkpoint run`.""",
+    )
+    daemon.add_serve_args(serve_parser)
+    serve_parser.set_defaults(func=daemon.run_serve)
+
+    args = parser.parse_args(argv)
+    return args.func(args)  # type: ignore
+
+
+if __name__ == "__main__":
+    exit(main())
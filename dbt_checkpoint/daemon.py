@@ -0,0 +1,164 @@
+import argparse
+import dataclasses
+import json
+import os
+import socket
+import socketserver
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from dbt_checkpoint.manifest_cache import CACHE_DIR_NAME
+from dbt_checkpoint.manifest_cache import shared_artifacts
+from dbt_checkpoint.runner import HookConfig
+from dbt_checkpoint.runner import HookResult
+from dbt_checkpoint.runner import run_hooks
+from dbt_checkpoint.utils import add_config_args
+from dbt_checkpoint.utils import CheckpointConfig
+from dbt_checkpoint.utils import get_checkpoint_config
+
+SOCKET_NAME = "daemon.sock"
+CONNECT_TIMEOUT = 1.0
+
+
+def get_socket_path(config: CheckpointConfig) -> str:
+    """
+    The daemon listens in the cache directory of the dbt project, next
+    to the artifacts it keeps in memory.
+    """
+    project_dir = Path(config.dbt_project_dir or ".")
+    return str(project_dir / "target" / CACHE_DIR_NAME / SOCKET_NAME)
+
+
+def _recv_all(sock: socket.socket) -> bytes:
+    chunks: List[bytes] = []
+    while True:
+        chunk = sock.recv(1 << 16)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+class HookRequestHandler(socketserver.StreamRequestHandler):
+    """
+    One JSON request per connection:
+        {"cwd": ..., "config": ..., "filenames": [...], "hooks": [...]}
+    answered with {"results": [...]}.
+    """
+
+    def handle(self) -> None:
+        data = self.rfile.read()
+        if not data:
+            # Probe of `is_daemon_running`, nothing to answer.
+            return
+        try:
+            request = json.loads(data.decode("utf-8"))
+            # Filenames passed by pre-commit are relative to the client.
+            os.chdir(request["cwd"])
+            hooks = [HookConfig(**hook) for hook in request["hooks"]]
+            results = run_hooks(
+                hooks, request["filenames"], request["config"], print_results=False
+            )
+            response: Dict[str, Any] = {
+                "results": [dataclasses.asdict(result) for result in results]
+            }
+        except Exception as e:
+            response = {"error": str(e)}
+        self.wfile.write(json.dumps(response).encode("utf-8"))
+
+
+class HookServer(socketserver.UnixStreamServer):
+    # Requests are handled one at a time: hooks print to a redirected
+    # stdout and share process-wide caches.
+    allow_reuse_address = True
+
+
+def is_daemon_running(socket_path: str) -> bool:
+    """A daemon accepts connections on `socket_path`."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+    return True
+
+
+def serve(socket_path: str) -> int:
+    """
+    Serve hook requests until interrupted. The parsed manifest and catalog
+    stay in memory between requests and are reloaded as soon as dbt
+    rewrites them, as every request checks their fingerprint.
+    """
+    path = Path(socket_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        if is_daemon_running(socket_path):
+            print(f"dbt-checkpoint daemon already running on {socket_path}")
+            return 1
+        # Stale socket of a daemon that is gone.
+        path.unlink()
+    print(f"dbt-checkpoint daemon listening on {socket_path}")
+    try:
+        with shared_artifacts(), HookServer(socket_path, HookRequestHandler) as server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if path.exists():
+            path.unlink()
+    return 0
+
+
+def request_hooks(
+    socket_path: str,
+    hooks: Sequence[HookConfig],
+    filenames: Sequence[str],
+    config_path: str,
+) -> Optional[List[HookResult]]:
+    """
+    Run `hooks` in the daemon listening on `socket_path`. Returns None when
+    no daemon is reachable, so that the caller can run them in-process.
+    """
+    if not hasattr(socket, "AF_UNIX") or not Path(socket_path).exists():
+        return None
+    request = {
+        "cwd": os.getcwd(),
+        "config": str(Path(config_path).absolute()),
+        "filenames": list(filenames),
+        "hooks": [dataclasses.asdict(hook) for hook in hooks],
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(socket_path)
+            # Hooks such as dbt-run can take a long time.
+            sock.settimeout(None)
+            sock.sendall(json.dumps(request).encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+            response = json.loads(_recv_all(sock).decode("utf-8"))
+    except (OSError, ValueError):
+        # Stale socket of a daemon that is gone.
+        return None
+    if "error" in response:
+        return None
+    return [HookResult(**result) for result in response["results"]]
+
+
+def add_serve_args(parser: argparse.ArgumentParser) -> None:
+    add_config_args(parser)
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default="",
+        help="""Location of the daemon socket.
+        Defaults to target/.dbt-checkpoint-cache/daemon.sock.""",
+    )
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    config = get_checkpoint_config(args.config)
+    return serve(args.socket or get_socket_path(config))
@@ -0,0 +1,68 @@
+import os
+from typing import Dict
+from typing import List
+
+# Directories never searched for related files: dbt build artifacts,
+# installed packages and git internals.
+WALK_EXCLUDED_DIRS = frozenset({"target", "dbt_packages", ".git"})
+
+
+class FileIndex:
+    """
+    Files below `root`, listed by a single walk of the tree and grouped by
+    name. Replaces a recursive `Path().glob("**/...")` per lookup.
+    """
+
+    def __init__(self, root: str = "."):
+        self.root = root
+        # file name -> [path relative to `root`, with `/` separators]
+        self.files_by_name: Dict[str, List[str]] = {}
+        self._walk()
+
+    def _walk(self) -> None:
+        prefix_len = len(self.root.rstrip("/")) + 1
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [
+                dirname
+                for dirname in dirnames
+                if dirname.lower() not in WALK_EXCLUDED_DIRS
+            ]
+            rel_dir = dirpath[prefix_len:].replace(os.sep, "/")
+            for filename in filenames:
+                rel_path = f"{rel_dir}/{filename}" if rel_dir else filename
+                self.files_by_name.setdefault(filename, []).append(rel_path)
+
+    def find(self, path_suffix: str) -> List[str]:
+        """
+        Files whose path ends with the whole components of `path_suffix`,
+        what `Path(root).glob(f"**/{path_suffix}")` matches.
+        """
+        suffix = path_suffix.replace("\\", "/").strip("/")
+        if not suffix:
+            return []
+        name = suffix.rsplit("/", 1)[-1]
+        return [
+            path
+            for path in self.files_by_name.get(name, [])
+            if path == suffix or path.endswith(f"/{suffix}")
+        ]
+
+
+_FILE_INDEXES: Dict[str, FileIndex] = {}
+
+
+def get_file_index(root: str = ".") -> FileIndex:
+    """
+    Return the index of `root`, walking the tree on first use only. Hooks
+    run for a single commit, during which the tree does not change.
+    """
+    key = os.path.abspath(root)
+    index = _FILE_INDEXES.get(key)
+    if index is None:
+        index = _FILE_INDEXES[key] = FileIndex(root)
+    return index
+
+
+def reset_file_indexes() -> None:
+    """Forget the walked trees, e.g. before a new daemon request."""
+    _FILE_INDEXES.clear()
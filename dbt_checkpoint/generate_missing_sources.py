@@ -8,7 +8,12 @@ from yaml import dump, safe_load
 
 from dbt_checkpoint.check_script_ref_and_source import check_refs_sources
 from dbt_checkpoint.tracking import dbtCheckpointTracking
-from dbt_checkpoint.utils import JsonOpenError, add_default_args, get_dbt_manifest
+from dbt_checkpoint.utils import (
+    JsonOpenError,
+    add_default_args,
+    add_static_deps_args,
+    get_dbt_manifest,
+)
 
 
 def create_missing_sources(
@@ -53,6 +58,7 @@ def create_missing_sources(
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_default_args(parser)
+    add_static_deps_args(parser)
 
     parser.add_argument(
         "--schema-file",
@@ -0,0 +1,73 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+
+# Parser used by "auto": the first one installed, the stdlib otherwise.
+AUTO_JSON_BACKENDS = ("orjson", "simdjson")
+
+JsonLoader = Callable[[Path], Any]
+
+
+def _load_stdlib(path: Path) -> Any:
+    # Decoding to str first frees the raw bytes before parsing.
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _get_orjson() -> JsonLoader:
+    import orjson
+
+    # orjson parses bytes directly, no intermediate str is created.
+    return lambda path: orjson.loads(path.read_bytes())
+
+
+def _get_simdjson() -> JsonLoader:
+    import simdjson  # type: ignore[import-not-found]
+
+    return lambda path: simdjson.loads(path.read_bytes())
+
+
+JSON_BACKENDS: Dict[str, Callable[[], JsonLoader]] = {
+    "orjson": _get_orjson,
+    "simdjson": _get_simdjson,
+    "json": lambda: _load_stdlib,
+}
+
+
+@lru_cache(maxsize=None)
+def get_json_loader(backend: str = "auto") -> JsonLoader:
+    """
+    Loader of the JSON `backend` set by `json-backend` in
+    .dbt-checkpoint.yaml. Backends that are not installed fall back to the
+    stdlib, so a shared config works for everyone in the team.
+    """
+    candidates: Tuple[str, ...]
+    if backend == "auto":
+        candidates = AUTO_JSON_BACKENDS
+    elif backend in JSON_BACKENDS:
+        candidates = (backend,)
+    else:
+        raise ValueError(
+            f"Unknown json-backend {backend!r}, use one of: "
+            f"auto, {', '.join(JSON_BACKENDS)}"
+        )
+    for candidate in candidates:
+        try:
+            return JSON_BACKENDS[candidate]()
+        except ImportError:
+            continue
+    return _load_stdlib
+
+
+def load_json(path: Path, backend: str = "auto") -> Any:
+    loader = get_json_loader(backend)
+    if loader is _load_stdlib:
+        return loader(path)
+    try:
+        return loader(path)
+    except ValueError:
+        # e.g. NaN or integers over 64 bits, only the stdlib accepts them
+        return _load_stdlib(path)
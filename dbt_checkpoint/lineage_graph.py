@@ -0,0 +1,301 @@
+import sys
+from array import array
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+
+from dbt_checkpoint.manifest_cache import paused_gc
+
+# Tests are leaves of every model they test, they are left out of the graph.
+IGNORED_PREFIXES = ("test.", "unit_test.")
+# Closures kept per direction, each takes up to `size / 8` bytes.
+CLOSURE_CACHE_SIZE = 4096
+REACHED = ord("1")
+# From this many nodes, `count_closures` computes the closures of the graph.
+BULK_LOOKUPS = 64
+
+
+def get_resource_type(unique_id: str) -> str:
+    return unique_id.split(".", 1)[0]
+
+
+if sys.version_info >= (3, 10):
+
+    def popcount(bits: int) -> int:
+        return bits.bit_count()
+
+else:
+
+    def popcount(bits: int) -> int:
+        return bin(bits).count("1")
+
+
+class LineageGraph:
+    """
+    The DAG of a manifest from `parent_map` (or `child_map` for manifests
+    without it), tests excepted. Nodes are numbered in topological order,
+    parents always come before their children, and edges are tuples of
+    node numbers.
+
+    Depths are computed for every node when the graph is built. Ancestors
+    and descendants are bitsets (Python ints) computed on first use and
+    memoized, up to `CLOSURE_CACHE_SIZE` per direction: the closures of
+    every node of a large project do not fit in memory. `count_closures`
+    counts them for many nodes at once without keeping them.
+    """
+
+    def __init__(self, manifest: Dict[str, Any]):
+        with paused_gc():
+            self._build(manifest)
+        # node number -> bitset of its ancestors/descendants
+        self._ancestors: Dict[int, int] = {}
+        self._descendants: Dict[int, int] = {}
+        self._type_masks: Dict[Tuple[Tuple[str, ...], bool], int] = {}
+
+    def _build(self, manifest: Dict[str, Any]) -> None:
+        parent_map: Dict[str, List[str]] = manifest.get("parent_map") or {}
+        child_map: Dict[str, List[str]] = manifest.get("child_map") or {}
+        keys = [
+            key
+            for key in dict.fromkeys([*parent_map, *child_map])
+            if not key.startswith(IGNORED_PREFIXES)
+        ]
+        positions = {key: position for position, key in enumerate(keys)}
+        parents_of: List[List[int]] = [[] for _ in keys]
+
+        def get_position(key: str) -> int:
+            # nodes only referenced by other nodes, e.g. in partial manifests
+            position = positions.get(key)
+            if position is None:
+                position = positions[key] = len(keys)
+                keys.append(key)
+                parents_of.append([])
+            return position
+
+        if parent_map:
+            for key, parents in parent_map.items():
+                position = positions.get(key)
+                if position is not None:
+                    parents_of[position] = [
+                        get_position(parent)
+                        for parent in parents
+                        if not parent.startswith(IGNORED_PREFIXES)
+                    ]
+        else:
+            for key, children in child_map.items():
+                position = positions.get(key)
+                if position is not None:
+                    for child in children:
+                        if not child.startswith(IGNORED_PREFIXES):
+                            parents_of[get_position(child)].append(position)
+        children_of: List[List[int]] = [[] for _ in keys]
+        for position, parent_positions in enumerate(parents_of):
+            for parent_position in parent_positions:
+                children_of[parent_position].append(position)
+
+        # Kahn's algorithm, nodes of a cycle (not a valid dbt project) are
+        # appended in manifest order.
+        n_parents = [len(parent_positions) for parent_positions in parents_of]
+        order = [position for position, count in enumerate(n_parents) if not count]
+        for position in order:
+            for child_position in children_of[position]:
+                n_parents[child_position] -= 1
+                if not n_parents[child_position]:
+                    order.append(child_position)
+        if len(order) < len(keys):
+            ordered = set(order)
+            order.extend(p for p in range(len(keys)) if p not in ordered)
+        numbers = [0] * len(keys)
+        for number, position in enumerate(order):
+            numbers[position] = number
+
+        self.ids: List[str] = [keys[position] for position in order]
+        self.numbers: Dict[str, int] = {key: n for n, key in enumerate(self.ids)}
+        # node number -> numbers of its parents/children
+        self.parents = self._get_edges(parents_of, order, numbers)
+        self.children = self._get_edges(children_of, order, numbers)
+        # longest path from a node without parents, e.g. a source
+        self.depths = array("I", bytes(4 * len(self.ids)))
+        depths = self.depths
+        for number, parent_numbers in enumerate(self.parents):
+            if parent_numbers:
+                depths[number] = 1 + max([depths[parent] for parent in parent_numbers])
+
+    @staticmethod
+    def _get_edges(
+        edges: List[List[int]], order: List[int], numbers: List[int]
+    ) -> List[Tuple[int, ...]]:
+        get_number = numbers.__getitem__
+        return [tuple(map(get_number, edges[position])) for position in order]
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    def get_depth(self, node_id: str) -> Optional[int]:
+        number = self.numbers.get(node_id)
+        return None if number is None else self.depths[number]
+
+    def get_ancestors(self, node_id: str) -> int:
+        """Bitset of the ancestors of `node_id`, see `iter_ids`."""
+        return self._get_closure(self.numbers[node_id], self.parents, False)
+
+    def get_descendants(self, node_id: str) -> int:
+        """Bitset of the descendants of `node_id`, see `iter_ids`."""
+        return self._get_closure(self.numbers[node_id], self.children, True)
+
+    def _get_closure(
+        self, number: int, edges: List[Tuple[int, ...]], descendants: bool
+    ) -> int:
+        """
+        Union of the closures of the nodes next to `number` when they are
+        memoized, e.g. when nodes are looked up in topological order, else
+        a walk of the nodes reachable through `edges` that does not go
+        further than the nodes whose closure is memoized.
+        """
+        memo = self._descendants if descendants else self._ancestors
+        bits = memo.get(number)
+        if bits is not None:
+            return bits
+        # bit `n` of ancestors is node `n`, bit `n` of descendants is node
+        # `size - 1 - n`: bitsets stay small for nodes close to the
+        # sources/exposures they are computed for.
+        last = self.size - 1
+        bits = 0
+        for following in edges[number]:
+            closure = memo.get(following)
+            if closure is None:
+                bits = self._walk(number, edges, memo, descendants)
+                break
+            bits |= closure | 1 << (last - following if descendants else following)
+        if len(memo) >= CLOSURE_CACHE_SIZE:
+            del memo[next(iter(memo))]
+        memo[number] = bits
+        return bits
+
+    def _walk(
+        self,
+        number: int,
+        edges: List[Tuple[int, ...]],
+        memo: Dict[int, int],
+        descendants: bool,
+    ) -> int:
+        # "1" for the nodes reached, parsed as a bitset by `int`
+        reached = bytearray(b"0") * self.size
+        bits = 0
+        stack = [number]
+        while stack:
+            for following in edges[stack.pop()]:
+                if reached[following] != REACHED:
+                    reached[following] = REACHED
+                    if following in memo:
+                        bits |= memo[following]
+                    else:
+                        stack.append(following)
+        return bits | int(reached if descendants else reached[::-1], 2)
+
+    def get_type_mask(
+        self, resource_types: Sequence[str], descendants: bool = False
+    ) -> int:
+        """Bitset of the nodes of `resource_types`, to filter closures."""
+        key = (tuple(resource_types), descendants)
+        mask = self._type_masks.get(key)
+        if mask is None:
+            last = self.size - 1
+            mask = 0
+            for number, node_id in enumerate(self.ids):
+                if get_resource_type(node_id) in resource_types:
+                    mask |= 1 << (last - number if descendants else number)
+            self._type_masks[key] = mask
+        return mask
+
+    def count_ancestors(self, node_id: str, resource_types: Sequence[str] = ()) -> int:
+        bits = self.get_ancestors(node_id)
+        if resource_types:
+            bits &= self.get_type_mask(resource_types)
+        return popcount(bits)
+
+    def count_descendants(
+        self, node_id: str, resource_types: Sequence[str] = ()
+    ) -> int:
+        bits = self.get_descendants(node_id)
+        if resource_types:
+            bits &= self.get_type_mask(resource_types, descendants=True)
+        return popcount(bits)
+
+    def count_closures(
+        self,
+        node_ids: Iterable[str],
+        resource_types: Sequence[str] = (),
+        descendants: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Number of ancestors (or descendants) of every node of `node_ids`
+        in the graph. Closures are looked up one by one for a few nodes,
+        computed for the whole graph in topological order for more.
+        """
+        numbers = {
+            self.numbers[node_id] for node_id in node_ids if node_id in self.numbers
+        }
+        ids = self.ids
+        if len(numbers) < BULK_LOOKUPS:
+            count = self.count_descendants if descendants else self.count_ancestors
+            return {
+                ids[number]: count(ids[number], resource_types) for number in numbers
+            }
+        mask = self.get_type_mask(resource_types, descendants) if resource_types else -1
+        return {
+            ids[number]: popcount(bits & mask)
+            for number, bits in self._iter_closures(numbers, descendants)
+        }
+
+    def _iter_closures(
+        self, numbers: Set[int], descendants: bool
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Closures of `numbers`, each node being the union of the closures
+        of the nodes next to it. A closure is only kept until the last node
+        next to it is processed.
+        """
+        last = self.size - 1
+        if descendants:
+            edges = self.children
+            order = range(last, min(numbers) - 1, -1)
+        else:
+            edges = self.parents
+            order = range(max(numbers) + 1)
+        # number of nodes left to process next to every node
+        remaining = [0] * self.size
+        for number in order:
+            for following in edges[number]:
+                remaining[following] += 1
+        closures: Dict[int, int] = {}
+        for number in order:
+            bits = 0
+            for following in edges[number]:
+                # `get`/`pop`: nodes of a cycle may come after their children
+                bits |= closures.get(following, 0) | 1 << (
+                    last - following if descendants else following
+                )
+                remaining[following] -= 1
+                if not remaining[following]:
+                    closures.pop(following, None)
+            if remaining[number]:
+                closures[number] = bits
+            if number in numbers:
+                yield number, bits
+
+    def iter_ids(self, bits: int, descendants: bool = False) -> Iterator[str]:
+        """Node ids of a bitset of `get_ancestors`/`get_descendants`."""
+        last = self.size - 1
+        while bits:
+            low_bit = bits & -bits
+            number = low_bit.bit_length() - 1
+            yield self.ids[last - number if descendants else number]
+            bits ^= low_bit
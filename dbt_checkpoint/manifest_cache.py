@@ -0,0 +1,185 @@
+import gc
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+CACHE_DIR_NAME = ".dbt-checkpoint-cache"
+CACHE_SUFFIX = ".marshal"
+# Bump when the on-disk layout changes so old entries are never reused.
+CACHE_FORMAT_VERSION = 1
+# Bytes hashed from the head and the tail of the artifact.
+SAMPLE_SIZE = 1 << 16
+
+# Artifacts kept in memory within `shared_artifacts()`:
+# (resolved path, variant) -> (fingerprint, content)
+_SHARED_ARTIFACTS: Optional[Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]]] = None
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Building large manifest structures allocates millions of containers,
+    which makes the cyclic garbage collector kick in repeatedly for nothing.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def get_cache_dir(json_filename: str) -> Path:
+    """
+    dbt writes its artifacts into `target/`, the cache lives next to them
+    so that `dbt clean` wipes it together with the artifacts.
+    """
+    return Path(json_filename).parent / CACHE_DIR_NAME
+
+
+def get_fingerprint(json_filename: str) -> Optional[str]:
+    """
+    Fast content fingerprint of a dbt artifact. Path, size and mtime catch
+    every regular rewrite by dbt, sampling the head and the tail of the file
+    guards against coarse mtime resolution on some filesystems.
+    """
+    path = Path(json_filename)
+    try:
+        stat = path.stat()
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            (
+                f"{CACHE_FORMAT_VERSION}:{sys.version_info[:2]}:{path.resolve()}:"
+                f"{stat.st_size}:{stat.st_mtime_ns}"
+            ).encode("utf-8")
+        )
+        with path.open("rb") as file:
+            digest.update(file.read(SAMPLE_SIZE))
+            if stat.st_size > SAMPLE_SIZE:
+                file.seek(max(SAMPLE_SIZE, stat.st_size - SAMPLE_SIZE))
+                digest.update(file.read(SAMPLE_SIZE))
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _cache_file(json_filename: str, fingerprint: str, variant: str = "") -> Path:
+    stem = Path(json_filename).stem
+    suffix = f"-{variant}{CACHE_SUFFIX}" if variant else CACHE_SUFFIX
+    return get_cache_dir(json_filename) / f"{stem}-{fingerprint}{suffix}"
+
+
+def read_marshal(cache_file: Path) -> Optional[Any]:
+    """Content of a cache file, None when it is missing or unreadable."""
+    try:
+        data = cache_file.read_bytes()
+    except OSError:
+        return None
+    try:
+        with paused_gc():
+            return marshal.loads(data)
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def write_marshal(cache_file: Path, content: Any) -> None:
+    """
+    Several hooks may write the same cache file concurrently, write to a
+    temporary file and atomically move it into place.
+    """
+    cache_dir = cache_file.parent
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            marshal.dump(content, file)
+        os.replace(tmp_name, cache_file)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _write_cache(
+    json_filename: str, fingerprint: str, cache_file: Path, content: Dict[str, Any]
+) -> None:
+    try:
+        write_marshal(cache_file, content)
+        # Remove entries of previous versions of the same artifact, the
+        # other variants of the current version are kept.
+        stem = Path(json_filename).stem
+        for stale in cache_file.parent.glob(f"{stem}-*{CACHE_SUFFIX}"):
+            if not stale.name.startswith(f"{stem}-{fingerprint}"):
+                stale.unlink()
+    except (OSError, ValueError):
+        # Caching is best effort only, e.g. `target/` can be read-only.
+        pass
+
+
+@contextmanager
+def shared_artifacts() -> Iterator[None]:
+    """
+    Keep the artifacts loaded by `get_cached_json` in memory, so that hooks
+    executed in the same process (see `dbt_checkpoint.runner` and
+    `dbt_checkpoint.daemon`) share them.
+    """
+    global _SHARED_ARTIFACTS
+    previous = _SHARED_ARTIFACTS
+    if previous is None:
+        _SHARED_ARTIFACTS = {}
+    try:
+        yield
+    finally:
+        _SHARED_ARTIFACTS = previous
+
+
+def artifacts_are_shared() -> bool:
+    """Whether several hooks run in this process, see `shared_artifacts`."""
+    return _SHARED_ARTIFACTS is not None
+
+
+def get_cached_json(
+    json_filename: str,
+    loader: Callable[[str], Dict[str, Any]],
+    persist: bool = True,
+    variant: str = "",
+) -> Dict[str, Any]:
+    """
+    Load a dbt artifact via `loader`, reusing a pre-digested binary copy
+    stored in `target/.dbt-checkpoint-cache/` whenever the artifact
+    did not change since it was cached.
+
+    `variant` identifies loaders reading only part of the artifact (see
+    `dbt_checkpoint.manifest_loader`), they are cached separately. A whole
+    artifact already shared in memory is returned for any variant.
+    """
+    fingerprint = get_fingerprint(json_filename)
+    if fingerprint is None:
+        return loader(json_filename)
+    path = str(Path(json_filename).resolve())
+    if _SHARED_ARTIFACTS is not None:
+        for shared_key in ((path, ""), (path, variant)):
+            if shared_key in _SHARED_ARTIFACTS:
+                shared_fingerprint, shared_content = _SHARED_ARTIFACTS[shared_key]
+                if shared_fingerprint == fingerprint:
+                    return shared_content
+    cache_file = _cache_file(json_filename, fingerprint, variant)
+    content = read_marshal(cache_file) if persist else None
+    if content is None:
+        content = loader(json_filename)
+        if persist:
+            _write_cache(json_filename, fingerprint, cache_file, content)
+    if _SHARED_ARTIFACTS is not None:
+        # Only the latest version of an artifact is kept around.
+        _SHARED_ARTIFACTS[(path, variant)] = (fingerprint, content)
+    return content
@@ -0,0 +1,353 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TYPE_CHECKING
+from typing import Tuple
+
+from dbt_checkpoint.manifest_cache import paused_gc
+from dbt_checkpoint.path_trie import PathTrie
+from dbt_checkpoint.path_trie import split_path
+from dbt_checkpoint.test_coverage import CoverageIndex
+
+if TYPE_CHECKING:
+    from dbt_checkpoint.lineage_graph import LineageGraph
+
+LineageKey = Tuple[str, ...]
+# lowercased (database, schema, identifier) suffix of a relation
+RelationKey = Tuple[str, ...]
+
+# Quotes around identifiers: "ansi", `bigquery`/`mysql`, [sql server]
+IDENTIFIER_QUOTES = '"`[]'
+# Resource types `ref()` resolves to.
+REF_RESOURCE_TYPES = ("model", "seed", "snapshot")
+
+# Number of manifests whose index is kept around, hooks usually work with one.
+INDEX_CACHE_SIZE = 4
+
+
+class ManifestIndex:
+    """
+    Lookup tables precomputed from a single pass over a dbt manifest.
+
+    The helpers in `dbt_checkpoint.utils` used to scan every manifest node
+    for each hook invocation, with the index they only look up the
+    filenames pre-commit passed in.
+    """
+
+    SECTIONS = ("nodes", "macros", "disabled", "sources", "child_map", "parent_map")
+
+    def __init__(self, manifest: Dict[str, Any]):
+        self.manifest = manifest
+        self._sections = tuple(manifest.get(key) for key in self.SECTIONS)
+        self._sizes = self._get_sizes()
+        self.nodes: Dict[str, Any] = manifest.get("nodes") or {}
+        self.macros: Dict[str, Any] = manifest.get("macros") or {}
+        self.disabled: Dict[str, Any] = manifest.get("disabled") or {}
+
+        # node/macro id -> position in `manifest["nodes"]`/`manifest["macros"]`
+        self.positions: Dict[str, int] = {}
+        # resource type -> node id -> node
+        self.resource_types: Dict[str, Dict[str, Any]] = {}
+        # filename -> [(position, candidate order, model id)]
+        self.model_filenames: Dict[str, List[Tuple[int, int, str]]] = {}
+        self.snapshot_filenames: Dict[str, List[str]] = {}
+        self.test_filenames: Dict[str, List[str]] = {}
+        self.seed_filenames: Dict[str, List[str]] = {}
+        self.macro_filenames: Dict[str, List[str]] = {}
+        # stem -> path of macro `.sql` files
+        self.macro_sqls: Dict[str, Path] = {}
+        self.ephemeral_models: List[str] = []
+        self.snapshots: List[str] = []
+        self.disabled_models: List[str] = []
+        # child_map/parent_map -> lineage key -> dependency ids, built lazily
+        self._lineage: Dict[str, Dict[LineageKey, List[str]]] = {}
+        # "nodes"/"sources" -> `unique_id` of its entries, built lazily
+        self._unique_ids: Dict[str, Set[str]] = {}
+        # alias -> id of the first node with that alias, built lazily
+        self._aliases: Optional[Dict[str, str]] = None
+        # name -> ids of the nodes `ref()` resolves to, built lazily
+        self._ref_ids: Optional[Dict[str, List[str]]] = None
+        # (source name, table name) -> source id, built lazily
+        self._source_ids: Optional[Dict[Tuple[str, str], str]] = None
+        # relation key -> (position in `manifest["sources"]`, source id), lazily
+        self._source_relations: Optional[Dict[RelationKey, Tuple[int, str]]] = None
+        # node ids by `original_file_path` (`path` for nodes without one)
+        # and by `patch_path`, the property file describing them, lazily
+        self._file_paths: Optional[PathTrie] = None
+        self._property_paths: Optional[PathTrie] = None
+        # tests of the nodes in `child_map`, indexed on first lookup
+        self._test_coverage: Optional[CoverageIndex] = None
+        self._lineage_graph: Optional["LineageGraph"] = None
+        with paused_gc():
+            self._build()
+
+    def _build(self) -> None:
+        for position, (key, node) in enumerate(self.nodes.items()):
+            self.positions[key] = position
+            split_key = key.split(".")
+            resource_type = split_key[0]
+            self.resource_types.setdefault(resource_type, {})[key] = node
+            materialized = node.get("config", {}).get("materialized")
+            filename = split_key[-1]
+
+            if resource_type == "model":
+                # Versions are supported since dbt-core 1.5
+                version = node.get("version")
+                if version and filename == f"v{version}":
+                    # dbt versioned filenames can be either `model_name`
+                    # or `model_name_v{version}`
+                    candidates = [split_key[-2], f"{split_key[-2]}_v{version}"]
+                else:
+                    candidates = [filename]
+                for order, candidate in enumerate(candidates):
+                    self.model_filenames.setdefault(candidate, []).append(
+                        (position, order, key)
+                    )
+                if materialized == "ephemeral":
+                    self.ephemeral_models.append(filename)
+            elif resource_type == "snapshot" and materialized == "snapshot":
+                self.snapshots.append(filename)
+                self.snapshot_filenames.setdefault(filename, []).append(key)
+            elif resource_type == "test" and materialized == "test":
+                self.test_filenames.setdefault(filename, []).append(key)
+            elif resource_type == "seed":
+                self.seed_filenames.setdefault(filename, []).append(key)
+
+        for position, (key, macro) in enumerate(self.macros.items()):
+            self.positions[key] = position
+            split_key = key.split(".")
+            if split_key[0] == "macro":
+                self.macro_filenames.setdefault(split_key[-1], []).append(key)
+            macro_path = Path(macro.get("path", ""))
+            if macro_path.suffix == ".sql":
+                self.macro_sqls[macro_path.stem] = macro_path
+
+        for key in self.disabled:
+            split_key = key.split(".")
+            if split_key[0] == "model":
+                self.disabled_models.append(split_key[-1])
+
+    def _get_sizes(self) -> Tuple[int, ...]:
+        return tuple(len(section or ()) for section in self._sections)
+
+    def is_current(self, manifest: Dict[str, Any]) -> bool:
+        """Whether `manifest` was not modified since the index was built."""
+        return (
+            all(
+                manifest.get(key) is section
+                for key, section in zip(self.SECTIONS, self._sections)
+            )
+            and self._get_sizes() == self._sizes
+        )
+
+    def get_lineage(self, manifest_node: str) -> Dict[LineageKey, List[str]]:
+        """
+        Keys of `manifest[manifest_node]` (`child_map` or `parent_map`)
+        grouped by `("source", source name, table name)` for sources and
+        `("model", model name)` for models, all versions of a model included.
+        """
+        lineage = self._lineage.get(manifest_node)
+        if lineage is None:
+            lineage = {}
+            for dep_name in self.manifest.get(manifest_node) or {}:
+                key = get_lineage_key(dep_name)
+                if key is not None:
+                    lineage.setdefault(key, []).append(dep_name)
+            self._lineage[manifest_node] = lineage
+        return lineage
+
+    def get_test_coverage(self) -> CoverageIndex:
+        if self._test_coverage is None:
+            self._test_coverage = CoverageIndex(self.manifest)
+        return self._test_coverage
+
+    def get_lineage_graph(self) -> "LineageGraph":
+        if self._lineage_graph is None:
+            # Imported here, only a few hooks walk the transitive lineage.
+            from dbt_checkpoint.lineage_graph import LineageGraph
+
+            self._lineage_graph = LineageGraph(self.manifest)
+        return self._lineage_graph
+
+    def get_file_paths(self) -> PathTrie:
+        if self._file_paths is None:
+            self._file_paths = PathTrie()
+            for key, node in self.nodes.items():
+                file_path = node.get("original_file_path") or node.get("path")
+                if file_path:
+                    self._file_paths.add(file_path, key)
+        return self._file_paths
+
+    def get_property_paths(self) -> PathTrie:
+        if self._property_paths is None:
+            self._property_paths = PathTrie()
+            for key, node in self.nodes.items():
+                patch_path = node.get("patch_path")
+                if patch_path:
+                    self._property_paths.add(patch_path, key)
+        return self._property_paths
+
+    def get_unique_ids(self, section: str) -> Set[str]:
+        """`unique_id` of the entries of a manifest section, e.g. "sources"."""
+        unique_ids = self._unique_ids.get(section)
+        if unique_ids is None:
+            entries = self.manifest.get(section) or {}
+            unique_ids = {entry.get("unique_id") for entry in entries.values()}
+            self._unique_ids[section] = unique_ids
+        return unique_ids
+
+    def get_ref_ids(self) -> Dict[str, List[str]]:
+        """Ids of the models, seeds and snapshots by name, versions included."""
+        if self._ref_ids is None:
+            ref_ids: Dict[str, List[str]] = {}
+            for resource_type in REF_RESOURCE_TYPES:
+                for key, node in self.resource_types.get(resource_type, {}).items():
+                    name = node.get("name") or key.split(".")[-1]
+                    ref_ids.setdefault(name, []).append(key)
+            self._ref_ids = ref_ids
+        return self._ref_ids
+
+    def get_source_ids(self) -> Dict[Tuple[str, str], str]:
+        """Source id by (source name, table name), the first source wins."""
+        if self._source_ids is None:
+            source_ids: Dict[Tuple[str, str], str] = {}
+            sources = self.manifest.get("sources") or {}
+            for key, source in sources.items():
+                source_key = (source.get("source_name", ""), source.get("name", ""))
+                source_ids.setdefault(source_key, key)
+            self._source_ids = source_ids
+        return self._source_ids
+
+    def get_aliases(self) -> Dict[str, str]:
+        """Node id by alias, the first node in manifest order wins."""
+        if self._aliases is None:
+            aliases: Dict[str, str] = {}
+            for key, node in self.nodes.items():
+                alias = node.get("alias")
+                if alias is not None and alias not in aliases:
+                    aliases[alias] = key
+            self._aliases = aliases
+        return self._aliases
+
+    def get_source_relations(self) -> Dict[RelationKey, Tuple[int, str]]:
+        """
+        Source by every suffix of its `database.schema.identifier` relation
+        (`identifier`, `schema.identifier` and the fully qualified name), the
+        first source in manifest order wins. The source `name` is indexed as
+        well when it differs from its `identifier`.
+        """
+        if self._source_relations is None:
+            relations: Dict[RelationKey, Tuple[int, str]] = {}
+            sources = self.manifest.get("sources") or {}
+            for position, (key, source) in enumerate(sources.items()):
+                database = get_relation_part(source.get("database"))
+                schema = get_relation_part(source.get("schema"))
+                names = {
+                    get_relation_part(source.get("identifier")),
+                    get_relation_part(source.get("name")),
+                }
+                for name in names:
+                    if not name:
+                        continue
+                    suffixes: List[RelationKey] = [(name,)]
+                    if schema:
+                        suffixes.append((schema, name))
+                        if database:
+                            suffixes.append((database, schema, name))
+                    for suffix in suffixes:
+                        relations.setdefault(suffix, (position, key))
+            self._source_relations = relations
+        return self._source_relations
+
+    def get_model_matches(self, filenames: Set[str]) -> List[Tuple[str, str]]:
+        """(model id, matched filename) pairs in manifest order."""
+        matches = []
+        for filename in filenames:
+            for position, order, key in self.model_filenames.get(filename, []):
+                matches.append((position, order, key, filename))
+        matches.sort()
+        return [(key, filename) for _, _, key, filename in matches]
+
+    def get_ids_by_filename(
+        self, lookup: Dict[str, List[str]], filenames: Set[str]
+    ) -> List[str]:
+        """Node ids of `lookup` matching `filenames`, in manifest order."""
+        keys = [key for filename in filenames for key in lookup.get(filename, [])]
+        return sorted(keys, key=lambda key: self.positions.get(key, -1))
+
+    def get_node_id_from_file_path(self, file_path: str) -> Optional[str]:
+        """
+        Node whose `original_file_path` is the longest suffix of `file_path`.
+        The path passed by pre-commit is relative to the repository root,
+        which may differ from the dbt project root.
+        """
+        return self.pick_node_id(*self.get_file_paths().match(file_path))
+
+    def pick_node_id(self, keys: List[str], leading: List[str]) -> Optional[str]:
+        """
+        First of `keys` in manifest order, unless some are from a project or
+        package named like a directory of `leading`, the part of the path
+        above the dbt project in a monorepo.
+        """
+        if len(keys) > 1:
+            directories = set(leading)
+            in_directories = [
+                key
+                for key in keys
+                if get_project_name(key, self.nodes[key]) in directories
+            ]
+            keys = in_directories or keys
+        return min(keys, key=self.positions.__getitem__, default=None)
+
+
+def get_project_name(key: str, node: Dict[str, Any]) -> str:
+    """Package of a node, or the directory of its project for old manifests."""
+    root_path = node.get("root_path")
+    if root_path:
+        return split_path(root_path)[-1]
+    return node.get("package_name") or "".join(key.split(".")[1:2])
+
+
+def get_relation_part(identifier: Optional[str]) -> str:
+    """Unquoted and lowercased identifier, `""` when there is none."""
+    return (identifier or "").strip(IDENTIFIER_QUOTES).lower()
+
+
+def get_relation_key(relation: str) -> RelationKey:
+    """Relation key of a (possibly quoted) qualified name found in a script."""
+    return tuple(map(get_relation_part, relation.split(".")))
+
+
+def get_lineage_key(unique_id: str) -> Optional[LineageKey]:
+    # source.<package>.<source name>.<table name>
+    # model.<package>.<model name>[.<version>]
+    split_id = unique_id.split(".")
+    if split_id[0] == "source" and len(split_id) >= 3:
+        return ("source", split_id[-2], split_id[-1])
+    if split_id[0] == "model" and len(split_id) >= 2:
+        return ("model", split_id[2] if len(split_id) >= 3 else split_id[1])
+    return None
+
+
+_INDEX_CACHE: "OrderedDict[int, Tuple[Dict[str, Any], ManifestIndex]]" = OrderedDict()
+
+
+def get_manifest_index(manifest: Dict[str, Any]) -> ManifestIndex:
+    """
+    Return the index of `manifest`, building it on first use. The manifest
+    is kept referenced by the cache so its `id` cannot be reused.
+    """
+    entry = _INDEX_CACHE.get(id(manifest))
+    if entry is not None and entry[0] is manifest and entry[1].is_current(manifest):
+        _INDEX_CACHE.move_to_end(id(manifest))
+        return entry[1]
+    index = ManifestIndex(manifest)
+    _INDEX_CACHE[id(manifest)] = (manifest, index)
+    _INDEX_CACHE.move_to_end(id(manifest))
+    while len(_INDEX_CACHE) > INDEX_CACHE_SIZE:
+        _INDEX_CACHE.popitem(last=False)
+    return index
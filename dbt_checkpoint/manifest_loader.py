@@ -0,0 +1,173 @@
+import hashlib
+import json
+import re
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from typing import Any
+from typing import Collection
+from typing import Dict
+from typing import Iterator
+from typing import Mapping
+from typing import Optional
+from typing import TextIO
+
+from dbt_checkpoint.manifest_cache import paused_gc
+
+# Top-level key -> fields kept of every entry of that section, or None to
+# keep the whole section. Sections not listed are skipped.
+ManifestSelection = Mapping[str, Optional[Collection[str]]]
+
+# Characters read at once, the buffer grows for entries larger than this.
+CHUNK_SIZE = 1 << 20
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+DECODER = json.JSONDecoder()
+
+
+class JsonStream:
+    """
+    Incremental reader of a JSON document. Values are decoded one at a time
+    with the C accelerated scanner of the `json` module, so that only the
+    current part of the document is held in memory.
+    """
+
+    def __init__(self, file: TextIO):
+        self.file = file
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Read more of the document, False at the end of the file."""
+        if self.eof:
+            return False
+        start = self.pos
+        remaining = self.buffer[start:]
+        # Grow geometrically so that large values are not re-scanned
+        # for every chunk.
+        chunk = self.file.read(max(CHUNK_SIZE, len(remaining)))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = remaining + chunk
+        self.pos = 0
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+    def peek(self) -> str:
+        """Next non-whitespace character, "" at the end of the document."""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()  # type: ignore
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"Expecting {char!r}")
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number may continue in the next chunk.
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def decode_key(self) -> str:
+        if self.peek() != '"':
+            raise self._error("Expecting property name enclosed in double quotes")
+        while True:
+            try:
+                key, end = scanstring(self.buffer, self.pos + 1)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            self.pos = end
+            return key
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Keys of the object at the current position. The caller consumes the
+        value of every key before asking for the next one.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.decode_key()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                self.pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+    def skip_value(self) -> None:
+        """Decode and drop the current value, one entry at a time."""
+        if self.peek() == "{":
+            for _ in self.iter_object():
+                self.decode_value()
+        else:
+            self.decode_value()
+
+
+def select_fields(entry: Any, fields: Collection[str]) -> Any:
+    if isinstance(entry, dict):
+        return {field: entry[field] for field in fields if field in entry}
+    if isinstance(entry, list):
+        # e.g. the versions of a disabled node
+        return [select_fields(item, fields) for item in entry]
+    return entry
+
+
+def load_json_selection(
+    json_filename: str, selection: ManifestSelection
+) -> Dict[str, Any]:
+    """
+    Load the sections of a dbt artifact listed in `selection`. Entries are
+    decoded one by one and trimmed to the selected fields right away, so the
+    whole document is never materialized.
+    """
+    content: Dict[str, Any] = {}
+    with open(json_filename, encoding="utf-8") as file, paused_gc():
+        stream = JsonStream(file)
+        for key in stream.iter_object():
+            if key not in selection:
+                stream.skip_value()
+                continue
+            fields = selection[key]
+            if fields is None or stream.peek() != "{":
+                content[key] = stream.decode_value()
+            else:
+                content[key] = {
+                    entry_key: select_fields(stream.decode_value(), fields)
+                    for entry_key in stream.iter_object()
+                }
+        if stream.peek():
+            raise stream._error("Extra data")
+    return content
+
+
+def get_selection_key(selection: ManifestSelection) -> str:
+    """Short stable digest identifying `selection` in cache file names."""
+    normalized = sorted(
+        (key, None if fields is None else sorted(fields))
+        for key, fields in selection.items()
+    )
+    digest = hashlib.blake2b(repr(normalized).encode("utf-8"), digest_size=6)
+    return digest.hexdigest()
@@ -0,0 +1,148 @@
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from dbt_checkpoint.manifest_index import ManifestIndex
+from dbt_checkpoint.manifest_index import get_manifest_index
+from dbt_checkpoint.path_trie import split_path
+from dbt_checkpoint.sql_dependencies import Ref
+from dbt_checkpoint.sql_dependencies import SqlDependencies
+from dbt_checkpoint.sql_dependencies import extract_dependencies
+
+# Directory of the models of a dbt project, new SQL files below it are models.
+MODEL_PATH = "models"
+
+
+def resolve_ref(
+    index: ManifestIndex,
+    ref: Ref,
+    project: str,
+    new_ids: Dict[str, str],
+) -> str:
+    """
+    Id of the node a `ref()` resolves to: the given version, else the latest
+    one. Refs to unknown nodes resolve to the id the model would have.
+    """
+    if ref.package is None and ref.name in new_ids:
+        return new_ids[ref.name]
+    candidates = [
+        key
+        for key in index.get_ref_ids().get(ref.name, [])
+        if ref.package is None or key.split(".")[1] == ref.package
+    ]
+    for key in candidates:
+        version = index.nodes[key].get("version")
+        latest_version = index.nodes[key].get("latest_version")
+        if ref.version is None:
+            if version is None or str(version) == str(latest_version):
+                return key
+        elif str(version) == ref.version:
+            return key
+    if candidates and ref.version is None:
+        return candidates[0]
+    unique_id = f"model.{ref.package or project}.{ref.name}"
+    return unique_id if ref.version is None else f"{unique_id}.v{ref.version}"
+
+
+def resolve_source(index: ManifestIndex, source: Tuple[str, str], project: str) -> str:
+    source_id = index.get_source_ids().get(source)
+    return source_id or f"source.{project}.{source[0]}.{source[1]}"
+
+
+def get_new_node(path: str, project: str) -> Dict[str, Any]:
+    """Node of a model missing from the manifest, e.g. added in this commit."""
+    name = Path(path).stem
+    parts = split_path(path)
+    # relative to the project, from the first `models` directory
+    model_path = parts.index(MODEL_PATH)
+    original_file_path = "/".join(parts[model_path:])
+    return {
+        "unique_id": f"model.{project}.{name}",
+        "resource_type": "model",
+        "package_name": project,
+        "name": name,
+        "path": original_file_path.split("/", 1)[1],
+        "original_file_path": original_file_path,
+        "config": {"enabled": True},
+        "depends_on": {"macros": [], "nodes": []},
+    }
+
+
+def apply_static_dependencies(
+    manifest: Dict[str, Any], paths: Sequence[str]
+) -> Dict[str, Any]:
+    """
+    Manifest with the `ref()`, `source()` and `config()` calls of the SQL
+    files in `paths` read from the files, without `dbt parse`. The edges
+    of `depends_on`, `parent_map` and `child_map` are replaced for these
+    files only. When a file calls them with arguments that are not
+    literals, the edges read are added to those of the manifest instead.
+    New models get a node of their own.
+
+    `manifest` is not modified, it may be shared with other hooks.
+    """
+    index = get_manifest_index(manifest)
+    project = (manifest.get("metadata") or {}).get("project_name", "")
+    changes: List[Tuple[str, Dict[str, Any], SqlDependencies]] = []
+    new_ids: Dict[str, str] = {}
+    for path in paths:
+        if Path(path).suffix.lower() != ".sql":
+            continue
+        try:
+            sql = Path(path).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        node_id = index.get_node_id_from_file_path(path)
+        if node_id is not None:
+            node = index.nodes[node_id]
+        elif MODEL_PATH in split_path(path)[:-1] and "{% macro" not in sql:
+            node = get_new_node(path, project)
+            node_id = new_ids[node["name"]] = node["unique_id"]
+        else:
+            continue
+        changes.append((node_id, node, extract_dependencies(sql)))
+    if not changes:
+        return manifest
+
+    overlay = {**manifest, "nodes": {**index.nodes}}
+    parent_map: Optional[Dict[str, List[str]]] = None
+    child_map: Optional[Dict[str, List[str]]] = None
+    if "parent_map" in manifest:
+        parent_map = overlay["parent_map"] = {**(manifest["parent_map"] or {})}
+    if "child_map" in manifest:
+        child_map = overlay["child_map"] = {**(manifest["child_map"] or {})}
+    for node_id, node, dependencies in changes:
+        package = node.get("package_name") or project
+        depends_on = node.get("depends_on") or {}
+        old_parents: List[str] = depends_on.get("nodes") or []
+        parents = [
+            resolve_ref(index, ref, package, new_ids) for ref in dependencies.refs
+        ]
+        parents.extend(
+            resolve_source(index, source, package) for source in dependencies.sources
+        )
+        if dependencies.dynamic:
+            parents = old_parents + parents
+        parents = list(dict.fromkeys(parents))
+        overlay["nodes"][node_id] = {
+            **node,
+            "config": {**(node.get("config") or {}), **dependencies.config},
+            "depends_on": {**depends_on, "nodes": parents},
+        }
+        if parent_map is not None:
+            old_parents = parent_map.get(node_id, old_parents)
+            parent_map[node_id] = parents
+        if child_map is not None:
+            child_map.setdefault(node_id, [])
+            for parent in set(old_parents) - set(parents):
+                children = child_map.get(parent) or []
+                child_map[parent] = [child for child in children if child != node_id]
+            for parent in parents:
+                children = child_map.get(parent) or []
+                if node_id not in children:
+                    child_map[parent] = [*children, node_id]
+    return overlay
@@ -0,0 +1,44 @@
+import math
+import os
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Sequence
+from typing import Tuple
+from typing import TypeVar
+
+R = TypeVar("R")
+
+# With `--jobs 0` (auto), every process gets at least this many files:
+# starting a pool costs more than checking a handful of scripts.
+MIN_FILES_PER_JOB = 64
+# Chunks sent to each process, more chunks balance uneven file sizes.
+CHUNKS_PER_JOB = 4
+
+
+def get_jobs(jobs: int, n_items: int) -> int:
+    """Number of processes to check `n_items` files with, 0 picks it."""
+    if jobs <= 0:
+        jobs = min(os.cpu_count() or 1, n_items // MIN_FILES_PER_JOB)
+    return max(1, min(jobs, n_items))
+
+
+def map_in_processes(
+    func: Callable[..., R], items: Sequence[Tuple[Any, ...]], jobs: int = 0
+) -> List[R]:
+    """
+    `[func(*item) for item in items]`, computed by a pool of `jobs`
+    processes when there are enough items. Results keep the order of
+    `items`, so hooks print them in the same order whatever the number of
+    processes. `func` and `items` must be picklable and `func` should not
+    print: the output of the processes would interleave.
+    """
+    jobs = get_jobs(jobs, len(items))
+    if jobs == 1:
+        return [func(*item) for item in items]
+    # multiprocessing is slow to import, most runs never start a pool.
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = math.ceil(len(items) / (jobs * CHUNKS_PER_JOB))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(func, *zip(*items), chunksize=chunksize))
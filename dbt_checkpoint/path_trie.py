@@ -0,0 +1,86 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+# Key of the values of a trie node, path components are never empty.
+VALUES = ""
+
+
+def split_path(path: str) -> List[str]:
+    """Components of a POSIX, Windows or `project://` path."""
+    path = str(path).replace("\\", "/").split("://", 1)[-1]
+    return [part for part in path.split("/") if part and part != "."]
+
+
+class PathTrie:
+    """
+    Values by path, in a trie of the path components from the file name up
+    to the root. A path looked up resolves to the values of the longest
+    added path it ends with, in O(path depth): absolute and repository
+    relative paths both resolve to the paths of a dbt project, and only
+    whole components match.
+
+    Nodes are dicts of components. A component only one added path goes
+    through holds a `(components left, values)` leaf instead of a chain of
+    nodes: most file names of a project are unique.
+    """
+
+    def __init__(self) -> None:
+        self.root: Dict[str, Any] = {}
+
+    def add(self, path: str, value: str) -> None:
+        parts = split_path(path)[::-1]
+        if not parts:
+            return
+        node = self.root
+        for position, part in enumerate(parts, 1):
+            rest = tuple(parts[position:])
+            entry = node.get(part)
+            if entry is None:
+                node[part] = (rest, [value])
+                return
+            if isinstance(entry, tuple):
+                leaf_rest, leaf_values = entry
+                if leaf_rest == rest:
+                    leaf_values.append(value)
+                    return
+                # the leaf moves one component down, below a new node
+                entry = node[part] = {}
+                if leaf_rest:
+                    entry[leaf_rest[0]] = (leaf_rest[1:], leaf_values)
+                else:
+                    entry[VALUES] = leaf_values
+            node = entry
+        node.setdefault(VALUES, []).append(value)
+
+    def match(self, path: str) -> Tuple[List[str], List[str]]:
+        """
+        Values of the longest added path `path` ends with, in the order
+        they were added, and the leading components of `path` it did not
+        match, e.g. the directory of the dbt project in a monorepo.
+        """
+        parts = split_path(path)
+        reversed_parts = parts[::-1]
+        node = self.root
+        values: List[str] = []
+        matched = 0
+        for position, part in enumerate(reversed_parts, 1):
+            entry = node.get(part)
+            if entry is None:
+                break
+            if isinstance(entry, tuple):
+                leaf_rest, leaf_values = entry
+                stop = position + len(leaf_rest)
+                if tuple(reversed_parts[position:stop]) == leaf_rest:
+                    values, matched = leaf_values, stop
+                break
+            node = entry
+            if VALUES in node:
+                values, matched = node[VALUES], position
+        leading = len(parts) - matched
+        return values, parts[:leading]
+
+    def find(self, path: str) -> List[str]:
+        """Values of the longest added path `path` ends with."""
+        return self.match(path)[0]
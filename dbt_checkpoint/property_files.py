@@ -0,0 +1,78 @@
+import os
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+# Top-level keys of a dbt property file
+PROPERTY_SECTIONS = ("models", "macros", "sources", "exposures", "seeds", "snapshots")
+
+
+def safe_load(stream: Any) -> Any:
+    """`yaml.safe_load`, using the libyaml bindings when they are available."""
+    # yaml is imported on first use, hooks that only read JSON or SQL
+    # files start faster without it.
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
+@dataclass
+class PropertyFile:
+    path: Path
+    # (mtime in ns, size in bytes) of the parsed file
+    fingerprint: Tuple[int, int]
+    content: Dict[str, Any]
+    models: List[Any] = field(default_factory=list)
+    macros: List[Any] = field(default_factory=list)
+    sources: List[Any] = field(default_factory=list)
+    exposures: List[Any] = field(default_factory=list)
+    seeds: List[Any] = field(default_factory=list)
+    snapshots: List[Any] = field(default_factory=list)
+
+
+class PropertyFileIndex:
+    """
+    Parsed dbt property files (`schema.yml`), each parsed once and shared by
+    the schema getters of `dbt_checkpoint.utils`. A file is parsed again as
+    soon as its mtime or size changes.
+    """
+
+    def __init__(self) -> None:
+        self.files: Dict[str, PropertyFile] = {}
+
+    def get(self, path: Union[str, Path]) -> PropertyFile:
+        stat = os.stat(path)
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        key = os.fspath(path)
+        property_file = self.files.get(key)
+        if property_file is None or property_file.fingerprint != fingerprint:
+            property_file = self.files[key] = self._parse(Path(path), fingerprint)
+        return property_file
+
+    @staticmethod
+    def _parse(path: Path, fingerprint: Tuple[int, int]) -> PropertyFile:
+        with open(path, "rb") as file:
+            content = safe_load(file) or {}
+        if not isinstance(content, dict):
+            content = {}
+        sections = {}
+        for section in PROPERTY_SECTIONS:
+            entries = content.get(section)
+            sections[section] = entries if isinstance(entries, list) else []
+        return PropertyFile(
+            path=path, fingerprint=fingerprint, content=content, **sections
+        )
+
+
+_PROPERTY_FILE_INDEX = PropertyFileIndex()
+
+
+def get_property_file(path: Union[str, Path]) -> PropertyFile:
+    """Parse `path` through the process-wide property file index."""
+    return _PROPERTY_FILE_INDEX.get(path)
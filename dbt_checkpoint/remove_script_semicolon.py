@@ -3,14 +3,21 @@ import os
 import time
 from typing import Optional, Sequence
 
-from dbt_checkpoint.check_script_semicolon import check_semicolon
+from dbt_checkpoint.check_script_semicolon import check_file_semicolon
+from dbt_checkpoint.parallel import map_in_processes
 from dbt_checkpoint.tracking import dbtCheckpointTracking
-from dbt_checkpoint.utils import JsonOpenError, add_default_args, get_dbt_manifest
+from dbt_checkpoint.utils import (
+    JsonOpenError,
+    add_default_args,
+    add_jobs_args,
+    get_dbt_manifest,
+)
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_default_args(parser)
+    add_jobs_args(parser)
 
     args = parser.parse_args(argv)
     status_code = 0
@@ -23,12 +30,15 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     start_time = time.time()
 
-    for filename in args.filenames:
-        with open(filename, "rb+") as file_obj:
-            status_code_file = check_semicolon(file_obj, replace=True)
-            if status_code_file:
-                print(f"Replacing semicolon in {filename}.")
-                status_code = status_code_file
+    status_codes = map_in_processes(
+        check_file_semicolon,
+        [(filename, True) for filename in args.filenames],
+        args.jobs,
+    )
+    for filename, status_code_file in zip(args.filenames, status_codes):
+        if status_code_file:
+            print(f"Replacing semicolon in {filename}.")
+            status_code = status_code_file
 
     end_time = time.time()
     script_args = vars(args)
@@ -6,45 +6,57 @@ import time
 from pathlib import Path
 from typing import Any, Dict, Generator, Optional, Sequence, Set, Tuple
 
-from dbt_checkpoint.check_script_has_no_table_name import has_table_name
+from dbt_checkpoint.check_script_has_no_table_name import find_table_names
+from dbt_checkpoint.manifest_index import get_manifest_index, get_relation_key
+from dbt_checkpoint.parallel import map_in_processes
+from dbt_checkpoint.sql_lexer import tokenize
 from dbt_checkpoint.tracking import dbtCheckpointTracking
-from dbt_checkpoint.utils import JsonOpenError, add_default_args, get_dbt_manifest
+from dbt_checkpoint.utils import (
+    JsonOpenError,
+    add_default_args,
+    add_jobs_args,
+    get_dbt_manifest,
+)
 
 
 def get_ref_from_name(
     manifest: Dict[str, Any], tables: Set[str]
 ) -> Generator[Tuple[str, str], None, None]:
     table_names = {table.split(".")[-1]: table for table in tables}
-    models = manifest.get("nodes", {})
-    for _, value in models.items():
-        # model name has to be unique
-        model_name = value.get("alias")
-        table = table_names.pop(model_name, None)
-        if table:
-            tables.remove(table)
-            model_ref = "{{ ref('%s') }}" % model_name
-            yield (table, model_ref)
+    index = get_manifest_index(manifest)
+    aliases = index.get_aliases()
+    # model name has to be unique, tables are replaced in manifest order
+    model_names = sorted(
+        (name for name in table_names if name in aliases),
+        key=lambda name: index.positions[aliases[name]],
+    )
+    for model_name in model_names:
+        table = table_names[model_name]
+        tables.remove(table)
+        model_ref = "{{ ref('%s') }}" % model_name
+        yield (table, model_ref)
 
 
 def get_source_from_name(
     manifest: Dict[str, Any], tables: Set[str]
 ) -> Generator[Tuple[str, str], None, None]:
     if tables:
-        table_names = {table: set(table.split(".")) for table in tables}
         sources = manifest.get("sources", {})
-        for _, value in sources.items():
-            source = {value.get("database"), value.get("schema"), value.get("name")}
-            table = None  # pragma: no mutate
-            for table_name, table_split in table_names.items():
-                if source.issuperset(table_split):
-                    table = table_name
-            if table:
-                tables.remove(table)
-                source_ref = "{{ source('%s', '%s') }}" % (
-                    value.get("source_name"),
-                    value.get("name"),
-                )
-                yield (table, source_ref)
+        relations = get_manifest_index(manifest).get_source_relations()
+        matches = []
+        for table in tables:
+            match = relations.get(get_relation_key(table))
+            if match is not None:
+                matches.append((*match, table))
+        # tables are replaced in the manifest order of their sources
+        for _, source_id, table in sorted(matches):
+            tables.remove(table)
+            value = sources[source_id]
+            source_ref = "{{ source('%s', '%s') }}" % (
+                value.get("source_name"),
+                value.get("name"),
+            )
+            yield (table, source_ref)
 
 
 def get_unknown_source(tables: Set[str]) -> Generator[Tuple[str, str], None, None]:
@@ -65,9 +77,33 @@ def get_unknown_source(tables: Set[str]) -> Generator[Tuple[str, str], None, Non
             print(f"Unable to replace table {table} with ref or source.")
 
 
+def replace_table_names(sql: str, replacements: Dict[str, str]) -> str:
+    """
+    Replace the (lowercased) table names of `replacements` surrounded by
+    whitespace, all at once and regardless of their case in `sql`.
+    """
+    if not replacements:
+        return sql
+    # Longest first, so that a table name never shadows a longer one.
+    names = sorted(replacements, key=len, reverse=True)
+    pattern = re.compile(
+        r"(?<=[\\\s])(%s)(?=[\\\s])" % "|".join(map(re.escape, names)),
+        re.IGNORECASE,
+    )
+    return pattern.sub(
+        lambda match: replacements.get(match.group(1).lower(), match.group(1)), sql
+    )
+
+
+def find_script_table_names(filename: str) -> Tuple[str, Set[str]]:
+    sql = Path(filename).read_text(encoding="utf-8")
+    return sql, find_table_names(tokenize(sql))
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_default_args(parser)
+    add_jobs_args(parser)
 
     args = parser.parse_args(argv)
 
@@ -80,22 +116,23 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     status_code = 0
 
     start_time = time.time()
-    for filename in args.filenames:
-        file = Path(filename)
-        sql = file.read_text(encoding="utf-8")
-        status_code_file, tables = has_table_name(sql, filename)
-        if status_code_file:
-            status_code = status_code_file
+    # Scripts are tokenized by a pool of processes, their table names are
+    # resolved against the manifest index of this process.
+    scripts = map_in_processes(
+        find_script_table_names,
+        [(filename,) for filename in args.filenames],
+        args.jobs,
+    )
+    for filename, (sql, tables) in zip(args.filenames, scripts):
+        if tables:
+            status_code = 1
             to_replace = itertools.chain(
                 get_ref_from_name(manifest, tables),
                 get_source_from_name(manifest, tables),
                 get_unknown_source(tables),
             )
-            for replacement in to_replace:
-                old = r"([\\\s\n\r\t])" + replacement[0] + r"([\\\s\n\r\t])"
-                new = r"\1" + replacement[1] + r"\2"
-                sql = re.sub(old, new, sql, re.IGNORECASE)
-            file.write_text(sql, encoding="utf-8")
+            sql = replace_table_names(sql, dict(to_replace))
+            Path(filename).write_text(sql, encoding="utf-8")
     end_time = time.time()
     script_args = vars(args)
 
@@ -0,0 +1,171 @@
+import argparse
+import contextlib
+import hashlib
+import io
+import marshal
+import sys
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from dbt_checkpoint import __version__
+from dbt_checkpoint.manifest_cache import get_cache_dir
+from dbt_checkpoint.manifest_cache import read_marshal
+from dbt_checkpoint.manifest_cache import write_marshal
+from dbt_checkpoint.utils import get_checkpoint_config
+from dbt_checkpoint.utils import get_dbt_manifest_path
+
+RESULTS_DIR_NAME = "results"
+# Bump when the layout of the entries changes.
+RESULT_CACHE_VERSION = 1
+# Entries not used for this many seconds are evicted.
+RESULT_MAX_AGE = 7 * 24 * 3600
+# Number of entries kept per hook and arguments, least recently used first out.
+RESULT_MAX_ENTRIES = 20_000
+# Cache files of arguments no longer used are removed when the results
+# directory grows over this many bytes, oldest first.
+RESULTS_DIR_MAX_BYTES = 64 << 20
+# The last use of an entry is only written back once per period.
+LAST_USED_RESOLUTION = 24 * 3600
+
+# entry key -> (last used, status code, printed output)
+Entries = Dict[str, Tuple[float, int, str]]
+
+
+class HookResultCache:
+    """
+    Results of a hook for single files, keyed on the content of the file and
+    any other input of the check, so that unchanged files replay the output
+    of a previous run instead of being evaluated again.
+
+    Entries are stored in `target/.dbt-checkpoint-cache/results/`, one file
+    per hook and set of arguments.
+    """
+
+    def __init__(self, cache_file: Optional[Path]):
+        # No cache file disables the cache, every file is evaluated.
+        self.cache_file = cache_file
+        self._entries: Optional[Entries] = None
+        self._updated: Entries = {}
+
+    @property
+    def entries(self) -> Entries:
+        if self._entries is None:
+            entries = read_marshal(self.cache_file) if self.cache_file else None
+            self._entries = entries if isinstance(entries, dict) else {}
+        return self._entries
+
+    @staticmethod
+    def get_key(filename: str, content: bytes, *inputs: Any) -> str:
+        """
+        Key of a file, `inputs` are additional marshallable inputs of the
+        check, e.g. the manifest nodes the file maps to.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        # The filename is part of the printed output.
+        digest.update(filename.encode("utf-8", "surrogateescape"))
+        digest.update(b"\0")
+        digest.update(content)
+        if inputs:
+            try:
+                digest.update(marshal.dumps(inputs))
+            except ValueError:
+                # e.g. dates parsed from a property file
+                digest.update(repr(inputs).encode("utf-8", "surrogateescape"))
+        return digest.hexdigest()
+
+    @classmethod
+    def get_file_key(cls, path: Union[str, Path], *inputs: Any) -> str:
+        """`get_key` of the file at `path`, read from disk."""
+        try:
+            content = Path(path).read_bytes()
+        except OSError:
+            content = b""
+        return cls.get_key(str(path), content, *inputs)
+
+    def run(self, key: str, evaluate: Callable[[], int]) -> int:
+        """
+        Replay the output and status code stored under `key`, or call
+        `evaluate` and store what it prints and returns.
+        """
+        if self.cache_file is None:
+            return evaluate()
+        now = time.time()
+        entry = self.entries.get(key)
+        if entry is not None:
+            last_used, status_code, output = entry
+            sys.stdout.write(output)
+            if now - last_used > LAST_USED_RESOLUTION:
+                self._updated[key] = (now, status_code, output)
+            return status_code
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            status_code = evaluate()
+        output = buffer.getvalue()
+        sys.stdout.write(output)
+        self.entries[key] = self._updated[key] = (now, status_code, output)
+        return status_code
+
+    def save(self) -> None:
+        """Write new entries, merged with those written meanwhile."""
+        if self.cache_file is None or not self._updated:
+            return
+        entries = read_marshal(self.cache_file)
+        if not isinstance(entries, dict):
+            entries = {}
+        entries.update(self._updated)
+        min_last_used = time.time() - RESULT_MAX_AGE
+        kept = sorted(
+            (item for item in entries.items() if item[1][0] >= min_last_used),
+            key=lambda item: item[1][0],
+        )[-RESULT_MAX_ENTRIES:]
+        try:
+            write_marshal(self.cache_file, dict(kept))
+            evict_cache_files(self.cache_file.parent, self.cache_file)
+        except (OSError, ValueError):
+            # Caching is best effort only, e.g. `target/` can be read-only.
+            return
+        self._updated = {}
+
+
+def evict_cache_files(results_dir: Path, current: Path) -> None:
+    """Remove the least recently written cache files over the size budget."""
+    cache_files = []
+    for cache_file in results_dir.glob("*.marshal"):
+        try:
+            stat = cache_file.stat()
+        except FileNotFoundError:
+            continue
+        cache_files.append((stat.st_mtime, stat.st_size, cache_file))
+    total_size = sum(size for _, size, _ in cache_files)
+    for _, size, cache_file in sorted(cache_files):
+        if total_size <= RESULTS_DIR_MAX_BYTES:
+            break
+        if cache_file != current:
+            cache_file.unlink(missing_ok=True)
+            total_size -= size
+
+
+def get_result_cache(hook_id: str, args: argparse.Namespace) -> HookResultCache:
+    """
+    Result cache of `hook_id` called with `args`, disabled together with the
+    manifest cache by `disable-cache` in .dbt-checkpoint.yaml.
+    """
+    config = get_checkpoint_config(args.config)
+    if config.disable_cache:
+        return HookResultCache(None)
+    hook_args = {
+        key: value
+        for key, value in sorted(vars(args).items())
+        if key not in ("filenames", "is_test", "jobs")
+    }
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(repr((RESULT_CACHE_VERSION, __version__, hook_args)).encode("utf-8"))
+    manifest_path = get_dbt_manifest_path(args, config)
+    results_dir = get_cache_dir(manifest_path) / RESULTS_DIR_NAME
+    return HookResultCache(results_dir / f"{hook_id}-{digest.hexdigest()}.marshal")
@@ -0,0 +1,255 @@
+import argparse
+import contextlib
+import importlib
+import io
+import pkgutil
+import re
+import sys
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import dbt_checkpoint
+from dbt_checkpoint.file_index import reset_file_indexes
+from dbt_checkpoint.manifest_cache import shared_artifacts
+from dbt_checkpoint.utils import add_config_args
+from dbt_checkpoint.utils import add_filenames_args
+from dbt_checkpoint.utils import CheckpointConfig
+from dbt_checkpoint.utils import red
+
+HOOK_MODULE_PREFIXES = (
+    "check_",
+    "dbt_",
+    "generate_",
+    "remove_",
+    "replace_",
+    "unify_",
+)
+STATUS_LINE_WIDTH = 79
+HOOK_DEFINITIONS_FILE = ".pre-commit-hooks.yaml"
+# Subset of the `identify` tags used by the hook definitions.
+FILE_TYPE_EXTENSIONS = {
+    "sql": (".sql",),
+    "yaml": (".yml", ".yaml"),
+}
+
+
+@dataclass
+class HookConfig:
+    hook_id: str
+    args: List[str] = field(default_factory=list)
+    files: str = ""
+    exclude: str = ""
+    pass_filenames: bool = True
+
+
+@dataclass
+class HookFilter:
+    files: str = ""
+    types: Tuple[str, ...] = ()
+    types_or: Tuple[str, ...] = ()
+
+
+@dataclass
+class HookResult:
+    hook_id: str
+    status_code: int
+    duration: float
+    output: str
+
+
+def get_hook_ids() -> List[str]:
+    """Ids of all hooks shipped with dbt-checkpoint, e.g. `check-model-tags`."""
+    return sorted(
+        module.name.replace("_", "-")
+        for module in pkgutil.iter_modules(dbt_checkpoint.__path__)
+        if module.name.startswith(HOOK_MODULE_PREFIXES)
+    )
+
+
+def get_hook_definitions_path() -> Optional[Path]:
+    """
+    Location of .pre-commit-hooks.yaml, installed as data file next to the
+    package or at the root of a source checkout.
+    """
+    candidates = (
+        Path(sys.prefix) / "share" / "dbt-checkpoint" / HOOK_DEFINITIONS_FILE,
+        Path(dbt_checkpoint.__file__).parent.parent / HOOK_DEFINITIONS_FILE,
+    )
+    return next((path for path in candidates if path.exists()), None)
+
+
+@lru_cache(maxsize=None)
+def get_hook_filters() -> Dict[str, HookFilter]:
+    """
+    Default `files`, `types` and `types_or` of every hook, the same filters
+    pre-commit applies when the hook runs on its own.
+    """
+    path = get_hook_definitions_path()
+    if path is None:
+        return {}
+    import yaml
+
+    with path.open() as file:
+        definitions = yaml.safe_load(file) or []
+    return {
+        definition["id"]: HookFilter(
+            files=definition.get("files", ""),
+            types=tuple(definition.get("types", ())),
+            types_or=tuple(definition.get("types_or", ())),
+        )
+        for definition in definitions
+    }
+
+
+def has_file_type(filename: str, file_type: str) -> bool:
+    if file_type in ("file", "text"):
+        return True
+    return filename.lower().endswith(FILE_TYPE_EXTENSIONS.get(file_type, ()))
+
+
+def match_hook_filter(hook_filter: HookFilter, filename: str) -> bool:
+    if hook_filter.files and not re.search(hook_filter.files, filename):
+        return False
+    if not all(has_file_type(filename, type_) for type_ in hook_filter.types):
+        return False
+    return not hook_filter.types_or or any(
+        has_file_type(filename, type_) for type_ in hook_filter.types_or
+    )
+
+
+def get_hooks_config(
+    config: CheckpointConfig, hook_ids: Optional[Sequence[str]] = None
+) -> List[HookConfig]:
+    """
+    Hooks to run, taken from the `hooks` key of .dbt-checkpoint.yaml.
+    Entries mirror pre-commit hooks (`id`, `args`, `files`, `exclude`,
+    `pass_filenames`), a plain string is accepted as a shortcut for `id`.
+    `hook_ids` limits the run to the given hooks, in the given order.
+    """
+    configured = []
+    for entry in config.hooks:
+        if isinstance(entry, str):
+            entry = {"id": entry}
+        configured.append(
+            HookConfig(
+                hook_id=entry["id"],
+                args=[str(arg) for arg in entry.get("args", [])],
+                files=entry.get("files", ""),
+                exclude=entry.get("exclude", ""),
+                pass_filenames=entry.get("pass_filenames", True),
+            )
+        )
+    if not hook_ids:
+        return configured
+    by_id = {hook.hook_id: hook for hook in configured}
+    return [by_id.get(hook_id, HookConfig(hook_id)) for hook_id in hook_ids]
+
+
+def filter_filenames(hook: HookConfig, filenames: Sequence[str]) -> List[str]:
+    """
+    Files passed to `hook`: the hook's own filter from .pre-commit-hooks.yaml
+    first, then `files` and `exclude` from .dbt-checkpoint.yaml.
+    """
+    hook_filter = get_hook_filters().get(hook.hook_id, HookFilter())
+    files_re = re.compile(hook.files) if hook.files else None
+    exclude_re = re.compile(hook.exclude) if hook.exclude else None
+    return [
+        filename
+        for filename in filenames
+        if match_hook_filter(hook_filter, filename)
+        and (files_re is None or files_re.search(filename))
+        and (exclude_re is None or not exclude_re.search(filename))
+    ]
+
+
+def run_hook(
+    hook: HookConfig, filenames: Sequence[str], config_path: str
+) -> HookResult:
+    argv = filter_filenames(hook, filenames) if hook.pass_filenames else []
+    argv.extend(hook.args)
+    if "--config" not in hook.args:
+        argv.extend(["--config", config_path])
+
+    output = io.StringIO()
+    start_time = time.time()
+    with contextlib.redirect_stdout(output):
+        try:
+            module = importlib.import_module(
+                f"dbt_checkpoint.{hook.hook_id.replace('-', '_')}"
+            )
+            status_code = module.main(argv)
+        except SystemExit as e:
+            # argparse exits on invalid arguments
+            status_code = e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            print(f"Hook {red(hook.hook_id)} failed: {e}")
+            status_code = 1
+    end_time = time.time()
+    return HookResult(
+        hook_id=hook.hook_id,
+        status_code=status_code or 0,
+        duration=end_time - start_time,
+        output=output.getvalue(),
+    )
+
+
+def print_result(result: HookResult) -> None:
+    status = "Passed" if result.status_code == 0 else red("Failed")
+    label = f"{result.hook_id} ({result.duration:.2f}s)"
+    dots = "." * max(STATUS_LINE_WIDTH - len(label) - len("Passed"), 1)
+    print(f"{label}{dots}{status}")
+    if result.status_code != 0:
+        print(f"- exit code: {result.status_code}")
+    if result.output:
+        print(result.output.rstrip("\n"))
+
+
+def run_hooks(
+    hooks: Sequence[HookConfig],
+    filenames: Sequence[str],
+    config_path: str,
+    print_results: bool = True,
+) -> List[HookResult]:
+    """
+    Run `hooks` one after another in this process. dbt artifacts are parsed
+    once and shared by all the hooks.
+    """
+    known_ids = set(get_hook_ids())
+    # The tree is walked again for every run, e.g. in a long-lived daemon.
+    reset_file_indexes()
+    results = []
+    with shared_artifacts():
+        for hook in hooks:
+            if hook.hook_id not in known_ids:
+                result = HookResult(
+                    hook_id=hook.hook_id,
+                    status_code=1,
+                    duration=0.0,
+                    output=f"Unknown hook {red(hook.hook_id)}.\n",
+                )
+            else:
+                result = run_hook(hook, filenames, config_path)
+            if print_results:
+                print_result(result)
+            results.append(result)
+    return results
+
+
+def add_run_args(parser: argparse.ArgumentParser) -> None:
+    add_filenames_args(parser)
+    add_config_args(parser)
+    parser.add_argument(
+        "--hook",
+        action="append",
+        dest="hooks",
+        help="""Id of a hook to run, can be repeated. Defaults to all the hooks
+        listed under the `hooks` key of .dbt-checkpoint.yaml.""",
+    )
@@ -0,0 +1,160 @@
+import ast
+import re
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+REGEX_JINJA_COMMENTS = re.compile(r"{#.*?#}", re.DOTALL)
+REGEX_JINJA_BLOCK_START = re.compile(r"{{|{%")
+JINJA_BLOCK_ENDS = {"{{": "}}", "{%": "%}"}
+# `ref(`, `source(` or `config(`, not `config.get(` or `my_ref(`
+REGEX_CALLS = re.compile(r"(?<![\w.])(ref|source|config)\s*\(")
+JINJA_CONSTANTS = {"true": True, "false": False, "none": None}
+
+
+class Ref(NamedTuple):
+    package: Optional[str]
+    name: str
+    version: Optional[str]
+
+
+@dataclass
+class SqlDependencies:
+    """
+    `ref()`, `source()` and `config()` calls of a model, read without
+    rendering its Jinja. `dynamic` is set when some call has arguments that
+    are not literals, e.g. `ref(var("model"))`: the calls read are then
+    only part of the dependencies of the model.
+    """
+
+    refs: List[Ref] = field(default_factory=list)
+    sources: List[Tuple[str, str]] = field(default_factory=list)
+    config: Dict[str, Any] = field(default_factory=dict)
+    dynamic: bool = False
+
+
+def get_literal(node: ast.expr) -> Any:
+    """Python literal, with Jinja `true`/`false`/`none`."""
+    if isinstance(node, ast.Name) and node.id.lower() in JINJA_CONSTANTS:
+        return JINJA_CONSTANTS[node.id.lower()]
+    if isinstance(node, ast.List):
+        return [get_literal(element) for element in node.elts]
+    if isinstance(node, ast.Dict):
+        if None in node.keys:
+            raise ValueError("`**` in a dict")
+        return {
+            get_literal(key): get_literal(value)  # type: ignore
+            for key, value in zip(node.keys, node.values)
+        }
+    return ast.literal_eval(node)
+
+
+def find_end(text: str, start: int, closing: str) -> int:
+    """
+    Position of the first `closing` after `start` that is neither quoted
+    nor inside brackets opened after `start`, -1 when there is none.
+    """
+    depth, quote = 0, ""
+    for position in range(start, len(text)):
+        char = text[position]
+        if quote:
+            if char == quote and text[position - 1] != "\\":
+                quote = ""
+        elif char in "'\"":
+            quote = char
+        elif not depth and text.startswith(closing, position):
+            return position
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth = max(depth - 1, 0)
+    return -1
+
+
+def iter_blocks(sql: str) -> Iterator[str]:
+    """Content of the `{{ ... }}` and `{% ... %}` blocks of `sql`."""
+    sql = REGEX_JINJA_COMMENTS.sub("", sql)
+    position = 0
+    while True:
+        match = REGEX_JINJA_BLOCK_START.search(sql, position)
+        if match is None:
+            return
+        start, closing = match.end(), JINJA_BLOCK_ENDS[match.group()]
+        end = find_end(sql, start, closing)
+        if end == -1:
+            # unbalanced quotes or brackets, end at the first delimiter
+            end = sql.find(closing, start)
+        if end == -1:
+            yield sql[start:]
+            return
+        yield sql[start:end]
+        position = end + len(closing)
+
+
+def iter_calls(sql: str) -> Iterator[Tuple[str, str]]:
+    """(function, arguments) of the calls in the Jinja blocks of `sql`."""
+    for block in iter_blocks(sql):
+        for call in REGEX_CALLS.finditer(block):
+            start = call.end()
+            end = find_end(block, start, ")")
+            # unbalanced calls get the rest of the block
+            yield call.group(1), block[start:] if end == -1 else block[start:end]
+
+
+def get_arguments(arguments: str) -> Tuple[List[Any], Dict[str, Any]]:
+    """Literal positional and keyword arguments, `ValueError` otherwise."""
+    try:
+        call = ast.parse(f"f({arguments})", mode="eval").body
+    except SyntaxError as e:
+        raise ValueError(e)
+    if not isinstance(call, ast.Call):
+        raise ValueError(arguments)
+    args = [get_literal(arg) for arg in call.args]
+    kwargs = {}
+    for keyword in call.keywords:
+        if keyword.arg is None:
+            raise ValueError(arguments)
+        kwargs[keyword.arg] = get_literal(keyword.value)
+    return args, kwargs
+
+
+def extract_dependencies(sql: str) -> SqlDependencies:
+    dependencies = SqlDependencies()
+    for function, arguments in iter_calls(sql):
+        try:
+            args, kwargs = get_arguments(arguments)
+        except ValueError:
+            dependencies.dynamic = True
+            continue
+        if function == "ref":
+            version = kwargs.pop("version", kwargs.pop("v", None))
+            if (
+                1 <= len(args) <= 2
+                and not kwargs
+                and all(isinstance(arg, str) for arg in args)
+            ):
+                package = args[0] if len(args) == 2 else None
+                version = None if version is None else str(version)
+                dependencies.refs.append(Ref(package, args[-1], version))
+            else:
+                dependencies.dynamic = True
+        elif function == "source":
+            if (
+                len(args) == 2
+                and not kwargs
+                and all(isinstance(arg, str) for arg in args)
+            ):
+                dependencies.sources.append((args[0], args[1]))
+            else:
+                dependencies.dynamic = True
+        elif args:
+            dependencies.dynamic = True
+        else:
+            dependencies.config.update(kwargs)
+    return dependencies
@@ -0,0 +1,46 @@
+import re
+from typing import List
+
+# Normalized value of a string literal, the content is never inspected.
+STRING_VALUE = "''"
+# Normalized value of a Jinja expression or statement, e.g. `{{ ref('a') }}`.
+JINJA_VALUE = "{{"
+# Normalized values of the tokens longer than one character, by first one.
+NORMALIZED_VALUES = {"'": STRING_VALUE, "{": JINJA_VALUE}
+
+REGEX_TOKENS = re.compile(
+    r"""
+    # whitespace and comments before the token are skipped
+    (?:
+        \s+
+        | /\*.*?(?:\*/|\Z)          # block comment, possibly unterminated
+        | \{\#.*?(?:\#\}|\Z)        # Jinja comment
+        | --[^\n]*                  # line comment
+    )*
+    (
+        \{\{.*?\}\} | \{%.*?%\}     # Jinja expression or statement
+        | '(?:[^']|'')*'            # string literal
+        | [(){}]
+        | (?:[^\s(){}'/-] | /(?!\*) | -(?!-))+
+        | '                         # unbalanced quote
+        | \Z                        # comments at the end of the file
+    )
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+
+def tokenize(sql: str) -> List[str]:
+    """
+    Split `sql` into lowercased words, parentheses and braces in a single
+    pass. Comments are dropped, string literals and Jinja blocks are
+    replaced by `STRING_VALUE` and `JINJA_VALUE`.
+    """
+    tokens = REGEX_TOKENS.findall(sql.lower())
+    # Whitespace or comments at the end of `sql` are matched as empty tokens
+    while tokens and not tokens[-1]:
+        tokens.pop()
+    return [
+        token if len(token) == 1 else NORMALIZED_VALUES.get(token[0], token)
+        for token in tokens
+    ]
@@ -0,0 +1,125 @@
+import sys
+from array import array
+from functools import cached_property
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+# Type of the tests tagged `data`, every other test is a `schema` test.
+DATA_TEST_TAG = "data"
+NO_TAGS: FrozenSet[str] = frozenset()
+
+
+class NodeCoverage:
+    """
+    Tests of one or several nodes, in `child_map` order. Hooks use one of
+    the attributes, each is computed on first use.
+    """
+
+    def __init__(self, index: "CoverageIndex", numbers: Sequence[int]):
+        self._index = index
+        # test numbers of `index`
+        self.numbers = numbers
+
+    @property
+    def total(self) -> int:
+        return len(self.numbers)
+
+    @cached_property
+    def test_ids(self) -> Tuple[str, ...]:
+        return tuple(map(self._index.test_ids.__getitem__, self.numbers))
+
+    @cached_property
+    def test_tags(self) -> Tuple[FrozenSet[str], ...]:
+        return tuple(map(self._index.test_tags.__getitem__, self.numbers))
+
+    @cached_property
+    def by_name(self) -> Dict[str, int]:
+        """`test_metadata.name` ("data" for singular tests) -> count"""
+        test_names = self._index.test_names
+        by_name: Dict[str, int] = {}
+        for number in self.numbers:
+            name = test_names[number]
+            by_name[name] = by_name.get(name, 0) + 1
+        return by_name
+
+    @cached_property
+    def by_type(self) -> Dict[str, int]:
+        """Test type ("data" or "schema") -> count"""
+        data_tests = self._index.data_tests
+        n_data = sum(data_tests[number] for number in self.numbers)
+        by_type = {"schema": len(self.numbers) - n_data, "data": n_data}
+        return {key: count for key, count in by_type.items() if count}
+
+
+class CoverageIndex:
+    """
+    Tests of the nodes of a manifest from `child_map`, shared by the hooks
+    counting tests. Tests are numbered the first time they are seen and
+    stored in flat arrays, the tests of a node are a slice of `children`.
+    A node is indexed on first lookup: a pre-commit run usually checks a
+    handful of models, indexing the whole `child_map` would cost more than
+    it saves.
+    """
+
+    def __init__(self, manifest: Dict[str, Any]):
+        self.nodes: Dict[str, Any] = manifest.get("nodes") or {}
+        self.child_map: Dict[str, List[str]] = manifest.get("child_map") or {}
+        # test number -> test id, name, whether a data test and tags
+        self.test_ids: List[str] = []
+        self.test_names: List[str] = []
+        self.data_tests = bytearray()
+        self.test_tags: List[FrozenSet[str]] = []
+        # test numbers of the children of every node, one slice per node
+        self.children = array("I")
+        # node id -> (start, stop) of its slice of `children`
+        self.slices: Dict[str, Tuple[int, int]] = {}
+        self._numbers: Dict[str, int] = {}
+        self._tag_sets: Dict[FrozenSet[str], FrozenSet[str]] = {}
+
+    def _add_test(self, test_id: str, node: Dict[str, Any]) -> int:
+        tags = node.get("tags")
+        if tags:
+            # identical tag sets share a single frozenset
+            tag_set = frozenset(tags)
+            tag_set = self._tag_sets.setdefault(tag_set, tag_set)
+        else:
+            tag_set = NO_TAGS
+        test_metadata = node.get("test_metadata")
+        name = test_metadata and test_metadata.get("name") or "data"
+        number = self._numbers[test_id] = len(self.test_ids)
+        self.test_ids.append(test_id)
+        self.test_names.append(sys.intern(name))
+        self.data_tests.append(DATA_TEST_TAG in tag_set)
+        self.test_tags.append(tag_set)
+        return number
+
+    def get_slice(self, node_id: str) -> Tuple[int, int]:
+        """Bounds of the tests of `node_id` in `children`."""
+        bounds = self.slices.get(node_id)
+        if bounds is None:
+            start = len(self.children)
+            for child in self.child_map.get(node_id) or ():
+                if not child.startswith("test."):
+                    continue
+                number = self._numbers.get(child)
+                if number is None:
+                    node = self.nodes.get(child)
+                    if node is None:
+                        continue
+                    number = self._add_test(child, node)
+                self.children.append(number)
+            bounds = self.slices[node_id] = (start, len(self.children))
+        return bounds
+
+    def get_coverage(self, node_ids: Iterable[str]) -> NodeCoverage:
+        """Tests of `node_ids` together, e.g. the versions of a model."""
+        numbers = array("I")
+        for node_id in node_ids:
+            start, stop = self.get_slice(node_id)
+            numbers.extend(self.children[start:stop])
+        return NodeCoverage(self, numbers)
@@ -1,16 +1,190 @@
+import atexit
+import json
 import os
+import threading
+import time
+import uuid
+from pathlib import Path
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import NoReturn
 from typing import Optional
 
-from mixpanel import Mixpanel
-
-from dbt_checkpoint.utils import get_config_file
+from dbt_checkpoint.utils import get_checkpoint_config
 
 MIXPANEL_DEV_ENV = "34ffa16dc37f248c18ad6d1b9ea9c3a8"
 MIXPANEL_PROD_ENV = "3fa3db873f6950d10bd770a49c57e33e"
 
+SPOOL_FILENAME = "events.jsonl"
+LAST_FLUSH_FILENAME = "last-flush"
+# Events over the cap are dropped, e.g. on runners without network access.
+SPOOL_MAX_BYTES = 1 << 20
+# Mixpanel accepts up to 50 events per request.
+FLUSH_BATCH_SIZE = 50
+# Minimum number of seconds between two flushes of the spool.
+FLUSH_INTERVAL = 60
+# Maximum number of seconds spent flushing, including the wait at exit.
+FLUSH_TIMEOUT = 2.0
+# Claimed spools older than this were abandoned by an interrupted flush.
+ABANDONED_CLAIM_AGE = 600
+
+
+def get_spool_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "dbt-checkpoint" / "tracking"
+
+
+def make_event(
+    token: str,
+    distinct_id: Optional[str],
+    event_name: str,
+    properties: Dict[str, Any],
+) -> str:
+    """
+    Serialize an event the way `mixpanel.Mixpanel.track` does. Importing
+    mixpanel pulls in requests and urllib3, which takes longer than most
+    hooks, so it is only imported when the spool is flushed.
+    """
+    all_properties = {
+        "token": token,
+        "distinct_id": distinct_id,
+        "time": time.time(),
+        "$insert_id": uuid.uuid4().hex,
+        "mp_lib": "python",
+    }
+    all_properties.update(properties)
+    return json.dumps({"event": event_name, "properties": all_properties})
+
+
+class SpoolConsumer:
+    """
+    Mixpanel consumer that appends events to a local spool file instead of
+    sending them. The spool is sent in batches by `flush_events`.
+    """
+
+    def __init__(self, spool_dir: Path):
+        self.spool_file = spool_dir / SPOOL_FILENAME
+
+    def send(
+        self,
+        endpoint: str,
+        json_message: str,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+    ) -> None:
+        if endpoint == "events":
+            try:
+                append_events(self.spool_file, [json_message])
+            except OSError:
+                # Tracking is best effort, e.g. the home can be read-only.
+                pass
+
+
+def append_events(spool_file: Path, json_messages: List[str]) -> None:
+    try:
+        if spool_file.stat().st_size >= SPOOL_MAX_BYTES:
+            return
+    except FileNotFoundError:
+        spool_file.parent.mkdir(parents=True, exist_ok=True)
+    with spool_file.open("a", encoding="utf-8") as file:
+        file.write("".join(f"{message}\n" for message in json_messages))
+
+
+def _claim_spools(spool_dir: Path) -> List[Path]:
+    """
+    Atomically move the spool (and abandoned claims) aside, so that
+    concurrent hooks never send the same events twice.
+    """
+    candidates = [spool_dir / SPOOL_FILENAME]
+    now = time.time()
+    for claimed in spool_dir.glob("*.sending"):
+        try:
+            if now - claimed.stat().st_mtime > ABANDONED_CLAIM_AGE:
+                candidates.append(claimed)
+        except FileNotFoundError:
+            pass
+    claims = []
+    for candidate in candidates:
+        claim = spool_dir / f"{os.getpid()}-{time.time_ns()}.sending"
+        try:
+            os.rename(candidate, claim)
+        except FileNotFoundError:
+            continue
+        claims.append(claim)
+    return claims
+
+
+def flush_events(
+    spool_dir: Path,
+    events_url: Optional[str] = None,
+    timeout: float = FLUSH_TIMEOUT,
+) -> int:
+    """
+    Send the spooled events in batches, returns the number of sent events.
+    Events that could not be sent within `timeout` are spooled again.
+    """
+    from mixpanel import Consumer
+
+    deadline = time.monotonic() + timeout
+    consumer = Consumer(events_url=events_url, request_timeout=timeout, retry_limit=0)
+    sent = 0
+    for claim in _claim_spools(spool_dir):
+        messages = claim.read_text(encoding="utf-8").splitlines()
+        messages = [message for message in messages if message]
+        while messages and time.monotonic() < deadline:
+            batch = messages[:FLUSH_BATCH_SIZE]
+            try:
+                consumer.send("events", f"[{','.join(batch)}]")
+            except Exception:
+                break
+            sent += len(batch)
+            messages = messages[FLUSH_BATCH_SIZE:]
+        if messages:
+            append_events(spool_dir / SPOOL_FILENAME, messages)
+        claim.unlink()
+    return sent
+
+
+def flush_is_due(spool_dir: Path) -> bool:
+    """Whether the spool was not flushed during the last `FLUSH_INTERVAL`."""
+    if not (spool_dir / SPOOL_FILENAME).exists():
+        return False
+    last_flush = spool_dir / LAST_FLUSH_FILENAME
+    try:
+        return time.time() - last_flush.stat().st_mtime >= FLUSH_INTERVAL
+    except FileNotFoundError:
+        return True
+
+
+_flush_thread: Optional[threading.Thread] = None
+
+
+def _join_flush_thread() -> None:
+    # Give the flush a bounded amount of time to finish when the hook exits,
+    # anything left over stays in the spool for a later run.
+    if _flush_thread is not None:
+        _flush_thread.join(FLUSH_TIMEOUT)
+
+
+atexit.register(_join_flush_thread)
+
+
+def _flush_in_background(spool_dir: Path) -> None:
+    global _flush_thread
+    if _flush_thread is not None and _flush_thread.is_alive():
+        return
+    # Claim the interval first, other hooks running meanwhile skip the flush.
+    try:
+        (spool_dir / LAST_FLUSH_FILENAME).touch()
+    except OSError:
+        return
+    _flush_thread = threading.Thread(
+        target=flush_events, args=(spool_dir,), name="dbt-checkpoint-tracking"
+    )
+    _flush_thread.daemon = True
+    _flush_thread.start()
+
 
 # TODO: replace this tracking class with a tracking decorator
 class dbtCheckpointTracking:
@@ -19,11 +193,13 @@ class dbtCheckpointTracking:
         if config_path is None or not isinstance(config_path, str):
             raise ValueError("config_path must be a non-empty string")
 
-        self.config = get_config_file(config_path)
+        config = get_checkpoint_config(config_path)
+        self.config = config.content
 
         self.script_args = script_args
         self.token = self._get_mixpanel_env_token()
-        self.disable_tracking = self.config.get("disable-tracking", False)
+        self.disable_tracking = config.disable_tracking
+        self.spool_dir = get_spool_dir()
 
     def track_hook_event(
         self,
@@ -40,15 +216,22 @@ class dbtCheckpointTracking:
                 dbt_metadata, event_properties
             )
             try:
-                mixpanel = Mixpanel(token=self.token)
-                mixpanel.track(
-                    distinct_id=distinct_id,
-                    event_name=event_name,
-                    properties=event_properties,
+                # Events are spooled locally and sent in batches, the hook
+                # never waits for the network.
+                SpoolConsumer(self.spool_dir).send(
+                    "events",
+                    make_event(
+                        token=self.token,
+                        distinct_id=distinct_id,
+                        event_name=event_name,
+                        properties=event_properties,
+                    ),
                 )
             except Exception as e:
                 print(f"Mixpanel Error: {e}")
                 raise
+            if flush_is_due(self.spool_dir):
+                _flush_in_background(self.spool_dir)
 
     def _property_transformations(
         self,
@@ -8,18 +8,23 @@ from typing import Any, Dict, Optional, Sequence
 import yaml
 
 from dbt_checkpoint.check_column_desc_are_same import get_grouped
+from dbt_checkpoint.property_files import safe_load
 from dbt_checkpoint.tracking import dbtCheckpointTracking
 from dbt_checkpoint.utils import JsonOpenError, add_default_args, get_dbt_manifest
 
 
-def _replace_desc(path: Path, column_name: str, description: str) -> None:
-    file = yaml.safe_load(path.open())
+def _replace_descs(path: Path, descriptions: Dict[str, str]) -> None:
+    """Replace the description of all `descriptions` columns at once."""
+    with open(path) as f:
+        file = safe_load(f)
     for model in file.get("models", []):
         for column in model.get("columns", []):
-            if column_name == column.get("name"):
+            description = descriptions.get(column.get("name"))
+            if description is not None:
                 column["description"] = description
     with open(path, "w") as f:
         yaml.dump(file, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    for column_name, description in descriptions.items():
         print(
             f"{path}: replaced description of "
             f"column `{column_name}` for `{description}`"
@@ -31,6 +36,8 @@ def replace_column_desc(
 ) -> Dict[str, Any]:
     status_code = 0
     grouped = get_grouped(paths, ignore)
+    # file -> column name -> new description, every file is rewritten once
+    replacements: Dict[Path, Dict[str, str]] = {}
 
     for name, grps in grouped:
         groups = list(grps)
@@ -54,7 +61,12 @@ def replace_column_desc(
             else:
                 for group in groups:
                     if group.description != top_desc:
-                        _replace_desc(group.file, name, top_desc)
+                        replacements.setdefault(group.file, {})[name] = top_desc
+
+    for path, descriptions in replacements.items():
+        _replace_descs(path, descriptions)
+    if replacements:
+        print(f"Unified column descriptions in {len(replacements)} file(s).")
 
     return {"status_code": status_code}
 
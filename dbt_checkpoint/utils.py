@@ -1,4 +1,5 @@
 import argparse
+import functools
 import json
 import os
 import re
@@ -13,14 +14,47 @@ from typing import Optional
 from typing import Sequence
 from typing import Set
 from typing import Text
+from typing import Tuple
+from typing import TYPE_CHECKING
 from typing import Union
 
-
-from yaml import safe_load
+from dbt_checkpoint.file_index import get_file_index
+from dbt_checkpoint.json_backends import load_json
+from dbt_checkpoint.manifest_cache import get_cached_json
+from dbt_checkpoint.manifest_index import get_manifest_index
+from dbt_checkpoint.manifest_index import ManifestIndex
+from dbt_checkpoint.manifest_loader import get_selection_key
+from dbt_checkpoint.manifest_loader import load_json_selection
+from dbt_checkpoint.manifest_loader import ManifestSelection
+from dbt_checkpoint.path_trie import split_path
+from dbt_checkpoint.property_files import get_property_file
+from dbt_checkpoint.property_files import safe_load
+from dbt_checkpoint.test_coverage import NodeCoverage
+
+if TYPE_CHECKING:
+    from dbt_checkpoint.lineage_graph import LineageGraph
 
 DEFAULT_MANIFEST_PATH = "target/manifest.json"
 DEFAULT_CATALOG_PATH = "target/catalog.json"
 
+# Node fields read by the model helpers below and the manifest index.
+MODEL_NODE_FIELDS = (
+    "name",
+    "config",
+    "version",
+    "path",
+    "original_file_path",
+    "patch_path",
+)
+# Manifest parts needed by `get_models`, `get_model_sqls` and
+# `get_missing_file_paths`, `metadata` is used by the tracking.
+MODEL_MANIFEST_SELECTION: ManifestSelection = {
+    "metadata": None,
+    "nodes": MODEL_NODE_FIELDS,
+    "macros": ("path",),
+    "disabled": (),
+}
+
 
 class CalledProcessError(RuntimeError):
     pass
@@ -102,6 +136,43 @@ class GenericDbtObject:
     schema: Dict[str, Any]
 
 
+@dataclass
+class CheckpointConfig:
+    """
+    Content of .dbt-checkpoint.yaml, loaded once per process and shared by
+    the manifest/catalog loading, the tracking and the caches of all hooks.
+    """
+
+    path: Path
+    # (mtime, size) of the file when it was read, None when it is missing
+    fingerprint: Optional[Tuple[int, int]]
+    content: Dict[str, Any]
+
+    @property
+    def dbt_project_dir(self) -> Optional[str]:
+        return self.content.get("dbt-project-dir")
+
+    @property
+    def disable_tracking(self) -> bool:
+        return bool(self.content.get("disable-tracking", False))
+
+    @property
+    def disable_cache(self) -> bool:
+        return bool(self.content.get("disable-cache", False))
+
+    @property
+    def json_backend(self) -> str:
+        return self.content.get("json-backend", "auto")
+
+    @property
+    def hooks(self) -> List[Any]:
+        return self.content.get("hooks") or []
+
+
+# config path as passed -> config
+_CHECKPOINT_CONFIGS: Dict[str, CheckpointConfig] = {}
+
+
 def cmd_output(
     *cmd: str,
     expected_code: Optional[int] = 0,
@@ -136,25 +207,53 @@ def checkpoint_safe_load(stream):
     return safe_load(stream) or {}
 
 
-def get_json(json_filename: str) -> Dict[str, Any]:
+def get_json(json_filename: str, json_backend: str = "auto") -> Dict[str, Any]:
     try:
-        file_content = Path(json_filename).read_text(encoding="utf-8")
-        return json.loads(file_content)
+        return load_json(Path(json_filename), json_backend)
+    except Exception as e:
+        raise JsonOpenError(e)
+
+
+def get_json_selection(
+    json_filename: str, selection: ManifestSelection
+) -> Dict[str, Any]:
+    try:
+        return load_json_selection(json_filename, selection)
     except Exception as e:
         raise JsonOpenError(e)
 
 
 def get_config_file(config_file_path: str) -> Dict[str, Any]:
+    return get_checkpoint_config(config_file_path).content
+
+
+def get_checkpoint_config(config_file_path: str) -> CheckpointConfig:
+    """
+    .dbt-checkpoint.yaml (or .yml) parsed once per process. The file is
+    only parsed again when it changes, e.g. while `dbt-checkpoint serve`
+    is running.
+    """
+    path = Path(config_file_path)
+    if not path.exists():
+        alt_path = path.with_suffix(".yml" if path.suffix == ".yaml" else ".yaml")
+        if alt_path.exists():
+            path = alt_path
     try:
-        path = Path(config_file_path)
-        if not path.exists():
-            alt_path = path.with_suffix(".yml" if path.suffix == ".yaml" else ".yaml")
-            if alt_path.exists():
-                path = alt_path
-        config = checkpoint_safe_load(path.open())
-        check_yml_version(config_file_path, config)
+        stat = path.stat()
+        fingerprint: Optional[Tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        fingerprint = None
+    cached = _CHECKPOINT_CONFIGS.get(str(config_file_path))
+    if cached is not None and cached.path == path and cached.fingerprint == fingerprint:
+        return cached
+    try:
+        with path.open() as file:
+            content = checkpoint_safe_load(file)
+        check_yml_version(config_file_path, content)
     except FileNotFoundError:
-        config = {}
+        content = {}
+    config = CheckpointConfig(path, fingerprint, content)
+    _CHECKPOINT_CONFIGS[str(config_file_path)] = config
     return config
 
 
@@ -164,8 +263,9 @@ def get_models(
     include_ephemeral: bool = False,
     include_disabled: bool = False,
 ) -> Generator[Model, None, None]:
-    nodes = manifest.get("nodes", {})
-    for key, node in nodes.items():
+    index = get_manifest_index(manifest)
+    for key, fn in index.get_model_matches(filenames):
+        node = index.nodes[key]
         # Ephemeral models break many tests and should be wholly excluded,
         # someone can make an argument for their inclusion on a case by case basis
         # in which case we would pass `include_ephemeral`
@@ -177,106 +277,64 @@ def get_models(
         # In case a disabled model is still in `nodes`
         if not include_disabled and not node.get("config", {}).get("enabled", True):
             continue
-        split_key = key.split(".")
-        # Versions are supported since dbt-core 1.5
-        if node.get("version") and split_key[-1] == f"v{node.get('version')}":
-            # dbt versioned filenames can be either `model_name` or `model_name_v{version}`
-            filename_candidates = [
-                f"{split_key[-2]}",
-                f"{split_key[-2]}_v{node.get('version')}",
-            ]
-        else:
-            filename_candidates = [split_key[-1]]
-        if split_key[0] == "model":
-            for fn in filename_candidates:
-                if fn in filenames:
-                    yield Model(key, node.get("name"), fn, node)  # pragma: no mutate
+        yield Model(key, node.get("name"), fn, node)  # pragma: no mutate
 
 
 def get_ephemeral(
     manifest: Dict[str, Any],
 ) -> List[str]:
-    output = []
-    nodes = manifest.get("nodes", {})
-    for key, node in nodes.items():
-        if not node.get("config", {}).get("materialized") == "ephemeral":
-            continue
-        split_key = key.split(".")
-        filename = split_key[-1]
-        if split_key[0] == "model":
-            output.append(filename)
-    return output
+    return list(get_manifest_index(manifest).ephemeral_models)
 
 
 def get_snapshot_filenames(
     manifest: Dict[str, Any],
 ) -> List[str]:
-    output = []
-    nodes = manifest.get("nodes", {})
-    for key, node in nodes.items():  # pragma: no cover
-        if not node.get("config", {}).get("materialized") == "snapshot":
-            continue
-        split_key = key.split(".")
-        filename = split_key[-1]
-        if split_key[0] == "snapshot":
-            output.append(filename)
-    return output
+    return list(get_manifest_index(manifest).snapshots)
 
 
 def get_snapshots(
     manifest: Dict[str, Any], filenames: Set[str]
 ) -> Generator[GenericDbtObject, None, None]:
-    nodes = manifest.get("nodes", {})
-    for key, node in nodes.items():
-        if not node.get("config", {}).get("materialized") == "snapshot":
-            continue
-        split_key = key.split(".")
-        filename = split_key[-1]
-        if filename in filenames and split_key[0] == "snapshot":
-            yield GenericDbtObject(
-                node.get("name"), filename, node
-            )  # pragma: no mutate
+    index = get_manifest_index(manifest)
+    for key in index.get_ids_by_filename(index.snapshot_filenames, filenames):
+        node = index.nodes[key]
+        yield GenericDbtObject(
+            node.get("name"), key.split(".")[-1], node
+        )  # pragma: no mutate
 
 
 def get_tests(
     manifest: Dict[str, Any], filenames: Set[str]
 ) -> Generator[GenericDbtObject, None, None]:
-    nodes = manifest.get("nodes", {})
-    for key, node in nodes.items():
-        if not node.get("config", {}).get("materialized") == "test":
-            continue
-        split_key = key.split(".")
-        filename = split_key[-1]
-        if filename in filenames and split_key[0] == "test":
-            yield GenericDbtObject(
-                node.get("name"), filename, node
-            )  # pragma: no mutate
+    index = get_manifest_index(manifest)
+    for key in index.get_ids_by_filename(index.test_filenames, filenames):
+        node = index.nodes[key]
+        yield GenericDbtObject(
+            node.get("name"), key.split(".")[-1], node
+        )  # pragma: no mutate
 
 
 def get_macros(
     manifest: Dict[str, Any],
     filenames: Set[str],
 ) -> Generator[Macro, None, None]:
-    macros = manifest.get("macros", {})
-    for key, macro in macros.items():
-        split_key = key.split(".")
-        filename = split_key[-1]
-        if filename in filenames and split_key[0] == "macro":
-            yield Macro(key, macro.get("name"), filename, macro)  # pragma: no mutate
+    index = get_manifest_index(manifest)
+    for key in index.get_ids_by_filename(index.macro_filenames, filenames):
+        macro = index.macros[key]
+        filename = key.split(".")[-1]
+        yield Macro(key, macro.get("name"), filename, macro)  # pragma: no mutate
 
 
 def get_seeds(
     manifest: Dict[str, Any],
     filenames: Set[str],
 ) -> Generator[GenericDbtObject, None, None]:
-    seeds = manifest.get("nodes", {})
-    for key, seed in seeds.items():
-        split_key = key.split(".")
-        filename = split_key[-1]
-        if filename in filenames and split_key[0] == "seed":
-            yield GenericDbtObject(
-                seed.get("name"), filename, seed
-            )  # pragma: no mutate
+    index = get_manifest_index(manifest)
+    for key in index.get_ids_by_filename(index.seed_filenames, filenames):
+        seed = index.nodes[key]
+        yield GenericDbtObject(
+            seed.get("name"), key.split(".")[-1], seed
+        )  # pragma: no mutate
 
 
 def get_flags(flags: Optional[Sequence[str]] = None) -> List[str]:
@@ -288,23 +346,14 @@ def get_flags(flags: Optional[Sequence[str]] = None) -> List[str]:
 
 def get_macro_sqls(paths: Sequence[str], manifest: Dict[str, Any]) -> Dict[str, Path]:
     sqls = get_filenames(paths, [".sql"])
-    macro_paths = [m["path"] for m in manifest.get("macros", {}).values()]
-    macro_sqls = get_filenames(macro_paths, extensions=[".sql"])
+    macro_sqls = get_manifest_index(manifest).macro_sqls
     return {k: v for k, v in sqls.items() if k in macro_sqls and v == macro_sqls[k]}
 
 
 def get_disabled(manifest: Dict[str, Any], include_disabled: bool = False) -> List[str]:
-    output = []
-    disabled = manifest.get("disabled", {})
-    for key, node in disabled.items():
-        split_key = key.split(".")
-        filename = split_key[-1]
-        if split_key[0] == "model":
-            if include_disabled:
-                continue
-            output.append(filename)
-
-    return output
+    if include_disabled:
+        return []
+    return list(get_manifest_index(manifest).disabled_models)
 
 
 def get_model_sqls(
@@ -325,26 +374,23 @@ def get_model_schemas(
     yml_files: Sequence[Path], filenames: Set[str], all_schemas: bool = False
 ) -> Generator[ModelSchema, None, None]:
     for yml_file in yml_files:
-        with open(yml_file, "r") as file:
-            schema = checkpoint_safe_load(file)
-            for model in schema.get("models", []):
-                if isinstance(model, dict) and model.get("name"):
-                    model_name = model.get("name", "")  # pragma: no mutate
-                    if model_name in filenames or all_schemas:
-                        yield ModelSchema(
-                            model_name=model_name,
-                            file=yml_file,
-                            filename=yml_file.stem,
-                            schema=model,
-                        )
+        for model in get_property_file(yml_file).models:
+            if isinstance(model, dict) and model.get("name"):
+                model_name = model.get("name", "")  # pragma: no mutate
+                if model_name in filenames or all_schemas:
+                    yield ModelSchema(
+                        model_name=model_name,
+                        file=yml_file,
+                        filename=yml_file.stem,
+                        schema=model,
+                    )
 
 
 def get_macro_schemas(
     yml_files: Sequence[Path], filenames: Set[str], all_schemas: bool = False
 ) -> Generator[MacroSchema, None, None]:
     for yml_file in yml_files:
-        schema = checkpoint_safe_load(yml_file.open())
-        for macro in schema.get("macros", []):
+        for macro in get_property_file(yml_file).macros:
             if isinstance(macro, dict) and macro.get("name"):
                 macro_name = macro.get("name", "")  # pragma: no mutate
                 if macro_name in filenames or all_schemas:
@@ -360,14 +406,15 @@ def get_source_schemas(
     yml_files: Sequence[Path], include_disabled: bool = False
 ) -> Generator[SourceSchema, None, None]:
     for yml_file in yml_files:
-        schema = checkpoint_safe_load(yml_file.open())
-        for source in schema.get("sources", []):
+        for source in get_property_file(yml_file).sources:
             if not include_disabled and not source.get("config", {}).get(
                 "enabled", True
             ):
                 continue
             source_name = source.get("name")
-            tables = source.pop("tables", [])
+            tables = source.get("tables", [])
+            # Parsed files are shared, `source_schema` is a copy without tables
+            source = {key: value for key, value in source.items() if key != "tables"}
             for table in tables:
                 table_name = table.get("name")
                 yield SourceSchema(
@@ -383,8 +430,7 @@ def get_exposures(
     yml_files: Sequence[Path],
 ) -> Generator[GenericDbtObject, None, None]:
     for yml_file in yml_files:
-        schema = checkpoint_safe_load(yml_file.open())
-        for exposure in schema.get("exposures", []):
+        for exposure in get_property_file(yml_file).exposures:
             exposure_name = exposure.get("name")
             yield GenericDbtObject(
                 name=exposure_name,
@@ -417,36 +463,60 @@ def get_test(node_id: str, manifest: Dict[str, Any]) -> Test:
     )
 
 
+def get_dependency_names(
+    manifest: Dict[str, Any], obj: Any, manifest_node: str
+) -> List[str]:
+    """Keys of `manifest[manifest_node]` that belong to `obj`."""
+    if isinstance(obj, Model):
+        deps = manifest.get(manifest_node, {})
+        return [obj.model_id] if obj.model_id in deps else []
+    if isinstance(obj, SourceSchema):
+        key: Tuple[str, ...] = (obj.prefix, obj.source_name, obj.table_name)
+    elif isinstance(obj, ModelSchema):
+        key = (obj.prefix, obj.model_name)
+    else:
+        return []
+    return get_manifest_index(manifest).get_lineage(manifest_node).get(key, [])
+
+
+def get_test_coverage(manifest: Dict[str, Any], obj: Any) -> NodeCoverage:
+    """Tests of a model, model schema or source schema from `child_map`."""
+    dep_names = get_dependency_names(manifest, obj, "child_map")
+    return get_manifest_index(manifest).get_test_coverage().get_coverage(dep_names)
+
+
+def get_lineage_graph(manifest: Dict[str, Any]) -> "LineageGraph":
+    """Transitive parents and children of the nodes of the manifest."""
+    return get_manifest_index(manifest).get_lineage_graph()
+
+
 def get_parent_childs(
     manifest: Dict[str, Any], obj: Any, manifest_node: str, node_types: List[str]
 ) -> Generator[Union[Test, Model, Source], None, None]:
     deps = manifest.get(manifest_node, {})
-    for dep_name, dep_items in deps.items():
-        if obj_in_deps(obj, dep_name):
-            for node_id in dep_items:
-                node_type = node_id.split(".")[0]
-                if node_type in node_types:
-                    if node_type == "test":
-                        yield get_test(node_id, manifest)
-                    elif node_type == "model":
-                        node = manifest.get("nodes", {}).get(node_id)
-                        yield Model(
-                            model_id=node_id,
-                            model_name=node.get("name", ""),  # pragma: no mutate
-                            filename=node.get("path", ""),  # pragma: no mutate
-                            node=node,
-                        )
-                    else:  # Source
-                        node = manifest.get("sources", {}).get(node_id)
-                        yield Source(
-                            source_id=node_id,
-                            source_name=node.get(
-                                "source_name", ""
-                            ),  # pragma: no mutate
-                            table_name=node.get("name", ""),  # pragma: no mutate
-                            filename=node.get("path", ""),  # pragma: no mutate
-                            node=node,
-                        )
+    for dep_name in get_dependency_names(manifest, obj, manifest_node):
+        for node_id in deps[dep_name]:
+            node_type = node_id.split(".")[0]
+            if node_type in node_types:
+                if node_type == "test":
+                    yield get_test(node_id, manifest)
+                elif node_type == "model":
+                    node = manifest.get("nodes", {}).get(node_id)
+                    yield Model(
+                        model_id=node_id,
+                        model_name=node.get("name", ""),  # pragma: no mutate
+                        filename=node.get("path", ""),  # pragma: no mutate
+                        node=node,
+                    )
+                else:  # Source
+                    node = manifest.get("sources", {}).get(node_id)
+                    yield Source(
+                        source_id=node_id,
+                        source_name=node.get("source_name", ""),  # pragma: no mutate
+                        table_name=node.get("name", ""),  # pragma: no mutate
+                        filename=node.get("path", ""),  # pragma: no mutate
+                        node=node,
+                    )
 
 
 def get_filenames(
@@ -480,10 +550,11 @@ def run_dbt_cmd(cmd: Sequence[Any]) -> int:
 def get_manifest_node_from_file_path(
     manifest: Dict[str, Any], file_path: str
 ) -> Dict[str, Any]:
-    for node in manifest.get("nodes", {}).values():
-        if node.get("original_file_path", "") in file_path:
-            return node
-    return {}
+    index = get_manifest_index(manifest)
+    node_id = index.get_node_id_from_file_path(file_path)
+    if node_id is None:
+        return {}
+    return index.nodes[node_id]
 
 
 def add_filenames_args(parser: argparse.ArgumentParser) -> None:
@@ -554,6 +625,27 @@ def add_disabled_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def add_jobs_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="""Number of processes checking the files in parallel. 0 (default)
+        uses one process per CPU when there are enough files to check.
+        """,
+    )
+
+
+def add_static_deps_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--static-deps",
+        action="store_true",
+        help="""Read the refs, sources and config of the changed SQL files from
+        the files instead of the manifest, which may predate them.
+        """,
+    )
+
+
 def add_default_args(parser: argparse.ArgumentParser) -> None:
     add_filenames_args(parser)
     add_manifest_args(parser)
@@ -697,26 +789,23 @@ def add_related_sqls(
     nodes: Dict[Any, Any],
     paths_with_missing: Set[str],
     include_ephemeral: bool = False,
+    manifest_index: Optional[ManifestIndex] = None,
 ) -> None:
-    yml_path_class = Path(yml_path)
-    yml_path_parts = list(yml_path_class.parts)
-    # Remove the first 'project' component
-    yml_path_parts.pop(0)
-    dbt_patch_path = "/".join(yml_path_parts)
-
-    for key, node in nodes.items():
+    index = manifest_index or ManifestIndex({"nodes": nodes})
+    # nodes whose `patch_path` is the longest suffix of `yml_path`
+    for key in index.get_property_paths().find(yml_path):
+        node = nodes[key]
         if (
             not include_ephemeral
             and node.get("config", {}).get("materialized") == "ephemeral"
         ):
             continue
 
-        if node.get("patch_path") and dbt_patch_path in node.get("patch_path"):
-            if ".sql" in node.get("original_file_path", "").lower():
-                for related_sql_file in _discover_sql_files(node):
-                    sql_as_string = related_sql_file.as_posix()
-                    if "target/" not in sql_as_string.lower():
-                        paths_with_missing.add(sql_as_string)
+        if ".sql" in node.get("original_file_path", "").lower():
+            for related_sql_file in _discover_sql_files(node):
+                sql_as_string = related_sql_file.as_posix()
+                if "target/" not in sql_as_string.lower():
+                    paths_with_missing.add(sql_as_string)
 
 
 def add_related_ymls(
@@ -724,35 +813,35 @@ def add_related_ymls(
     nodes: Dict[Any, Any],
     paths_with_missing: Set[str],
     include_ephemeral: bool = False,
+    manifest_index: Optional[ManifestIndex] = None,
 ) -> None:
-    for key, node in nodes.items():
+    index = manifest_index or ManifestIndex({"nodes": nodes})
+    # nodes whose `original_file_path` is the longest suffix of `sql_path`
+    for key in index.get_file_paths().find(sql_path):
+        node = nodes[key]
         if (
             not include_ephemeral
             and node.get("config", {}).get("materialized") == "ephemeral"
         ):
             continue
 
-        if node.get("path") and (node.get("path") in sql_path):
-            patch_path = node.get("patch_path", None)
-            if patch_path:
-                # Original patch_path has 'project\\path\to\yml.yml'
-                # Remove `project_name\\` from patch_path
-                patch_path = Path(patch_path)
-                clean_patch_path = patch_path.relative_to(
-                    *patch_path.parts[:1]
-                ).as_posix()
-                for related_yml_file in _discover_prop_files(clean_patch_path):
-                    yml_as_string = related_yml_file.as_posix()
-                    if "target/" not in yml_as_string.lower():
-                        paths_with_missing.add(yml_as_string)
+        patch_path = node.get("patch_path", None)
+        if patch_path:
+            # Original patch_path has 'project://path/to/yml.yml'
+            # Remove `project_name://` from patch_path
+            clean_patch_path = "/".join(split_path(patch_path))
+            for related_yml_file in _discover_prop_files(clean_patch_path):
+                yml_as_string = related_yml_file.as_posix()
+                if "target/" not in yml_as_string.lower():
+                    paths_with_missing.add(yml_as_string)
 
 
 def _discover_sql_files(node):  # type: ignore
-    return Path().glob(f"**/{node.get('original_file_path')}")
+    return [Path(path) for path in get_file_index().find(node["original_file_path"])]
 
 
 def _discover_prop_files(model_path):  # type: ignore
-    return Path().glob(f"**/{model_path}")
+    return [Path(path) for path in get_file_index().find(model_path)]
 
 
 def get_missing_file_paths(
@@ -765,12 +854,17 @@ def get_missing_file_paths(
     nodes = manifest.get("nodes", {})
     paths_with_missing = set(paths)
     if nodes:
+        index = get_manifest_index(manifest)
         for path in paths:
             suffix = Path(path).suffix.lower()
             if suffix == ".sql" and (".yml" in extensions or ".yaml" in extensions):
-                add_related_ymls(path, nodes, paths_with_missing, include_ephemeral)
+                add_related_ymls(
+                    path, nodes, paths_with_missing, include_ephemeral, index
+                )
             elif (suffix == ".yml" or suffix == ".yaml") and ".sql" in extensions:
-                add_related_sqls(path, nodes, paths_with_missing, include_ephemeral)
+                add_related_sqls(
+                    path, nodes, paths_with_missing, include_ephemeral, index
+                )
             else:
                 continue
     if exclude_pattern:
@@ -800,22 +894,64 @@ def extend_dbt_project_dir_flag(
     return cmd
 
 
-def get_dbt_manifest(args):  # type: ignore
+def get_artifact_json(
+    json_filename: str,
+    dbt_checkpoint_config: CheckpointConfig,
+    selection: Optional[ManifestSelection] = None,
+) -> Dict[str, Any]:
+    """
+    Load a dbt artifact (manifest/catalog) through the binary cache
+    unless `disable-cache` is set in .dbt-checkpoint.yaml. With `selection`
+    only the selected sections and fields are loaded, otherwise the whole
+    artifact is parsed with the `json-backend` of .dbt-checkpoint.yaml.
+    """
+    persist = not dbt_checkpoint_config.disable_cache
+    if selection is None:
+        json_backend = dbt_checkpoint_config.json_backend
+        return get_cached_json(
+            json_filename,
+            functools.partial(get_json, json_backend=json_backend),
+            persist=persist,
+        )
+    return get_cached_json(
+        json_filename,
+        functools.partial(get_json_selection, selection=selection),
+        persist=persist,
+        variant=get_selection_key(selection),
+    )
+
+
+def get_dbt_manifest(args, selection=None):  # type: ignore
     """
     Get dbt manifest following the new config file approach. Precedence:
         - custom `--manifest` flag
         - .dbt-checkpoint.yaml `dbt-project-dir` key
         - default `--manifest` flag
+
+    Hooks reading only a few fields of the manifest pass a `selection`
+    (e.g. `MODEL_MANIFEST_SELECTION`), everything else is skipped while
+    parsing. With `--static-deps`, the dependencies of the changed SQL
+    files are read from the files, see `apply_static_dependencies`.
     """
+    dbt_checkpoint_config = get_checkpoint_config(args.config)
+    manifest_path = get_dbt_manifest_path(args, dbt_checkpoint_config)
+    manifest = get_artifact_json(manifest_path, dbt_checkpoint_config, selection)
+    if getattr(args, "static_deps", False):
+        from dbt_checkpoint.manifest_overlay import apply_static_dependencies
+
+        manifest = apply_static_dependencies(manifest, args.filenames)
+    return manifest
+
+
+def get_dbt_manifest_path(
+    args: argparse.Namespace, dbt_checkpoint_config: CheckpointConfig
+) -> str:
+    """Path of manifest.json, see `get_dbt_manifest`."""
     manifest_path = args.manifest
-    dbt_checkpoint_config = get_config_file(args.config)
-    config_project_dir = dbt_checkpoint_config.get("dbt-project-dir")
-    if manifest_path != DEFAULT_MANIFEST_PATH:
-        return get_json(manifest_path)
-    elif config_project_dir:
-        return get_json(f"{config_project_dir}/target/manifest.json")
-    else:
-        return get_json(manifest_path)
+    config_project_dir = dbt_checkpoint_config.dbt_project_dir
+    if manifest_path == DEFAULT_MANIFEST_PATH and config_project_dir:
+        manifest_path = f"{config_project_dir}/target/manifest.json"
+    return manifest_path
 
 
 def get_dbt_catalog(args):  # type: ignore
@@ -823,14 +959,11 @@ def get_dbt_catalog(args):  # type: ignore
     Get dbt catalog following the new config file approach
     """
     catalog_path = args.catalog
-    dbt_checkpoint_config = get_config_file(args.config)
-    config_project_dir = dbt_checkpoint_config.get("dbt-project-dir")
-    if catalog_path != DEFAULT_CATALOG_PATH:
-        return get_json(catalog_path)
-    elif config_project_dir:
-        return get_json(f"{config_project_dir}/target/catalog.json")
-    else:
-        return get_json(catalog_path)
+    dbt_checkpoint_config = get_checkpoint_config(args.config)
+    config_project_dir = dbt_checkpoint_config.dbt_project_dir
+    if catalog_path == DEFAULT_CATALOG_PATH and config_project_dir:
+        catalog_path = f"{config_project_dir}/target/catalog.json"
+    return get_artifact_json(catalog_path, dbt_checkpoint_config)
 
 
 def validate_meta_keys(
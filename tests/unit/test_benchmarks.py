@@ -0,0 +1,56 @@
+import json
+from unittest.mock import patch
+
+from benchmarks.suite import get_regressions
+from benchmarks.suite import main
+
+BASELINE = {
+    "check_model_has_tests": {
+        "100": {"seconds": 0.001, "peak_mb": 0.1},
+        "1000": {"seconds": 0.1, "peak_mb": 10.0},
+        "10000": {"seconds": 1.0, "peak_mb": 100.0},
+    },
+}
+
+
+def test_get_regressions_within_threshold():
+    results = {
+        "check_model_has_tests": {
+            # 20% slower and bigger, under the 25% threshold
+            "1000": {"seconds": 0.12, "peak_mb": 12.0},
+            # 5x the baseline, but by less than the timer and memory noise
+            "100": {"seconds": 0.005, "peak_mb": 0.5},
+        },
+        # no baseline to compare with
+        "has_table_name": {"1000": {"seconds": 10.0, "peak_mb": 100.0}},
+    }
+    assert get_regressions(results, BASELINE, 0.25) == []
+
+
+def test_get_regressions_over_threshold():
+    results = {
+        "check_model_has_tests": {
+            "1000": {"seconds": 0.2, "peak_mb": 10.0},
+            "10000": {"seconds": 1.0, "peak_mb": 150.0},
+        },
+    }
+    assert get_regressions(results, BASELINE, 0.25) == [
+        "check_model_has_tests (1000 nodes): seconds 0.2 > 0.1 +25%",
+        "check_model_has_tests (10000 nodes): peak_mb 150.0 > 100.0 +25%",
+    ]
+    assert get_regressions(results, BASELINE, 0.5) == [
+        "check_model_has_tests (1000 nodes): seconds 0.2 > 0.1 +50%",
+    ]
+
+
+def test_check_mode(tmp_path, capsys):
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(BASELINE))
+    argv = ["--check", "--baseline", str(baseline_path), "--sizes", "1000"]
+    within = {"check_model_has_tests": {"1000": {"seconds": 0.11, "peak_mb": 10.0}}}
+    over = {"check_model_has_tests": {"1000": {"seconds": 0.2, "peak_mb": 10.0}}}
+    with patch("benchmarks.suite.run_suite", return_value=within):
+        assert main(argv) == 0
+    with patch("benchmarks.suite.run_suite", return_value=over):
+        assert main(argv) == 1
+    assert "Regression: check_model_has_tests (1000 nodes)" in capsys.readouterr().out
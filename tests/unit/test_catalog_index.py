@@ -0,0 +1,71 @@
+import pytest
+
+from dbt_checkpoint.catalog_index import get_catalog_index
+from dbt_checkpoint.manifest_cache import shared_artifacts
+
+CATALOG = {
+    "nodes": {
+        "model.test.orders": {
+            "columns": {
+                "ID": {"type": "INTEGER", "index": 1, "name": "ID"},
+                "Amount": {"type": "NUMBER", "index": 2, "name": "Amount"},
+                "no_type": {"index": 3, "name": "no_type"},
+            },
+        },
+        "model.test.empty": {},
+    },
+    "sources": {
+        "source.test.raw.customers": {
+            "columns": {"id": {"type": "TEXT", "index": 1, "name": "id"}},
+        },
+    },
+}
+
+
+@pytest.fixture
+def shared():
+    with shared_artifacts():
+        yield
+
+
+def test_catalog_index_columns(shared):
+    index = get_catalog_index(CATALOG)
+    columns = index.get_columns("model.test.orders")
+    assert columns.names == ("ID", "Amount", "no_type")
+    assert columns.lower_names == ("id", "amount", "no_type")
+    assert columns.types == ("INTEGER", "NUMBER", "")
+    assert columns.ordinals == (1, 2, 3)
+    assert columns.name_set == {"id", "amount", "no_type"}
+    assert columns.get_type("amount") == "NUMBER"
+    assert columns.get_type("Amount") is None
+    # Columns are indexed once
+    assert index.get_columns("model.test.orders") is columns
+    assert index.get_columns("model.test.empty") is None
+    assert index.get_columns("model.test.missing") is None
+
+
+def test_catalog_index_sources():
+    index = get_catalog_index(CATALOG)
+    source_id = index.get_source_id("raw", "customers")
+    assert source_id == "source.test.raw.customers"
+    assert index.get_source_id("customers", "raw") == source_id
+    assert index.get_source_id("raw", "orders") is None
+    assert index.get_columns(source_id).name_set == {"id"}
+
+
+def test_get_catalog_index_reused_until_modified(shared):
+    catalog = {"nodes": dict(CATALOG["nodes"]), "sources": {}}
+    index = get_catalog_index(catalog)
+    assert get_catalog_index(catalog) is index
+    catalog["nodes"]["model.test.new"] = {"columns": {}}
+    assert get_catalog_index(catalog) is not index
+
+
+def test_get_catalog_index_single_hook():
+    # Without shared artifacts nothing is kept between lookups.
+    index = get_catalog_index(CATALOG)
+    assert not index.reuse
+    assert get_catalog_index(CATALOG) is not index
+    columns = index.get_columns("model.test.orders")
+    assert columns.name_set == {"id", "amount", "no_type"}
+    assert index.get_columns("model.test.orders") is not columns
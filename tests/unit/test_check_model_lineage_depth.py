@@ -0,0 +1,21 @@
+import pytest
+
+from dbt_checkpoint.check_model_lineage_depth import main
+
+# Input, args, valid_manifest, expected return value
+TESTS = (
+    (["aa/bb/parent_child.sql", "--is_test"], ["--max-depth", "1"], True, 0),
+    (["aa/bb/parent_child.sql", "--is_test"], ["--max-depth", "0"], True, 1),
+    (["aa/bb/ref1.sql", "--is_test"], ["--max-depth", "0"], True, 0),
+    (["aa/bb/parent_child.sql", "--is_test"], ["--max-depth", "0"], False, 1),
+)
+
+
+@pytest.mark.parametrize(("input_args", "args", "valid_manifest", "expected"), TESTS)
+def test_check_model_lineage_depth(
+    input_args, args, valid_manifest, expected, manifest_path_str
+):
+    if valid_manifest:
+        input_args.extend(["--manifest", manifest_path_str])
+    status_code = main(input_args + args)
+    assert status_code == expected
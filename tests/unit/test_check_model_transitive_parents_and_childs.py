@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from dbt_checkpoint.check_model_transitive_parents_and_childs import main
+
+# Input, args, valid_manifest, expected return value
+TESTS = (
+    (["aa/bb/parent_child.sql", "--is_test"], ["--max-parent-cnt", "4"], True, 0),
+    (["aa/bb/parent_child.sql", "--is_test"], ["--max-parent-cnt", "3"], True, 1),
+    (["aa/bb/parent_child.sql", "--is_test"], ["--max-child-cnt", "0"], True, 0),
+    (["aa/bb/parent_child.sql", "--is_test"], ["--max-parent-cnt", "3"], False, 1),
+)
+
+
+@pytest.mark.parametrize(("input_args", "args", "valid_manifest", "expected"), TESTS)
+def test_check_model_transitive_parents_and_childs(
+    input_args, args, valid_manifest, expected, manifest_path_str
+):
+    if valid_manifest:
+        input_args.extend(["--manifest", manifest_path_str])
+    status_code = main(input_args + args)
+    assert status_code == expected
+
+
+def test_check_model_transitive_childs(manifest, tmpdir):
+    manifest = {
+        **manifest,
+        "parent_map": {
+            "model.ref1": [],
+            "model.ref2": ["model.ref1"],
+            "model.ref3": ["model.ref2"],
+            "exposure.dashboard": ["model.ref3"],
+            "test.ref3_unique": ["model.ref3"],
+        },
+    }
+    manifest_path = tmpdir.join("manifest.json")
+    manifest_path.write_text(json.dumps(manifest), "utf-8")
+    args = ["aa/bb/ref1.sql", "--is_test", "--manifest", str(manifest_path)]
+    assert main([*args, "--max-child-cnt", "2"]) == 0
+    assert main([*args, "--max-child-cnt", "1"]) == 1
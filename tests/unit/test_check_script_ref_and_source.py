@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch
 
 import pytest
@@ -58,3 +59,65 @@ def test_check_script_ref_and_source_manifest_refs(
     ret = hook_properties.get("status_code")
 
     assert ret == expected_status_code
+
+
+def test_check_script_ref_and_source_missing(tmpdir, capsys):
+    path = tmpdir.join("models", "orders.sql")
+    manifest = {
+        "nodes": {
+            "model.proj.orders": {
+                "unique_id": "model.proj.orders",
+                "original_file_path": "models/orders.sql",
+                "depends_on": {
+                    "nodes": [
+                        "model.proj.customers",
+                        "model.proj.stg_orders",
+                        "source.proj.raw.orders",
+                        "source.proj.raw.payments",
+                    ]
+                },
+            },
+            "model.proj.stg_orders": {"unique_id": "model.proj.stg_orders"},
+            # only looked up in `sources`
+            "source.proj.raw.payments": {"unique_id": "source.proj.raw.payments"},
+        },
+        "sources": {
+            "source.proj.raw.orders": {"unique_id": "source.proj.raw.orders"},
+        },
+    }
+    hook_properties = check_refs_sources(paths=[str(path)], manifest=manifest)
+
+    assert hook_properties["status_code"] == 1
+    assert hook_properties["models"] == {"model.proj.customers"}
+    assert hook_properties["sources"] == {
+        frozenset(["raw", "payments"]): {
+            "source_name": "raw",
+            "table_name": "payments",
+        }
+    }
+    out = capsys.readouterr().out
+    assert "model.proj.customers" in out
+    assert "source.proj.raw.orders" not in out
+
+
+def test_check_script_ref_and_source_static_deps(tmpdir, config_path_str):
+    path = tmpdir.join("models", "orders.sql")
+    path.ensure()
+    path.write_text("select * from {{ ref('customers') }}", "utf-8")
+    manifest = {
+        "nodes": {
+            "model.proj.orders": {
+                "name": "orders",
+                "package_name": "proj",
+                "original_file_path": "models/orders.sql",
+                "depends_on": {"nodes": []},
+            },
+        },
+    }
+    manifest_path = tmpdir.join("target", "manifest.json")
+    manifest_path.ensure()
+    manifest_path.write_text(json.dumps(manifest), "utf-8")
+    argv = [str(path), "--manifest", str(manifest_path), "--config", config_path_str]
+
+    assert main(argv) == 0
+    assert main([*argv, "--static-deps"]) == 1
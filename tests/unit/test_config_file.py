@@ -1,7 +1,13 @@
+from unittest.mock import patch
+
 import pytest
-from yaml import safe_dump
+from yaml import safe_dump, safe_load
 
-from dbt_checkpoint.utils import CompilationException, get_config_file
+from dbt_checkpoint.utils import (
+    CompilationException,
+    get_checkpoint_config,
+    get_config_file,
+)
 
 
 @pytest.fixture
@@ -53,3 +59,26 @@ def test_get_config_file_missing_version(tmp_path):
         f.write(safe_dump({"disable-tracking": True}))  # YAML data without version
     with pytest.raises(CompilationException):
         get_config_file(file_path)
+
+
+def test_get_checkpoint_config_parsed_once(tmp_path):
+    file_path = tmp_path / ".dbt-checkpoint.yaml"
+    file_path.write_text(safe_dump({"version": 1, "dbt-project-dir": "project"}))
+    with patch("dbt_checkpoint.utils.safe_load", side_effect=safe_load) as mock_load:
+        config = get_checkpoint_config(str(file_path))
+        assert get_checkpoint_config(str(file_path)) is config
+        assert get_config_file(str(file_path)) is config.content
+        assert mock_load.call_count == 1
+    assert config.dbt_project_dir == "project"
+    assert config.disable_tracking is False
+    assert config.json_backend == "auto"
+
+
+def test_get_checkpoint_config_reloads_changed_file(tmp_path):
+    file_path = tmp_path / ".dbt-checkpoint.yaml"
+    file_path.write_text(safe_dump({"version": 1}))
+    assert get_checkpoint_config(str(file_path)).disable_cache is False
+    file_path.write_text(safe_dump({"version": 1, "disable-cache": True}))
+    assert get_checkpoint_config(str(file_path)).disable_cache is True
+    file_path.unlink()
+    assert get_checkpoint_config(str(file_path)).content == {}
@@ -0,0 +1,113 @@
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from dbt_checkpoint.cli import main
+from dbt_checkpoint.daemon import (
+    HookRequestHandler,
+    HookServer,
+    get_socket_path,
+    is_daemon_running,
+    request_hooks,
+    serve,
+)
+from dbt_checkpoint.manifest_cache import shared_artifacts
+from dbt_checkpoint.runner import HookConfig
+from dbt_checkpoint.utils import CheckpointConfig, get_json
+
+
+@pytest.fixture
+def daemon_socket(tmpdir):
+    project_dir = tmpdir.mkdir("daemon")
+    config = CheckpointConfig(Path(), None, {"dbt-project-dir": str(project_dir)})
+    socket_path = get_socket_path(config)
+    project_dir.mkdir("target").mkdir(".dbt-checkpoint-cache")
+    with shared_artifacts(), HookServer(socket_path, HookRequestHandler) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield socket_path
+        server.shutdown()
+        thread.join()
+
+
+def test_get_socket_path():
+    config = CheckpointConfig(Path(), None, {})
+    assert get_socket_path(config) == "target/.dbt-checkpoint-cache/daemon.sock"
+    config = CheckpointConfig(Path(), None, {"dbt-project-dir": "dbt"})
+    assert get_socket_path(config) == ("dbt/target/.dbt-checkpoint-cache/daemon.sock")
+
+
+def test_request_hooks(daemon_socket, manifest_path_str, config_path_str):
+    hooks = [
+        HookConfig("check-model-has-tests", args=["--manifest", manifest_path_str]),
+        HookConfig(
+            "check-model-has-description", args=["--manifest", manifest_path_str]
+        ),
+    ]
+    with patch("dbt_checkpoint.utils.get_json", side_effect=get_json) as mock_json:
+        for _ in range(2):
+            results = request_hooks(
+                daemon_socket, hooks, ["aa/bb/with_test1.sql"], config_path_str
+            )
+            assert [result.status_code for result in results] == [0, 1]
+    # the manifest stays in memory between requests
+    assert mock_json.call_count == 1
+    assert "does not have defined description" in results[1].output
+
+
+def test_request_hooks_without_daemon(tmpdir, config_path_str):
+    hooks = [HookConfig("check-model-has-tests")]
+    socket_path = str(tmpdir.join("missing.sock"))
+    assert request_hooks(socket_path, hooks, [], config_path_str) is None
+    # stale socket file left behind by a daemon that is gone
+    tmpdir.join("missing.sock").write("")
+    assert request_hooks(socket_path, hooks, [], config_path_str) is None
+
+
+def test_serve_twice(daemon_socket, capsys):
+    assert is_daemon_running(daemon_socket)
+    assert serve(daemon_socket) == 1
+    assert "already running" in capsys.readouterr().out
+    # the running daemon keeps its socket
+    assert is_daemon_running(daemon_socket)
+
+
+def test_serve_stale(tmpdir):
+    socket_path = str(tmpdir.join("daemon.sock"))
+    with HookServer(socket_path, HookRequestHandler):
+        pass
+    assert tmpdir.join("daemon.sock").exists()
+    assert not is_daemon_running(socket_path)
+    with patch.object(HookServer, "serve_forever", side_effect=KeyboardInterrupt):
+        assert serve(socket_path) == 0
+    assert not tmpdir.join("daemon.sock").exists()
+
+
+def test_run_through_daemon(daemon_socket, tmpdir, manifest_path_str, capsys):
+    config = {
+        "version": 1,
+        "disable-tracking": True,
+        "dbt-project-dir": str(tmpdir.join("daemon")),
+        "hooks": [
+            {
+                "id": "check-model-has-tests",
+                "args": ["--test-cnt", "3", "--manifest", manifest_path_str],
+            }
+        ],
+    }
+    config_path = tmpdir.join(".dbt-checkpoint.yaml")
+    config_path.write(yaml.dump(config))
+    args = ["run", "--config", str(config_path), "aa/bb/with_test1.sql"]
+
+    with patch("dbt_checkpoint.daemon.run_hooks", return_value=[]) as mock_run_hooks:
+        assert main(args) == 0
+        mock_run_hooks.assert_called_once()
+    assert main(args) == 1
+    assert "has only 2 tests, but 3 are required" in capsys.readouterr().out
+    # --no-daemon runs in this process
+    with patch("dbt_checkpoint.daemon.run_hooks") as mock_run_hooks:
+        assert main([*args, "--no-daemon"]) == 1
+        mock_run_hooks.assert_not_called()
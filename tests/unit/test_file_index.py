@@ -0,0 +1,42 @@
+from dbt_checkpoint.file_index import FileIndex, get_file_index, reset_file_indexes
+
+
+def make_tree(root, paths):
+    for path in paths:
+        root.join(path).ensure()
+
+
+def test_file_index_find(tmpdir):
+    make_tree(
+        tmpdir,
+        [
+            "models/schema.yml",
+            "dbt/models/schema.yml",
+            "dbt/models/my_schema.yml",
+            "target/compiled/models/schema.yml",
+            "dbt_packages/pkg/models/schema.yml",
+            ".git/models/schema.yml",
+        ],
+    )
+    index = FileIndex(str(tmpdir))
+    assert sorted(index.find("models/schema.yml")) == [
+        "dbt/models/schema.yml",
+        "models/schema.yml",
+    ]
+    assert index.find("dbt/models/schema.yml") == ["dbt/models/schema.yml"]
+    assert index.find("bt/models/schema.yml") == []
+    assert index.find("") == []
+
+
+def test_get_file_index_walks_once(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    reset_file_indexes()
+    make_tree(tmpdir, ["models/a.sql"])
+    index = get_file_index()
+    assert index.find("a.sql") == ["models/a.sql"]
+    make_tree(tmpdir, ["models/b.sql"])
+    assert get_file_index() is index
+    assert index.find("b.sql") == []
+    reset_file_indexes()
+    assert get_file_index().find("b.sql") == ["models/b.sql"]
+    reset_file_indexes()
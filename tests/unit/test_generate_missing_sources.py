@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch
 
 import pytest
@@ -105,3 +106,42 @@ def test_create_missing_sources(
 
     result = schema.read_text("utf-8")
     assert result == schema_result
+
+
+def test_generate_missing_sources_static_deps(tmpdir, config_path_str):
+    path = tmpdir.join("models", "orders.sql")
+    path.ensure()
+    path.write_text("select * from {{ source('raw', 'orders') }}", "utf-8")
+    manifest = {
+        "metadata": {"project_name": "proj"},
+        "nodes": {
+            "model.proj.orders": {
+                "name": "orders",
+                "package_name": "proj",
+                "original_file_path": "models/orders.sql",
+                "depends_on": {"nodes": []},
+            },
+        },
+        "sources": {},
+    }
+    manifest_path = tmpdir.join("target", "manifest.json")
+    manifest_path.ensure()
+    manifest_path.write_text(json.dumps(manifest), "utf-8")
+    schema = tmpdir.join("schema.yml")
+    schema.write_text("sources:\n- name: raw\n  tables: []\n", "utf-8")
+    argv = [
+        str(path),
+        "--schema-file",
+        str(schema),
+        "--manifest",
+        str(manifest_path),
+        "--config",
+        config_path_str,
+    ]
+
+    # the manifest predates the source() call
+    assert main(argv) == 0
+    assert main([*argv, "--static-deps"]) == 1
+    assert schema.read_text("utf-8") == (
+        "sources:\n- name: raw\n  tables:\n  - name: orders\n"
+    )
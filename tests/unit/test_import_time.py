@@ -0,0 +1,74 @@
+import subprocess
+import sys
+
+import pytest
+
+# Sum of the cumulative import times of the dbt_checkpoint modules imported
+# by a hook, in microseconds. Nested modules are counted in every parent,
+# a hook measures ~250ms: the budget only catches large regressions.
+IMPORT_TIME_BUDGET_US = 750_000
+RUNS = 3
+# Modules that hooks import on first use only: importing tracking's
+# mixpanel/requests stack eagerly made every hook ~4x slower to start.
+DEFERRED_MODULES = (
+    "mixpanel",
+    "requests",
+    "urllib3",
+    "yaml",
+    "multiprocessing",
+    "concurrent.futures",
+    "dbt_checkpoint.lineage_graph",
+    "dbt_checkpoint.manifest_overlay",
+    "dbt_checkpoint.sql_dependencies",
+)
+
+
+def get_imported_modules(module):
+    """Names in `sys.modules` of a fresh interpreter after `import module`."""
+    stdout = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; print('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return set(stdout.splitlines())
+
+
+def get_package_import_time(module):
+    """Cumulative `-X importtime` of the dbt_checkpoint modules, summed."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip().split(".")[0] == "dbt_checkpoint":
+            total += int(cumulative)
+    return total
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "dbt_checkpoint.check_script_semicolon",
+        "dbt_checkpoint.check_script_has_no_table_name",
+        "dbt_checkpoint.check_model_has_tests",
+    ],
+)
+def test_hook_import_time(module):
+    # The fastest run is the least affected by a busy machine.
+    import_time = min(get_package_import_time(module) for _ in range(RUNS))
+    assert 0 < import_time < IMPORT_TIME_BUDGET_US
+    imported = get_imported_modules(module)
+    assert module in imported
+    for deferred in DEFERRED_MODULES:
+        assert deferred not in imported, f"{module} imports {deferred}"
@@ -0,0 +1,64 @@
+import math
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from dbt_checkpoint import json_backends
+from dbt_checkpoint.json_backends import get_json_loader, load_json
+from dbt_checkpoint.utils import (
+    CheckpointConfig,
+    JsonOpenError,
+    get_artifact_json,
+    get_json,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_loaders():
+    get_json_loader.cache_clear()
+    yield
+    get_json_loader.cache_clear()
+
+
+@pytest.mark.parametrize("backend", ["auto", *json_backends.JSON_BACKENDS])
+def test_load_json(tmp_path, backend):
+    path = tmp_path / "manifest.json"
+    path.write_text('{"nodes": {"model.a": {"name": "é", "tags": [1, 2.5]}}}')
+    assert load_json(path, backend) == {
+        "nodes": {"model.a": {"name": "é", "tags": [1, 2.5]}}
+    }
+
+
+def test_get_json_loader_missing_backend():
+    with patch.dict(sys.modules, {"orjson": None, "simdjson": None}):
+        assert get_json_loader("auto") is json_backends._load_stdlib
+        assert get_json_loader("orjson") is json_backends._load_stdlib
+
+
+def test_load_json_falls_back_to_stdlib(tmp_path):
+    pytest.importorskip("orjson")
+    path = tmp_path / "manifest.json"
+    path.write_text('{"value": NaN, "big": 123456789012345678901234567890}')
+    result = load_json(path, "orjson")
+    assert math.isnan(result["value"])
+    assert result["big"] == 123456789012345678901234567890
+
+
+def test_get_json_unknown_backend(manifest_path_str):
+    with pytest.raises(ValueError, match="Unknown json-backend 'yaml'"):
+        get_json_loader("yaml")
+    with pytest.raises(JsonOpenError):
+        get_json(manifest_path_str, json_backend="yaml")
+
+
+def test_get_artifact_json_backend(manifest_path_str):
+    config = CheckpointConfig(
+        Path(), None, {"json-backend": "json", "disable-cache": True}
+    )
+    mock_load = Mock(side_effect=json_backends._load_stdlib)
+    with patch.dict(json_backends.JSON_BACKENDS, {"json": lambda: mock_load}):
+        result = get_artifact_json(manifest_path_str, config)
+    assert result == get_json(manifest_path_str)
+    mock_load.assert_called_once()
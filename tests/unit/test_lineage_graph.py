@@ -0,0 +1,111 @@
+from dbt_checkpoint.lineage_graph import LineageGraph
+
+# source -> stg -> int -> mart <- stg_2 <- seed, mart -> exposure
+PARENT_MAP = {
+    "exposure.proj.dashboard": ["model.proj.mart"],
+    "model.proj.mart": ["model.proj.int", "model.proj.stg_2"],
+    "model.proj.int": ["model.proj.stg"],
+    "model.proj.stg": ["source.proj.raw.orders"],
+    "model.proj.stg_2": ["seed.proj.countries"],
+    "source.proj.raw.orders": [],
+    "seed.proj.countries": [],
+    "test.proj.unique_mart_id": ["model.proj.mart"],
+}
+
+
+def get_child_map():
+    child_map = {key: [] for key in PARENT_MAP}
+    for key, parents in PARENT_MAP.items():
+        for parent in parents:
+            child_map[parent].append(key)
+    return child_map
+
+
+def test_lineage_graph():
+    graph = LineageGraph({"parent_map": PARENT_MAP, "child_map": get_child_map()})
+    assert graph.size == 7
+    assert "test.proj.unique_mart_id" not in graph.numbers
+    for number, parents in enumerate(graph.parents):
+        assert all(parent < number for parent in parents)
+    assert graph.get_depth("source.proj.raw.orders") == 0
+    assert graph.get_depth("model.proj.stg_2") == 1
+    assert graph.get_depth("model.proj.mart") == 3
+    assert graph.get_depth("exposure.proj.dashboard") == 4
+    assert graph.get_depth("model.proj.unknown") is None
+
+    ancestors = graph.get_ancestors("model.proj.mart")
+    assert set(graph.iter_ids(ancestors)) == {
+        "model.proj.int",
+        "model.proj.stg",
+        "model.proj.stg_2",
+        "source.proj.raw.orders",
+        "seed.proj.countries",
+    }
+    assert graph.count_ancestors("model.proj.mart", ("model",)) == 3
+    assert graph.count_ancestors("exposure.proj.dashboard", ("source",)) == 1
+    descendants = graph.get_descendants("model.proj.stg")
+    assert set(graph.iter_ids(descendants, descendants=True)) == {
+        "model.proj.int",
+        "model.proj.mart",
+        "exposure.proj.dashboard",
+    }
+    assert graph.count_descendants("source.proj.raw.orders", ("model",)) == 3
+    assert graph.count_descendants("exposure.proj.dashboard") == 0
+
+
+def test_lineage_graph_memoized_closures():
+    graph = LineageGraph({"parent_map": PARENT_MAP})
+    # closures reuse those of the nodes looked up before
+    stg = graph.get_descendants("model.proj.stg")
+    assert graph.count_descendants("source.proj.raw.orders") == 4
+    assert graph.get_descendants("model.proj.stg") is stg
+    assert graph.count_ancestors("model.proj.int") == 2
+    assert graph.count_ancestors("exposure.proj.dashboard") == 6
+
+
+def test_lineage_graph_child_map_only():
+    child_map = get_child_map()
+    graph = LineageGraph({"child_map": child_map})
+    assert graph.size == 7
+    assert graph.get_depth("exposure.proj.dashboard") == 4
+    assert graph.count_ancestors("model.proj.mart") == 5
+
+
+def test_lineage_graph_partial_manifest():
+    # parents without their own entry in `parent_map` are still nodes
+    graph = LineageGraph({"parent_map": {"model.b": ["model.a"], "model.c": ["b"]}})
+    assert graph.size == 4
+    assert graph.get_depth("model.b") == 1
+    assert graph.count_ancestors("model.b") == 1
+
+
+def test_lineage_graph_cycle():
+    graph = LineageGraph(
+        {"parent_map": {"model.a": ["model.b"], "model.b": ["model.a"]}}
+    )
+    assert graph.size == 2
+    assert graph.count_ancestors("model.a") == 2
+
+
+def test_lineage_graph_count_closures():
+    # a chain of models from a source, and an exposure on every model
+    parent_map = {"source.proj.raw.orders": []}
+    for number in range(100):
+        parent = f"model.proj.m{number - 1}" if number else "source.proj.raw.orders"
+        parent_map[f"model.proj.m{number}"] = [parent]
+        parent_map[f"exposure.proj.e{number}"] = [f"model.proj.m{number}"]
+    graph = LineageGraph({"parent_map": parent_map})
+    models = [f"model.proj.m{number}" for number in range(100)]
+    for node_ids in (models[:3], models):
+        ancestors = graph.count_closures(node_ids, ("model", "source"))
+        assert ancestors == {
+            node_id: graph.count_ancestors(node_id, ("model", "source"))
+            for node_id in node_ids
+        }
+        descendants = graph.count_closures(node_ids, descendants=True)
+        assert descendants == {
+            node_id: graph.count_descendants(node_id) for node_id in node_ids
+        }
+    assert ancestors["model.proj.m99"] == 100
+    assert descendants["model.proj.m0"] == 99 * 2 + 1
+    assert graph.count_closures(["model.proj.unknown"]) == {}
@@ -0,0 +1,54 @@
+import json
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+from dbt_checkpoint.manifest_cache import (
+    get_cache_dir,
+    get_cached_json,
+    get_fingerprint,
+)
+from dbt_checkpoint.utils import CheckpointConfig, get_artifact_json, get_json
+
+
+def test_get_cached_json_populates_and_reuses_cache(manifest_path_str):
+    loader = Mock(side_effect=get_json)
+    first = get_cached_json(manifest_path_str, loader)
+    second = get_cached_json(manifest_path_str, loader)
+    assert first == second == get_json(manifest_path_str)
+    assert loader.call_count == 1
+    assert len(list(get_cache_dir(manifest_path_str).iterdir())) == 1
+
+
+def test_get_cached_json_invalidates_on_rewrite(manifest_path_str):
+    get_cached_json(manifest_path_str, get_json)
+    with open(manifest_path_str, "w") as file:
+        json.dump({"nodes": {"model.new": {}}}, file)
+    stat = os.stat(manifest_path_str)
+    os.utime(manifest_path_str, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    result = get_cached_json(manifest_path_str, get_json)
+    assert result == {"nodes": {"model.new": {}}}
+    # The stale entry of the previous manifest is removed
+    assert len(list(get_cache_dir(manifest_path_str).iterdir())) == 1
+
+
+def test_get_cached_json_corrupted_cache(manifest_path_str):
+    get_cached_json(manifest_path_str, get_json)
+    (cache_file,) = get_cache_dir(manifest_path_str).iterdir()
+    cache_file.write_bytes(b"\x00garbage")
+    assert get_cached_json(manifest_path_str, get_json) == get_json(manifest_path_str)
+
+
+def test_get_cached_json_missing_file():
+    loader = Mock(return_value={"key": "value"})
+    assert get_fingerprint("missing/manifest.json") is None
+    assert get_cached_json("missing/manifest.json", loader) == {"key": "value"}
+    loader.assert_called_once_with("missing/manifest.json")
+
+
+def test_get_artifact_json_disable_cache(manifest_path_str):
+    config = CheckpointConfig(Path(), None, {"disable-cache": True})
+    result = get_artifact_json(manifest_path_str, config)
+    assert result == get_json(manifest_path_str)
+    assert not get_cache_dir(manifest_path_str).exists()
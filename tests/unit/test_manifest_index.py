@@ -0,0 +1,190 @@
+from pathlib import Path
+
+import pytest
+
+from dbt_checkpoint.manifest_index import (
+    ManifestIndex,
+    get_lineage_key,
+    get_manifest_index,
+)
+from dbt_checkpoint.utils import (
+    Model,
+    ModelSchema,
+    SourceSchema,
+    get_disabled,
+    get_ephemeral,
+    get_macro_sqls,
+    get_macros,
+    get_manifest_node_from_file_path,
+    get_models,
+    get_parent_childs,
+    get_seeds,
+    get_snapshots,
+    get_tests,
+)
+
+MANIFEST = {
+    "nodes": {
+        "model.proj.orders.v2": {
+            "name": "orders",
+            "version": 2,
+            "original_file_path": "models/orders_v2.sql",
+        },
+        "model.proj.customers": {
+            "name": "customers",
+            "original_file_path": "models/marts/customers.sql",
+            "patch_path": "proj://models/marts/schema.yml",
+        },
+        "model.proj.eph": {"name": "eph", "config": {"materialized": "ephemeral"}},
+        "model.proj.off": {"name": "off", "config": {"enabled": False}},
+        "model.other.customers": {
+            "name": "customers",
+            "original_file_path": "models/staging/customers.sql",
+        },
+        "seed.proj.countries": {"name": "countries"},
+        "snapshot.proj.snap": {
+            "name": "snap",
+            "config": {"materialized": "snapshot"},
+        },
+        "test.proj.not_null": {"name": "not_null", "config": {"materialized": "test"}},
+        "model.proj.no_path": {"name": "no_path", "original_file_path": ""},
+    },
+    "macros": {
+        "macro.proj.cents": {"name": "cents", "path": "macros/cents.sql"},
+    },
+    "disabled": {"model.proj.gone": [{"name": "gone"}]},
+}
+
+
+def test_get_models_versioned_and_order():
+    models = list(get_models(MANIFEST, {"customers", "orders", "orders_v2"}))
+    assert [(m.model_id, m.filename) for m in models] == [
+        ("model.proj.orders.v2", "orders"),
+        ("model.proj.orders.v2", "orders_v2"),
+        ("model.proj.customers", "customers"),
+        ("model.other.customers", "customers"),
+    ]
+
+
+def test_get_models_ephemeral_and_disabled():
+    assert list(get_models(MANIFEST, {"eph", "off"})) == []
+    models = get_models(
+        MANIFEST, {"eph", "off"}, include_ephemeral=True, include_disabled=True
+    )
+    assert [m.model_id for m in models] == ["model.proj.eph", "model.proj.off"]
+
+
+def test_resource_type_getters():
+    assert [s.name for s in get_seeds(MANIFEST, {"countries"})] == ["countries"]
+    assert [s.name for s in get_snapshots(MANIFEST, {"snap"})] == ["snap"]
+    assert [t.name for t in get_tests(MANIFEST, {"not_null"})] == ["not_null"]
+    assert [m.macro_id for m in get_macros(MANIFEST, {"cents"})] == ["macro.proj.cents"]
+    assert get_ephemeral(MANIFEST) == ["eph"]
+    assert get_disabled(MANIFEST) == ["gone"]
+    assert get_disabled(MANIFEST, include_disabled=True) == []
+    assert get_macro_sqls(["macros/cents.sql", "models/a.sql"], MANIFEST) == {
+        "cents": Path("macros/cents.sql")
+    }
+
+
+def test_get_manifest_node_from_file_path():
+    node = get_manifest_node_from_file_path(
+        MANIFEST, "dbt_project/models/staging/customers.sql"
+    )
+    assert node["original_file_path"] == "models/staging/customers.sql"
+    assert get_manifest_node_from_file_path(MANIFEST, "models/unknown.sql") == {}
+    # Only whole path components are matched
+    assert get_manifest_node_from_file_path(MANIFEST, "xmodels/orders_v2.sql") == {}
+
+
+def test_get_manifest_node_from_file_path_duplicates():
+    manifest = {
+        "nodes": {
+            "model.proj_a.orders": {"original_file_path": "models/orders.sql"},
+            "model.proj_b.orders": {
+                "package_name": "proj_b",
+                "original_file_path": "models/orders.sql",
+            },
+            "model.proj_b.stg_orders": {
+                "original_file_path": "models/staging/orders.sql",
+            },
+        }
+    }
+    node = get_manifest_node_from_file_path(manifest, "proj_b/models/orders.sql")
+    assert node["package_name"] == "proj_b"
+    node = get_manifest_node_from_file_path(manifest, "/repo/models/orders.sql")
+    assert node == manifest["nodes"]["model.proj_a.orders"]
+    # the longest `original_file_path` wins over a same-named file
+    node = get_manifest_node_from_file_path(
+        manifest, "proj_a/models/staging/orders.sql"
+    )
+    assert node == manifest["nodes"]["model.proj_b.stg_orders"]
+
+
+def test_get_manifest_index_is_reused_and_refreshed():
+    manifest = {"nodes": {"model.proj.a": {"name": "a"}}}
+    index = get_manifest_index(manifest)
+    assert get_manifest_index(manifest) is index
+    manifest["nodes"]["model.proj.b"] = {"name": "b"}
+    refreshed = get_manifest_index(manifest)
+    assert refreshed is not index
+    assert "b" in refreshed.model_filenames
+
+
+def test_manifest_index_patch_paths():
+    index = ManifestIndex(MANIFEST)
+    assert index.get_property_paths().find("dbt/models/marts/schema.yml") == [
+        "model.proj.customers"
+    ]
+    assert index.get_property_paths().find("models/schema.yml") == []
+    assert set(index.resource_types) == {"model", "seed", "snapshot", "test"}
+
+
+LINEAGE_MANIFEST = {
+    "nodes": {
+        "model.proj.orders.v1": {"name": "orders", "path": "orders_v1.sql"},
+        "model.proj.orders.v2": {"name": "orders", "path": "orders_v2.sql"},
+        "test.proj.unique_orders": {"tags": [], "test_metadata": {"name": "unique"}},
+    },
+    "sources": {"source.proj.raw.orders": {"source_name": "raw", "name": "orders"}},
+    "child_map": {
+        "source.proj.raw.orders": ["model.proj.orders.v1", "model.proj.orders.v2"],
+        "model.proj.orders.v1": ["test.proj.unique_orders"],
+        "model.proj.orders.v2": [],
+        "test.proj.unique_orders": [],
+    },
+    "parent_map": {"model.proj.orders.v2": ["source.proj.raw.orders"]},
+}
+
+
+@pytest.mark.parametrize(
+    "unique_id,expected",
+    [
+        ("source.proj.raw.orders", ("source", "raw", "orders")),
+        ("source.raw.orders", ("source", "raw", "orders")),
+        ("model.proj.orders", ("model", "orders")),
+        ("model.proj.orders.v1", ("model", "orders")),
+        ("model.orders", ("model", "orders")),
+        ("test.proj.unique_orders", None),
+    ],
+)
+def test_get_lineage_key(unique_id, expected):
+    assert get_lineage_key(unique_id) == expected
+
+
+def test_get_parent_childs_by_lineage_key():
+    source = SourceSchema("raw", "orders", "schema", {}, {})
+    childs = get_parent_childs(LINEAGE_MANIFEST, source, "child_map", ["model"])
+    assert [child.model_id for child in childs] == [
+        "model.proj.orders.v1",
+        "model.proj.orders.v2",
+    ]
+
+    schema = ModelSchema("orders", "schema", {}, Path("schema.yml"))
+    childs = get_parent_childs(LINEAGE_MANIFEST, schema, "child_map", ["test"])
+    assert [child.test_name for child in childs] == ["unique"]
+
+    model = Model("model.proj.orders.v2", "orders", "orders_v2", {})
+    parents = get_parent_childs(LINEAGE_MANIFEST, model, "parent_map", ["source"])
+    assert [parent.source_id for parent in parents] == ["source.proj.raw.orders"]
+    assert list(get_parent_childs(LINEAGE_MANIFEST, object(), "child_map", [])) == []
@@ -0,0 +1,100 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dbt_checkpoint import manifest_loader
+from dbt_checkpoint.manifest_cache import get_cache_dir, shared_artifacts
+from dbt_checkpoint.manifest_loader import get_selection_key, load_json_selection
+from dbt_checkpoint.utils import (
+    MODEL_MANIFEST_SELECTION,
+    CheckpointConfig,
+    JsonOpenError,
+    get_artifact_json,
+    get_json,
+)
+
+CONFIG = CheckpointConfig(Path(), None, {})
+DOCUMENT = {
+    "metadata": {"user_id": "abc", "values": [1, 2.5e10, None, True]},
+    "nodes": {
+        "model.a": {"name": "a", "tags": ["x"], "raw_code": "select '}{\"'"},
+        "model.b": {"name": "b", "columns": {}},
+    },
+    "disabled": {"model.c": [{"name": "c"}, {"name": "c", "version": 2}]},
+    "docs": {"doc.a": {"block_contents": "x" * 100}},
+    "count": 12345678901234,
+    "semantic_models": None,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_load_json_selection(tmp_path, chunk_size, indent):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(DOCUMENT, indent=indent))
+    with patch.object(manifest_loader, "CHUNK_SIZE", chunk_size):
+        assert load_json_selection(str(path), dict.fromkeys(DOCUMENT)) == DOCUMENT
+        result = load_json_selection(
+            str(path),
+            {
+                "metadata": None,
+                "nodes": ("name", "tags"),
+                "disabled": ("version",),
+                "count": ("name",),
+                "semantic_models": ("name",),
+            },
+        )
+    assert result == {
+        "metadata": DOCUMENT["metadata"],
+        "nodes": {"model.a": {"name": "a", "tags": ["x"]}, "model.b": {"name": "b"}},
+        "disabled": {"model.c": [{}, {"version": 2}]},
+        "count": 12345678901234,
+        "semantic_models": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "content", ['{"a": 1,}', '{"a" 1}', '{"a": 1} x', "[1]", '{"a": [1, }', ""]
+)
+def test_load_json_selection_invalid(tmp_path, content):
+    path = tmp_path / "manifest.json"
+    path.write_text(content)
+    with pytest.raises(json.JSONDecodeError):
+        load_json_selection(str(path), {"a": None})
+
+
+def test_get_selection_key():
+    key = get_selection_key({"nodes": ("name", "tags"), "metadata": None})
+    assert key == get_selection_key({"metadata": None, "nodes": ["tags", "name"]})
+    assert key != get_selection_key({"metadata": None, "nodes": ("name",)})
+
+
+def test_get_artifact_json_selection(manifest_path_str):
+    full = get_json(manifest_path_str)
+    result = get_artifact_json(manifest_path_str, CONFIG, MODEL_MANIFEST_SELECTION)
+    assert set(result) == set(MODEL_MANIFEST_SELECTION) & set(full)
+    assert result["nodes"].keys() == full["nodes"].keys()
+    assert (
+        get_artifact_json(manifest_path_str, CONFIG, MODEL_MANIFEST_SELECTION) == result
+    )
+    # The whole manifest and the selection are cached side by side
+    assert get_artifact_json(manifest_path_str, CONFIG) == full
+    assert len(list(get_cache_dir(manifest_path_str).iterdir())) == 2
+
+
+def test_get_artifact_json_selection_shares_full_manifest(manifest_path_str):
+    with shared_artifacts():
+        full = get_artifact_json(manifest_path_str, CONFIG)
+        with patch.object(manifest_loader.JsonStream, "iter_object") as mock_iter:
+            result = get_artifact_json(manifest_path_str, CONFIG, {"nodes": ("name",)})
+        assert result is full
+        mock_iter.assert_not_called()
+
+
+def test_get_artifact_json_selection_invalid(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text('{"nodes": ')
+    with pytest.raises(JsonOpenError):
+        get_artifact_json(str(path), CONFIG, MODEL_MANIFEST_SELECTION)
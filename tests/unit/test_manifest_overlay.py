@@ -0,0 +1,99 @@
+import copy
+
+from dbt_checkpoint.manifest_overlay import apply_static_dependencies
+
+MANIFEST = {
+    "metadata": {"project_name": "proj"},
+    "nodes": {
+        "model.proj.orders": {
+            "name": "orders",
+            "package_name": "proj",
+            "original_file_path": "models/orders.sql",
+            "config": {"materialized": "view"},
+            "depends_on": {"nodes": ["model.proj.stg_orders"]},
+        },
+        "model.proj.stg_orders": {
+            "name": "stg_orders",
+            "package_name": "proj",
+            "original_file_path": "models/staging/stg_orders.sql",
+            "depends_on": {"nodes": ["source.proj.raw.orders"]},
+        },
+        "model.proj.customers.v1": {
+            "name": "customers",
+            "version": 1,
+            "latest_version": 2,
+            "original_file_path": "models/customers_v1.sql",
+        },
+        "model.proj.customers.v2": {
+            "name": "customers",
+            "version": 2,
+            "latest_version": 2,
+            "original_file_path": "models/customers_v2.sql",
+        },
+    },
+    "sources": {"source.proj.raw.orders": {"source_name": "raw", "name": "orders"}},
+    "parent_map": {
+        "model.proj.orders": ["model.proj.stg_orders"],
+        "model.proj.stg_orders": ["source.proj.raw.orders"],
+    },
+    "child_map": {
+        "model.proj.stg_orders": ["model.proj.orders"],
+        "source.proj.raw.orders": ["model.proj.stg_orders"],
+    },
+}
+
+
+def test_apply_static_dependencies(tmpdir):
+    manifest = copy.deepcopy(MANIFEST)
+    orders = tmpdir.join("dbt", "models", "orders.sql")
+    orders.ensure()
+    orders.write_text(
+        "{{ config(materialized='table') }}\n"
+        "select * from {{ ref('customers') }}\n"
+        "join {{ ref('customers', v=1) }} join {{ ref('new_model') }}\n"
+        "join {{ source('raw', 'orders') }} join {{ source('raw', 'payments') }}",
+        "utf-8",
+    )
+    new_model = tmpdir.join("dbt", "models", "marts", "new_model.sql")
+    new_model.ensure()
+    new_model.write_text("select * from {{ ref('orders') }}", "utf-8")
+    macro = tmpdir.join("dbt", "models", "my_macro.sql")
+    macro.ensure()
+    macro.write_text("{% macro my_macro() %}{{ ref('orders') }}{% endmacro %}", "utf-8")
+    paths = [str(orders), str(new_model), str(macro), "dbt/models/schema.yml"]
+
+    overlay = apply_static_dependencies(manifest, paths)
+
+    assert manifest == MANIFEST
+    orders_node = overlay["nodes"]["model.proj.orders"]
+    parents = [
+        "model.proj.customers.v2",
+        "model.proj.customers.v1",
+        "model.proj.new_model",
+        "source.proj.raw.orders",
+        "source.proj.raw.payments",
+    ]
+    assert orders_node["depends_on"]["nodes"] == parents
+    assert orders_node["config"] == {"materialized": "table"}
+    assert overlay["nodes"]["model.proj.new_model"]["original_file_path"] == (
+        "models/marts/new_model.sql"
+    )
+    assert "model.proj.my_macro" not in overlay["nodes"]
+    assert overlay["parent_map"]["model.proj.orders"] == parents
+    assert overlay["parent_map"]["model.proj.new_model"] == ["model.proj.orders"]
+    assert overlay["child_map"]["model.proj.stg_orders"] == []
+    assert overlay["child_map"]["model.proj.orders"] == ["model.proj.new_model"]
+    assert overlay["child_map"]["source.proj.raw.orders"] == [
+        "model.proj.stg_orders",
+        "model.proj.orders",
+    ]
+
+
+def test_apply_static_dependencies_dynamic(tmpdir):
+    orders = tmpdir.join("models", "orders.sql")
+    orders.ensure()
+    orders.write_text("select * from {{ ref(var('upstream')) }}", "utf-8")
+    overlay = apply_static_dependencies(MANIFEST, [str(orders)])
+    # edges that cannot be read from the file are kept
+    assert overlay["parent_map"]["model.proj.orders"] == ["model.proj.stg_orders"]
+    assert apply_static_dependencies(MANIFEST, ["models/unknown.yml"]) is MANIFEST
@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+from dbt_checkpoint.check_script_semicolon import main
+from dbt_checkpoint.parallel import get_jobs, map_in_processes
+
+
+def test_get_jobs():
+    with patch("os.cpu_count", return_value=8):
+        assert get_jobs(0, 10) == 1
+        assert get_jobs(0, 200) == 3
+        assert get_jobs(0, 10_000) == 8
+    assert get_jobs(4, 2) == 2
+    assert get_jobs(4, 0) == 1
+    assert get_jobs(1, 10_000) == 1
+
+
+def test_map_in_processes():
+    items = [(number, 7) for number in range(100)]
+    expected = [divmod(number, 7) for number in range(100)]
+    assert map_in_processes(divmod, items, jobs=1) == expected
+    assert map_in_processes(divmod, items, jobs=3) == expected
+    assert map_in_processes(divmod, [], jobs=3) == []
+
+
+def test_hook_jobs_output_order(tmpdir, manifest_path_str, capsys):
+    filenames = []
+    for number in range(20):
+        sql = tmpdir.join(f"model_{number}.sql")
+        sql.write("select 1;" if number % 3 else "select 1")
+        filenames.append(str(sql))
+    argv = [*filenames, "--manifest", manifest_path_str, "--jobs", "4"]
+    assert main(argv) == 1
+    printed = [
+        filename
+        for line in capsys.readouterr().out.splitlines()
+        for filename in filenames
+        if f"{filename}\x1b" in line
+    ]
+    assert printed == [
+        filename for number, filename in enumerate(filenames) if number % 3
+    ]
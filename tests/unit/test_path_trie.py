@@ -0,0 +1,41 @@
+from dbt_checkpoint.path_trie import PathTrie, split_path
+
+
+def test_split_path():
+    assert split_path("models/staging/orders.sql") == [
+        "models",
+        "staging",
+        "orders.sql",
+    ]
+    assert split_path("proj://models\\orders.yml") == ["models", "orders.yml"]
+    assert split_path("/repo/./models//orders.sql") == ["repo", "models", "orders.sql"]
+
+
+def test_path_trie_find():
+    trie = PathTrie()
+    trie.add("models/orders.sql", "model.a.orders")
+    trie.add("models/staging/orders.sql", "model.a.stg_orders")
+    trie.add("models/orders.sql", "model.b.orders")
+    assert trie.find("models/orders.sql") == ["model.a.orders", "model.b.orders"]
+    assert trie.find("C:\\repo\\dbt\\models\\staging\\orders.sql") == [
+        "model.a.stg_orders"
+    ]
+    assert trie.match("/repo/dbt/models/orders.sql") == (
+        ["model.a.orders", "model.b.orders"],
+        ["repo", "dbt"],
+    )
+    # Only whole path components are matched
+    assert trie.find("xmodels/orders.sql") == []
+    assert trie.find("orders.sql") == []
+    assert trie.find("") == []
+
+
+def test_path_trie_leaves():
+    trie = PathTrie()
+    trie.add("a/b/c.sql", "1")
+    trie.add("b/c.sql", "2")
+    trie.add("x/a/b/c.sql", "3")
+    trie.add("a/b/c.sql", "4")
+    assert trie.find("a/b/c.sql") == ["1", "4"]
+    assert trie.find("y/b/c.sql") == ["2"]
+    assert trie.match("y/x/a/b/c.sql") == (["3"], ["y"])
@@ -0,0 +1,75 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from dbt_checkpoint import property_files
+from dbt_checkpoint.property_files import PropertyFileIndex
+from dbt_checkpoint.utils import get_model_schemas, get_source_schemas
+
+SCHEMA_YML = """
+version: 2
+
+models:
+  - name: orders
+    description: Orders
+sources:
+  - name: raw
+    tables:
+      - name: orders
+exposures:
+  - name: dashboard
+"""
+
+
+def test_property_file_index_parses_once(tmpdir):
+    path = tmpdir.join("schema.yml")
+    path.write(SCHEMA_YML)
+    index = PropertyFileIndex()
+    with patch.object(
+        property_files, "safe_load", side_effect=property_files.safe_load
+    ) as mock_load:
+        property_file = index.get(str(path))
+        assert index.get(Path(path)) is property_file
+        assert mock_load.call_count == 1
+    assert [model["name"] for model in property_file.models] == ["orders"]
+    assert [source["name"] for source in property_file.sources] == ["raw"]
+    assert [exposure["name"] for exposure in property_file.exposures] == ["dashboard"]
+    assert property_file.macros == property_file.seeds == []
+
+
+def test_property_file_index_reparses_modified_file(tmpdir):
+    path = tmpdir.join("schema.yml")
+    path.write(SCHEMA_YML)
+    index = PropertyFileIndex()
+    assert len(index.get(str(path)).models) == 1
+
+    path.write(SCHEMA_YML + "  - name: report\n")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    property_file = index.get(str(path))
+    assert [exposure["name"] for exposure in property_file.exposures] == [
+        "dashboard",
+        "report",
+    ]
+
+
+def test_property_file_index_invalid_content(tmpdir):
+    path = tmpdir.join("schema.yml")
+    path.write("- just\n- a list\n")
+    property_file = PropertyFileIndex().get(str(path))
+    assert property_file.content == {}
+    assert property_file.models == []
+    tmpdir.join("empty.yml").write("")
+    assert PropertyFileIndex().get(str(tmpdir.join("empty.yml"))).content == {}
+
+
+def test_schema_getters_share_parsed_file(tmpdir):
+    path = Path(tmpdir.join("schema.yml"))
+    path.write_text(SCHEMA_YML)
+    for _ in range(2):
+        # the shared source is not modified by the getter
+        (source,) = get_source_schemas([path])
+        assert source.table_name == "orders"
+        assert "tables" not in source.source_schema
+    (model,) = get_model_schemas([path], {"orders"})
+    assert model.schema["description"] == "Orders"
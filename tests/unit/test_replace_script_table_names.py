@@ -1,6 +1,11 @@
 import pytest
 
-from dbt_checkpoint.replace_script_table_names import get_source_from_name, main
+from dbt_checkpoint.replace_script_table_names import (
+    get_ref_from_name,
+    get_source_from_name,
+    main,
+    replace_table_names,
+)
 
 # Input, expected return value, expected output
 TESTS = (  # type: ignore
@@ -192,3 +197,57 @@ def test_get_source_from_name(manifest):
         ("prod.source1.src3", "{{ source('source1', 'src3') }}"),
         ("dev2.source1.src3", "{{ source('source1', 'src3') }}"),
     ]
+
+
+def test_get_ref_from_name(manifest):
+    tables = {"prod.replaced_model", "raw.unknown"}
+    result = get_ref_from_name(manifest, tables)
+    assert list(result) == [("prod.replaced_model", "{{ ref('replaced_model') }}")]
+    assert tables == {"raw.unknown"}
+
+
+def test_replace_table_names():
+    sql = (
+        "select * from Raw.Orders o\n"
+        "join raw.orders\tx join rawXorders join raw.orders"
+    )
+    result = replace_table_names(sql, {"raw.orders": "{{ source('raw', 'orders') }}"})
+    assert result == (
+        "select * from {{ source('raw', 'orders') }} o\n"
+        "join {{ source('raw', 'orders') }}\tx join rawXorders join raw.orders"
+    )
+    assert replace_table_names(sql, {}) is sql
+
+
+def test_get_source_from_name_relations():
+    manifest = {
+        "sources": {
+            "source.proj.raw.orders": {
+                "source_name": "raw",
+                "name": "orders",
+                "identifier": "ORDERS_V2",
+                "database": "PROD",
+                "schema": "RAW",
+            },
+            "source.proj.stage.orders": {
+                "source_name": "stage",
+                "name": "orders",
+                "database": "prod",
+                "schema": "stage",
+            },
+        },
+    }
+    tables = {
+        '"prod"."raw"."orders_v2"',
+        "[raw].[orders]",
+        "`stage.orders`",
+        "dev.raw.orders",
+        "raw.prod.orders",
+    }
+    result = get_source_from_name(manifest, tables)
+    assert sorted(result) == [
+        ('"prod"."raw"."orders_v2"', "{{ source('raw', 'orders') }}"),
+        ("[raw].[orders]", "{{ source('raw', 'orders') }}"),
+        ("`stage.orders`", "{{ source('stage', 'orders') }}"),
+    ]
+    assert tables == {"dev.raw.orders", "raw.prod.orders"}
@@ -0,0 +1,119 @@
+import os
+import time
+from unittest.mock import Mock, patch
+
+from dbt_checkpoint import result_cache
+from dbt_checkpoint import check_model_columns_have_desc, check_model_has_description
+from dbt_checkpoint.check_script_has_no_table_name import main
+from dbt_checkpoint.manifest_cache import read_marshal
+from dbt_checkpoint.result_cache import HookResultCache, evict_cache_files
+
+
+def failing_check():
+    print("file.sql: failed")
+    return 1
+
+
+def test_result_cache_replays_output(tmp_path, capsys):
+    cache_file = tmp_path / "results" / "hook.marshal"
+    key = HookResultCache.get_key("file.sql", b"select 1", {"node": "a"})
+    assert key != HookResultCache.get_key("file.sql", b"select 1", {"node": "b"})
+    assert key != HookResultCache.get_key("other.sql", b"select 1", {"node": "a"})
+
+    cache = HookResultCache(cache_file)
+    assert cache.run(key, failing_check) == 1
+    cache.save()
+    assert capsys.readouterr().out == "file.sql: failed\n"
+
+    evaluate = Mock(return_value=0)
+    assert HookResultCache(cache_file).run(key, evaluate) == 1
+    evaluate.assert_not_called()
+    assert capsys.readouterr().out == "file.sql: failed\n"
+
+
+def test_result_cache_disabled():
+    evaluate = Mock(return_value=0)
+    cache = HookResultCache(None)
+    for _ in range(2):
+        assert cache.run("key", evaluate) == 0
+    cache.save()
+    assert evaluate.call_count == 2
+
+
+def test_result_cache_merges_and_evicts(tmp_path):
+    cache_file = tmp_path / "hook.marshal"
+    first, second = HookResultCache(cache_file), HookResultCache(cache_file)
+    first.run("a", lambda: 0)
+    second.run("b", lambda: 0)
+    first.save()
+    second.save()
+    assert set(read_marshal(cache_file)) == {"a", "b"}
+
+    old = time.time() - result_cache.RESULT_MAX_AGE - 1
+    first.entries["a"] = first._updated["a"] = (old, 0, "")
+    with patch.object(result_cache, "RESULT_MAX_ENTRIES", 2):
+        for key in "cd":
+            first.run(key, lambda: 0)
+        first.save()
+    assert set(read_marshal(cache_file)) == {"c", "d"}
+
+
+def test_evict_cache_files(tmp_path):
+    for age, name in enumerate(["new", "current", "old"]):
+        path = tmp_path / f"{name}.marshal"
+        path.write_bytes(b"x" * 10)
+        mtime = time.time() - age * 100
+        os.utime(path, (mtime, mtime))
+    with patch.object(result_cache, "RESULTS_DIR_MAX_BYTES", 20):
+        evict_cache_files(tmp_path, tmp_path / "current.marshal")
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "current.marshal",
+        "new.marshal",
+    ]
+
+
+def test_hook_skips_unchanged_files(tmpdir, manifest_path_str, config_path_str):
+    sql = tmpdir.join("model.sql")
+    sql.write("select * from raw.orders")
+    argv = [str(sql), "--manifest", manifest_path_str, "--config", config_path_str]
+    with patch(
+        "dbt_checkpoint.check_script_has_no_table_name.has_table_name",
+        return_value=(1, {"raw.orders"}),
+    ) as mock_check:
+        assert main(argv) == 1
+        assert main(argv) == 1
+        assert mock_check.call_count == 1
+        sql.write("select * from raw.customers")
+        assert main(argv) == 1
+        assert mock_check.call_count == 2
+
+
+def test_description_hooks_skip_unchanged_models(
+    tmpdir, manifest_path_str, config_path_str
+):
+    yml = tmpdir.join("schema.yml")
+    yml.write("models:\n- name: without_description\n  columns:\n  - name: a\n")
+    argv = [
+        "without_description.sql",
+        str(yml),
+        "--manifest",
+        manifest_path_str,
+        "--config",
+        config_path_str,
+    ]
+    for hook, evaluate in [
+        (check_model_has_description, "print_missing_description"),
+        (check_model_columns_have_desc, "print_missing_columns"),
+    ]:
+        yml.write("models:\n- name: without_description\n  columns:\n  - name: a\n")
+        with patch.object(hook, evaluate, wraps=getattr(hook, evaluate)) as mock_check:
+            assert hook.main(argv) == 1
+            assert hook.main(argv) == 1
+            assert mock_check.call_count == 1
+            # the property file entry is part of the key
+            yml.write(
+                "models:\n- name: without_description\n  description: x\n"
+                "  columns:\n  - name: a\n    description: x\n"
+            )
+            assert hook.main(argv) == 0
+            assert mock_check.call_count == 2
@@ -0,0 +1,143 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from dbt_checkpoint.cli import main
+from dbt_checkpoint.runner import (
+    HookConfig,
+    filter_filenames,
+    get_hook_ids,
+    get_hooks_config,
+    run_hooks,
+)
+from dbt_checkpoint.utils import CheckpointConfig, get_checkpoint_config, get_json
+
+
+def write_config(tmpdir, hooks):
+    file = tmpdir.join(".dbt-checkpoint.yaml")
+    file.write(yaml.dump({"version": 1, "disable-tracking": True, "hooks": hooks}))
+    return str(file)
+
+
+def test_get_hook_ids():
+    hook_ids = get_hook_ids()
+    assert "check-model-has-tests" in hook_ids
+    assert "dbt-parse" in hook_ids
+    assert "utils" not in hook_ids
+    assert "runner" not in hook_ids
+
+
+def test_get_hooks_config():
+    hooks = [
+        "check-model-tags",
+        {"id": "check-model-has-tests", "args": ["--test-cnt", 2]},
+    ]
+    config = CheckpointConfig(Path(), None, {"hooks": hooks})
+    assert get_hooks_config(config) == [
+        HookConfig("check-model-tags"),
+        HookConfig("check-model-has-tests", args=["--test-cnt", "2"]),
+    ]
+    assert get_hooks_config(config, ["check-model-has-tests", "dbt-parse"]) == [
+        HookConfig("check-model-has-tests", args=["--test-cnt", "2"]),
+        HookConfig("dbt-parse"),
+    ]
+
+
+def test_filter_filenames():
+    hook = HookConfig("check-model-tags", files=r"\.sql$", exclude="^staging/")
+    filenames = ["staging/a.sql", "marts/b.sql", "marts/b.yml"]
+    assert filter_filenames(hook, filenames) == ["marts/b.sql"]
+
+
+def test_filter_filenames_hook_types():
+    filenames = ["models/a.sql", "models/schema.yml", "models/other.yaml"]
+    assert filter_filenames(HookConfig("check-script-semicolon"), filenames) == [
+        "models/a.sql"
+    ]
+    assert filter_filenames(HookConfig("check-model-has-contract"), filenames) == [
+        "models/schema.yml",
+        "models/other.yaml",
+    ]
+    assert filter_filenames(HookConfig("check-model-tags"), filenames) == filenames
+    # the hook's own filter applies before the configured one
+    hook = HookConfig("check-script-semicolon", files=r"\.(sql|yml)$")
+    assert filter_filenames(hook, filenames) == ["models/a.sql"]
+
+
+def test_run_sql_hook_skips_yaml(tmpdir, manifest_path_str):
+    sql_file = tmpdir.join("model.sql")
+    sql_file.write("SELECT * FROM {{ ref('customers') }};")
+    yml_file = tmpdir.join("schema.yml")
+    yml_content = "models:\n  - name: customers\n    description: from orders;\n"
+    yml_file.write(yml_content)
+    args = ["--manifest", manifest_path_str]
+    config_path = write_config(
+        tmpdir,
+        [
+            {"id": "check-script-has-no-table-name", "args": args},
+            {"id": "remove-script-semicolon", "args": args},
+        ],
+    )
+    results = run_hooks(
+        get_hooks_config(get_checkpoint_config(config_path)),
+        [str(sql_file), str(yml_file)],
+        config_path,
+    )
+    assert [result.hook_id for result in results] == [
+        "check-script-has-no-table-name",
+        "remove-script-semicolon",
+    ]
+    assert results[0].status_code == 0
+    assert sql_file.read() == "SELECT * FROM {{ ref('customers') }}"
+    assert yml_file.read() == yml_content
+
+
+def test_run(tmpdir, manifest_path_str, capsys):
+    args = ["--manifest", manifest_path_str, "--is_test"]
+    config_path = write_config(
+        tmpdir,
+        [
+            {"id": "check-model-has-tests", "args": ["--test-cnt", "1", *args]},
+            {"id": "check-model-has-description", "args": args},
+        ],
+    )
+    with patch("dbt_checkpoint.utils.get_json", side_effect=get_json) as mock_json:
+        status_code = main(
+            ["run", "--config", config_path, "aa/bb/with_test1.sql"],
+        )
+    # the manifest was parsed once for both hooks
+    assert mock_json.call_count == 1
+    assert status_code == 1
+    output = capsys.readouterr().out
+    assert "check-model-has-tests" in output
+    assert "does not have defined description" in output
+
+
+def test_run_single_hook(tmpdir, manifest_path_str):
+    config_path = write_config(
+        tmpdir,
+        [
+            {"id": "check-model-has-tests", "args": ["--manifest", manifest_path_str]},
+            {"id": "check-model-has-description", "args": ["--unknown"]},
+        ],
+    )
+    args = ["run", "--config", config_path, "aa/bb/with_test1.sql"]
+    assert main([*args, "--hook", "check-model-has-tests"]) == 0
+    assert main([*args, "--hook", "check-model-has-description"]) == 1
+
+
+def test_run_unknown_hook_and_invalid_args(tmpdir, capsys):
+    config_path = write_config(
+        tmpdir,
+        ["not-a-hook", {"id": "check-model-has-tests", "args": ["--unknown"]}],
+    )
+    results = run_hooks(
+        get_hooks_config(get_checkpoint_config(config_path)), [], config_path
+    )
+    assert [result.status_code for result in results] == [1, 2]
+    assert "Unknown hook" in capsys.readouterr().out
+
+
+def test_run_without_hooks(tmpdir):
+    assert main(["run", "--config", write_config(tmpdir, [])]) == 1
@@ -0,0 +1,53 @@
+from dbt_checkpoint.sql_dependencies import Ref, extract_dependencies
+
+
+def test_extract_dependencies():
+    sql = """
+    {{ config(materialized='table', tags=['a', "b"], persist_docs={"relation": true}) }}
+    {# {{ ref('commented') }} #}
+    with orders as (select * from {{ ref('orders') }}),
+    customers as (select * from {{ ref("crm", "customers", v=2) }}),
+    payments as (select * from {{ source('raw', 'payments') }})
+    select ref('not_jinja') from {{ dbt_utils.star(from=ref('stg_orders')) }}
+    {% if config.get('materialized') == 'table' %}{% endif %}
+    """
+    dependencies = extract_dependencies(sql)
+    assert dependencies.refs == [
+        Ref(None, "orders", None),
+        Ref("crm", "customers", "2"),
+        Ref(None, "stg_orders", None),
+    ]
+    assert dependencies.sources == [("raw", "payments")]
+    assert dependencies.config == {
+        "materialized": "table",
+        "tags": ["a", "b"],
+        "persist_docs": {"relation": True},
+    }
+    assert not dependencies.dynamic
+
+
+def test_extract_dependencies_dynamic():
+    for sql in [
+        "select * from {{ ref(var('model')) }}",
+        "{% for name in names %}select * from {{ ref(name) }}{% endfor %}",
+        "select * from {{ source('raw', 'orders_' ~ suffix) }}",
+        "{{ config(**settings) }}",
+    ]:
+        assert extract_dependencies(sql).dynamic, sql
+    dependencies = extract_dependencies(
+        "select * from {{ ref('orders') }} join {{ ref(var('model')) }}"
+    )
+    assert dependencies.refs == [Ref(None, "orders", None)]
+    assert dependencies.dynamic
+
+
+def test_extract_dependencies_nested_braces():
+    sql = """
+    {{ config(meta={'a': {'b': 1}}) }}
+    {% set label = "}}" %}
+    select * from {{ ref('orders') }}
+    """
+    dependencies = extract_dependencies(sql)
+    assert dependencies.config == {"meta": {"a": {"b": 1}}}
+    assert dependencies.refs == [Ref(None, "orders", None)]
+    assert not dependencies.dynamic
@@ -0,0 +1,52 @@
+from dbt_checkpoint.sql_lexer import JINJA_VALUE, STRING_VALUE, tokenize
+
+
+def test_tokenize():
+    sql = """
+    -- leading comment
+    SELECT a, 'it''s from x' AS b /* from y */
+    FROM {{ ref('orders') }}
+    {# from z #}{% if true %}JOIN Raw.Customers{% endif %}
+    """
+    assert tokenize(sql) == [
+        "select",
+        "a,",
+        STRING_VALUE,
+        "as",
+        "b",
+        "from",
+        JINJA_VALUE,
+        JINJA_VALUE,
+        "join",
+        "raw.customers",
+        JINJA_VALUE,
+    ]
+
+
+def test_tokenize_punctuation():
+    sql = "select * from Raw.Orders where (x - 1) > 0 and y--z\n{ }"
+    assert tokenize(sql) == [
+        "select",
+        "*",
+        "from",
+        "raw.orders",
+        "where",
+        "(",
+        "x",
+        "-",
+        "1",
+        ")",
+        ">",
+        "0",
+        "and",
+        "y",
+        "{",
+        "}",
+    ]
+
+
+def test_tokenize_unterminated():
+    assert tokenize("select 1 /* from a") == ["select", "1"]
+    assert tokenize("select 'a from b") == ["select", "'", "a", "from", "b"]
+    assert tokenize("select 1 -- from a") == ["select", "1"]
+    assert tokenize("") == []
@@ -0,0 +1,76 @@
+from dbt_checkpoint.manifest_index import get_manifest_index
+from dbt_checkpoint.test_coverage import CoverageIndex
+from dbt_checkpoint.utils import Model, get_test_coverage
+
+MANIFEST = {
+    "nodes": {
+        "model.proj.orders": {"name": "orders"},
+        "test.proj.unique_orders_id": {
+            "tags": [],
+            "test_metadata": {"name": "unique"},
+        },
+        "test.proj.not_null_orders_id": {
+            "tags": ["nightly"],
+            "test_metadata": {"name": "not_null"},
+        },
+        "test.proj.not_null_orders_amount": {
+            "tags": ["nightly"],
+            "test_metadata": {"name": "not_null"},
+        },
+        "test.proj.assert_orders_positive": {"tags": ["data"]},
+    },
+    "child_map": {
+        "model.proj.orders": [
+            "test.proj.unique_orders_id",
+            "model.proj.customers",
+            "test.proj.not_null_orders_id",
+            "test.proj.not_null_orders_amount",
+            "test.proj.assert_orders_positive",
+            "test.proj.missing",
+        ],
+        "model.proj.customers": ["test.proj.not_null_orders_id"],
+        "model.proj.payments": [],
+    },
+}
+
+
+def test_coverage_index():
+    index = CoverageIndex(MANIFEST)
+    coverage = index.get_coverage(["model.proj.orders"])
+    assert coverage.total == 4
+    assert coverage.test_ids == (
+        "test.proj.unique_orders_id",
+        "test.proj.not_null_orders_id",
+        "test.proj.not_null_orders_amount",
+        "test.proj.assert_orders_positive",
+    )
+    assert coverage.by_name == {"unique": 1, "not_null": 2, "data": 1}
+    assert coverage.by_type == {"schema": 3, "data": 1}
+    assert coverage.test_tags[1] == {"nightly"}
+    # Identical tag sets are shared, tests are numbered once.
+    assert coverage.test_tags[1] is coverage.test_tags[2]
+    assert len(index.test_ids) == 4
+    # Nodes are indexed on first lookup only.
+    assert set(index.slices) == {"model.proj.orders"}
+    assert index.get_coverage(["model.proj.customers"]).total == 1
+    assert len(index.test_ids) == 4
+
+
+def test_coverage_of_several_nodes():
+    index = CoverageIndex(MANIFEST)
+    coverage = index.get_coverage(
+        ["model.proj.orders", "model.proj.customers", "model.proj.payments"]
+    )
+    assert coverage.total == 5
+    assert coverage.by_name["not_null"] == 3
+    empty = index.get_coverage(["model.proj.payments", "model.proj.missing"])
+    assert (empty.total, empty.by_name, empty.by_type) == (0, {}, {})
+
+
+def test_get_test_coverage():
+    model = Model("model.proj.orders", "orders", "orders", {})
+    coverage = get_test_coverage(MANIFEST, model)
+    assert coverage.by_name == {"unique": 1, "not_null": 2, "data": 1}
+    # Built once per manifest and shared by the hooks.
+    test_coverage = get_manifest_index(MANIFEST).get_test_coverage()
+    assert get_manifest_index(MANIFEST).get_test_coverage() is test_coverage
@@ -1,12 +1,61 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest.mock import patch
+from urllib.parse import parse_qs
 
-import mixpanel
 import pytest
 
-from dbt_checkpoint.tracking import dbtCheckpointTracking
+from dbt_checkpoint import tracking
+from dbt_checkpoint.tracking import (
+    LAST_FLUSH_FILENAME,
+    SPOOL_FILENAME,
+    SpoolConsumer,
+    dbtCheckpointTracking,
+    flush_events,
+    flush_is_due,
+)
 from dbt_checkpoint.utils import get_config_file
 
 
+@pytest.fixture
+def spool_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path / "dbt-checkpoint" / "tracking"
+
+
+@pytest.fixture
+def events_endpoint():
+    """Local stand-in for the Mixpanel /track endpoint."""
+    batches = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            batches.append(json.loads(parse_qs(body.decode())["data"][0]))
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b'{"status": 1}')
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/track", batches
+    server.shutdown()
+    server.server_close()
+
+
+def write_spool(spool_dir, count):
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    lines = [json.dumps({"event": "Hook Executed", "n": i}) for i in range(count)]
+    (spool_dir / SPOOL_FILENAME).write_text("\n".join(lines) + "\n")
+
+
 class TestDbtCheckpointTracking:
     def test_init(self, config_path_str):
         script_args = {"config": config_path_str}
@@ -21,11 +70,11 @@ class TestDbtCheckpointTracking:
         print(script_args)
         tracker = dbtCheckpointTracking(script_args)
 
-        with patch.object(mixpanel.Mixpanel, "track") as mock_track:
+        with patch.object(tracking.SpoolConsumer, "send") as mock_send:
             # set the side_effect to raise an exception
-            mock_track.side_effect = Exception("Test")
+            mock_send.side_effect = Exception("Test")
 
-            # call your function that uses Mixpanel's track function
+            # call your function that records the event
             with pytest.raises(Exception):
                 tracker.track_hook_event("name", {}, {})
 
@@ -76,3 +125,79 @@ class TestDbtCheckpointTracking:
         transformed_properties = dbtCheckpointTracking._remove_ext_in_hook_name({})
 
         assert transformed_properties == {}
+
+
+def test_track_hook_event_spools_event(config_with_tracking_path_str, spool_dir):
+    tracker = dbtCheckpointTracking({"config": config_with_tracking_path_str})
+    with patch("dbt_checkpoint.tracking._flush_in_background") as mock_flush:
+        tracker.track_hook_event(
+            "Hook Executed", {"status": 0}, {"metadata": {"user_id": "abc"}}
+        )
+        mock_flush.assert_called_once_with(spool_dir)
+    (line,) = (spool_dir / SPOOL_FILENAME).read_text().splitlines()
+    event = json.loads(line)
+    assert event["event"] == "Hook Executed"
+    assert event["properties"]["distinct_id"] == "abc"
+    assert event["properties"]["status"] == "Success"
+
+
+def test_flush_in_background_once(spool_dir, monkeypatch):
+    spool_dir.mkdir(parents=True)
+    release = threading.Event()
+    monkeypatch.setattr(tracking, "_flush_thread", None)
+    with patch(
+        "dbt_checkpoint.tracking.flush_events", side_effect=lambda _: release.wait()
+    ) as mock_flush, patch("atexit.register") as mock_register:
+        tracking._flush_in_background(spool_dir)
+        # a flush is still pending, no second thread is started
+        tracking._flush_in_background(spool_dir)
+        release.set()
+        tracking._join_flush_thread()
+    assert mock_flush.call_count == 1
+    mock_register.assert_not_called()
+    assert not tracking._flush_thread.is_alive()
+
+
+def test_flush_events_in_batches(spool_dir, events_endpoint):
+    events_url, batches = events_endpoint
+    write_spool(spool_dir, 120)
+    assert flush_events(spool_dir, events_url=events_url) == 120
+    assert [len(batch) for batch in batches] == [50, 50, 20]
+    assert [event["n"] for batch in batches for event in batch] == list(range(120))
+    assert list(spool_dir.iterdir()) == []
+    assert flush_events(spool_dir, events_url=events_url) == 0
+
+
+def test_flush_events_unreachable_endpoint(spool_dir):
+    write_spool(spool_dir, 3)
+    sent = flush_events(spool_dir, events_url="http://127.0.0.1:9/track", timeout=1)
+    assert sent == 0
+    assert len((spool_dir / SPOOL_FILENAME).read_text().splitlines()) == 3
+
+
+def test_flush_events_abandoned_claim(spool_dir, events_endpoint):
+    events_url, batches = events_endpoint
+    write_spool(spool_dir, 2)
+    claim = spool_dir / "123-456.sending"
+    (spool_dir / SPOOL_FILENAME).rename(claim)
+    assert flush_events(spool_dir, events_url=events_url) == 0
+    old = time.time() - tracking.ABANDONED_CLAIM_AGE - 1
+    os.utime(claim, (old, old))
+    assert flush_events(spool_dir, events_url=events_url) == 2
+
+
+def test_spool_size_cap(spool_dir):
+    consumer = SpoolConsumer(spool_dir)
+    with patch("dbt_checkpoint.tracking.SPOOL_MAX_BYTES", 10):
+        consumer.send("events", '{"event": "first"}')
+        consumer.send("events", '{"event": "second"}')
+        consumer.send("people", '{"ignored": true}')
+    assert (spool_dir / SPOOL_FILENAME).read_text() == '{"event": "first"}\n'
+
+
+def test_flush_is_due(spool_dir):
+    assert not flush_is_due(spool_dir)
+    write_spool(spool_dir, 1)
+    assert flush_is_due(spool_dir)
+    (spool_dir / LAST_FLUSH_FILENAME).touch()
+    assert not flush_is_due(spool_dir)
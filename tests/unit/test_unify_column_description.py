@@ -1,4 +1,7 @@
+from unittest.mock import patch
+
 import pytest
+import yaml
 
 from dbt_checkpoint.unify_column_description import main
 
@@ -527,3 +530,33 @@ models:
     description: test
 """
     )
+
+
+def test_replace_column_description_rewrites_each_file_once(
+    tmpdir, manifest_path_str, capsys
+):
+    schema_yml = """
+version: 2
+models:
+-   name: model_{0}
+    columns:
+    -   name: test1
+        description: {1}
+    -   name: test2
+        description: {1}
+"""
+    yml_files = [tmpdir.join(f"schema{i}.yml") for i in range(3)]
+    for i, yml_file in enumerate(yml_files):
+        yml_file.write(schema_yml.format(i, "test_bad" if i == 2 else "test"))
+    input_args = [str(yml_file) for yml_file in yml_files]
+    input_args.extend(["--is_test", "--manifest", manifest_path_str])
+    with patch(
+        "dbt_checkpoint.unify_column_description.yaml.dump", side_effect=yaml.dump
+    ) as mock_dump:
+        assert main(input_args) == 1
+    mock_dump.assert_called_once()
+    assert "description: test_bad" not in yml_files[2].read_text("utf-8")
+    output = capsys.readouterr().out
+    assert "column `test1` for `test`" in output
+    assert "column `test2` for `test`" in output
+    assert "Unified column descriptions in 1 file(s)." in output
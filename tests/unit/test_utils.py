@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 import pytest
 
+from dbt_checkpoint.file_index import reset_file_indexes
 from dbt_checkpoint.utils import (
     CalledProcessError,
     CompilationException,
@@ -216,6 +217,36 @@ def test_get_missing_file_paths(
     assert set(resulting_files) == set(expected_files)
 
 
+def test_get_missing_file_paths_walks_tree(tmpdir, monkeypatch):
+    manifest = {
+        "nodes": {
+            "model.proj.orders": {
+                "path": "staging/orders.sql",
+                "original_file_path": "models/staging/orders.sql",
+                "patch_path": "proj://models/staging/schema.yml",
+            },
+            "model.proj.big_orders": {
+                "path": "big_orders.sql",
+                "original_file_path": "models/big_orders.sql",
+            },
+        }
+    }
+    for path in [
+        "dbt/models/staging/orders.sql",
+        "dbt/models/staging/schema.yml",
+        "dbt/target/run/models/staging/schema.yml",
+        "dbt/dbt_packages/proj/models/staging/schema.yml",
+    ]:
+        tmpdir.join(path).ensure()
+    monkeypatch.chdir(tmpdir)
+    reset_file_indexes()
+
+    expected = {"dbt/models/staging/orders.sql", "dbt/models/staging/schema.yml"}
+    for path in expected:
+        assert set(get_missing_file_paths([path], manifest)) == expected
+    reset_file_indexes()
+
+
 def test_extend_dbt_cmd_flags_with_project_dir():
     cmd = ["dbt", "run"]
     cmd_flags = ["--target", "dev"]